@@ -87,6 +87,11 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.startup_profile import (
+    STORAGE_KEY as STARTUP_PROFILE_STORAGE_KEY,
+    StartupProfile,
+    async_get_startup_profile,
+)
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -231,6 +236,21 @@ SETUP_ORDER = (
     ("debugger", DEBUGGER_INTEGRATIONS),
 )
 
+# Storage loaded by async_load_base_functionality, it is read
+# in the executor job that initializes the store manager
+BASE_FUNCTIONALITY_STORAGE = [
+    area_registry.STORAGE_KEY,
+    category_registry.STORAGE_KEY,
+    device_registry.STORAGE_KEY,
+    entity_registry.STORAGE_KEY,
+    floor_registry.STORAGE_KEY,
+    issue_registry.STORAGE_KEY,
+    label_registry.STORAGE_KEY,
+    restore_state.STORAGE_KEY,
+    config_entries.STORAGE_KEY,
+    STARTUP_PROFILE_STORAGE_KEY,
+]
+
 #
 # Storage keys we are likely to load during startup
 # in order of when we expect to load them.
@@ -258,6 +278,7 @@ async def async_setup_hass(
     runtime_config: RuntimeConfig,
 ) -> core.HomeAssistant | None:
     """Set up Home Assistant."""
+    setup_started = monotonic()
 
     async def create_hass() -> core.HomeAssistant:
         """Create the hass object and do basic setup."""
@@ -290,6 +311,7 @@ async def async_setup_hass(
                 await hass.async_stop()
 
     hass = await create_hass()
+    async_get_startup_profile(hass).setup_started = setup_started
 
     if runtime_config.skip_pip or runtime_config.skip_pip_packages:
         _LOGGER.warning(
@@ -424,7 +446,11 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     entity.async_setup(hass)
     template.async_setup(hass)
     await asyncio.gather(
-        create_eager_task(get_internal_store_manager(hass).async_initialize()),
+        create_eager_task(
+            get_internal_store_manager(hass).async_initialize(
+                BASE_FUNCTIONALITY_STORAGE
+            )
+        ),
         create_eager_task(area_registry.async_load(hass)),
         create_eager_task(category_registry.async_load(hass)),
         create_eager_task(device_registry.async_load(hass)),
@@ -438,6 +464,13 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
     )
+    startup_profile = async_get_startup_profile(hass)
+    if startup_profile.setup_started is not None:
+        startup_profile.registries_loaded = monotonic() - startup_profile.setup_started
+        _LOGGER.debug(
+            "Registries loaded %.2fs after setup started",
+            startup_profile.registries_loaded,
+        )
 
 
 async def async_from_config_dict(
@@ -781,6 +814,10 @@ async def async_setup_multi_components(
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # Then start the integrations on the longest chain of import and setup
+    # time during the previous startup, as everything depending on them
+    # has to wait for them.
+    critical_path_times = async_get_startup_profile(hass).critical_path_times
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -788,7 +825,12 @@ async def async_setup_multi_components(
             eager_start=True,
         )
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+            domains_not_yet_setup,
+            key=lambda domain: (
+                SETUP_ORDER_SORT_KEY(domain),
+                critical_path_times.get(domain, 0.0),
+            ),
+            reverse=True,
         )
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
@@ -966,6 +1008,40 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_preimport_component(integration: loader.Integration) -> None:
+    """Import a component ahead of its setup."""
+    # Import errors are reported when the component is set up
+    with contextlib.suppress(ImportError):
+        await integration.async_get_component()
+
+
+@core.callback
+def _async_preimport_slow_components(
+    hass: core.HomeAssistant,
+    startup_profile: StartupProfile,
+    domains_to_setup: set[str],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Start importing the components that were slow to import last startup.
+
+    The imports run in the import executor while the integrations
+    they are waiting on are set up, the slowest imports first.
+    """
+    for domain in startup_profile.async_slow_imports(domains_to_setup):
+        if (
+            integration := integration_cache.get(domain)
+        ) is None or not integration.import_executor:
+            continue
+        startup_profile.preimported.append(domain)
+        hass.async_create_background_task(
+            _async_preimport_component(integration),
+            f"preimport {domain}",
+            eager_start=True,
+        )
+    if startup_profile.preimported:
+        _LOGGER.debug("Importing slow components: %s", startup_profile.preimported)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -973,10 +1049,20 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    startup_profile = async_get_startup_profile(hass)
+    load_startup_profile_task = create_eager_task(
+        startup_profile.async_load(), name="load startup profile", loop=hass.loop
+    )
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
 
+    await load_startup_profile_task
+    _async_preimport_slow_components(
+        hass, startup_profile, domains_to_setup, integration_cache
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1068,6 +1154,7 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    startup_profile.async_record()
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
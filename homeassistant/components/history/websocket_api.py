@@ -73,6 +73,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -89,11 +90,54 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
 
 
+def _ws_send_significant_states_chunks(
+    hass: HomeAssistant,
+    sender: websocket_api.ExecutorChunkSender,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> bytes:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk is handed to the loop as a partial event message as soon
+    as it is converted to json and the final result message is returned.
+    Reading stops when the sender stopped.
+    """
+    for states in history.get_significant_states_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+        chunk_size,
+    ):
+        if not states:
+            continue
+        if not sender.send_message(
+            json_bytes(
+                messages.event_message(msg_id, {"states": states, "partial": True})
+            )
+        ):
+            break
+    return json_bytes(messages.result_message(msg_id, {}))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,6 +148,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Exclusive("max_points", "response_size"): vol.All(int, vol.Range(min=2)),
+        vol.Exclusive("chunk_size", "response_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -156,6 +202,29 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunk_size := msg.get("chunk_size"):
+        sender = websocket_api.ExecutorChunkSender(hass, connection, msg["id"])
+        try:
+            result = await get_instance(hass).async_add_executor_job(
+                _ws_send_significant_states_chunks,
+                hass,
+                sender,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                chunk_size,
+            )
+        finally:
+            sender.async_finish()
+        if not sender.cancelled:
+            connection.send_message(result)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -168,6 +237,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -6,11 +6,14 @@ from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import batched
 import logging
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -138,6 +141,32 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    def _events_stmt(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Return the statement to select the events for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def get_events(
         self,
         start_day: dt,
@@ -145,33 +174,35 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
+            stmt = self._events_stmt(session, start_day, end_day)
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def get_events_chunks(
+        self, start_day: dt, end_day: dt, chunk_size: int
+    ) -> Generator[list[dict[str, Any]]]:
+        """Generate the events for a period of time in chunks of chunk_size.
+
+        The rows are converted while they are read from the database
+        so only one chunk of events is kept in memory.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._events_stmt(session, start_day, end_day)
+            for events in batched(
+                _humanify(
+                    self.hass,
+                    execute_stmt_lambda_element(
+                        session, stmt, start_day, end_day, orm_rows=False
+                    ),
+                    self.ent_reg,
+                    self.logbook_run,
+                    self.context_augmenter,
+                ),
+                chunk_size,
+            ):
+                yield list(events)
+
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
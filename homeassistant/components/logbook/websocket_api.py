@@ -452,6 +452,30 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_send_formatted_events_chunks(
+    sender: websocket_api.ExecutorChunkSender,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    chunk_size: int,
+) -> bytes:
+    """Fetch events and send them in chunks from the executor.
+
+    Each chunk is handed to the loop as a partial event message as soon
+    as it is converted to json and the final result message is returned.
+    Reading stops when the sender stopped.
+    """
+    for events in event_processor.get_events_chunks(start_time, end_time, chunk_size):
+        if not sender.send_message(
+            json_bytes(
+                messages.event_message(msg_id, {"events": events, "partial": True})
+            )
+        ):
+            break
+    return json_bytes(messages.result_message(msg_id, []))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -460,6 +484,7 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -511,6 +536,24 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if chunk_size := msg.get("chunk_size"):
+        sender = websocket_api.ExecutorChunkSender(hass, connection, msg["id"])
+        try:
+            result = await get_instance(hass).async_add_executor_job(
+                _ws_send_formatted_events_chunks,
+                sender,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                chunk_size,
+            )
+        finally:
+            sender.async_finish()
+        if not sender.cancelled:
+            connection.send_message(result)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
@@ -115,6 +115,10 @@ MAX_SUBSCRIBES_PER_CALL = 500
 MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
+# Seconds of received messages that are processed before yielding
+# to the event loop, the remaining messages are processed in the next
+# iteration of the event loop.
+MAX_MESSAGE_PROCESSING_TIME = 0.02
 
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
@@ -266,12 +270,86 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """Node of a SubscriptionTrie for a topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Prefix tree of subscription topic filters.
+
+    Resolves all subscriptions matching a topic in O(topic depth) with the
+    same rules as paho's MQTTMatcher: `+` matches a single level, `#` matches
+    the parent level and any number of levels below it, and wildcards in the
+    first level do not match topics starting with `$`.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, raises KeyError if it was not added."""
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Remove the nodes that are no longer used
+        for parent, level in reversed(path):
+            node = parent.children[level]
+            if node.children or node.subscriptions:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards in the first level do not match $SYS and other $ topics
+        first_wildcard_level = 1 if topic[:1] == "$" else 0
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            if idx >= first_wildcard_level and (multi := children.get("#")):
+                matches.extend(multi.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if idx >= first_wildcard_level and (single := children.get("+")):
+                stack.append((single, idx + 1))
+            if (level := levels[idx]) not in ("+", "#") and (
+                child := children.get(level)
+            ):
+                stack.append((child, idx + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,6 +454,7 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscription_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -408,6 +487,10 @@ class MQTT:
             )
         )
         self._socket_buffersize: int | None = None
+        self._reading_socket = False
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._pending_messages_handle: asyncio.Handle | None = None
+        self._read_deferred = False
 
     @callback
     def _async_ha_started(self, _hass: HomeAssistant) -> None:
@@ -438,6 +521,11 @@ class MQTT:
         """Clean up listeners."""
         while self._cleanup_on_unload:
             self._cleanup_on_unload.pop()()
+        if self._pending_messages_handle:
+            self._pending_messages_handle.cancel()
+            self._pending_messages_handle = None
+        self._pending_messages.clear()
+        self._read_deferred = False
 
     @contextlib.asynccontextmanager
     async def _async_connect_in_executor(self) -> AsyncGenerator[None]:
@@ -494,8 +582,25 @@ class MQTT:
 
     @callback
     def _async_reader_callback(self, client: mqtt.Client) -> None:
-        """Handle reading data from the socket."""
-        if (status := client.loop_read(MAX_PACKETS_TO_READ)) != 0:
+        """Handle reading data from the socket.
+
+        The messages read from the socket are queued and processed
+        in batches to keep the event loop responsive during floods
+        of retained messages. While a batch is still queued the socket
+        is not read so the backlog can not grow without bounds; the
+        broker is slowed down by TCP flow control instead.
+        """
+        if self._pending_messages:
+            self._read_deferred = True
+            return
+        self._reading_socket = True
+        try:
+            status = client.loop_read(MAX_PACKETS_TO_READ)
+        finally:
+            self._reading_socket = False
+        if self._pending_messages and self._pending_messages_handle is None:
+            self._async_process_pending_messages()
+        if status != 0:
             self._async_on_disconnect(status)
 
     @callback
@@ -581,6 +686,7 @@ class MQTT:
         # If socket close is called before the connect
         # result is set make sure the first connection result is set
         self._async_connection_result(False)
+        self._read_deferred = False
         if fileno > -1:
             self.loop.remove_reader(sock)
         if self._misc_timer:
@@ -754,6 +860,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscription_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -772,6 +879,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscription_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -834,9 +942,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1035,19 +1142,42 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscription_trie.matches(topic))
         return subscriptions
 
     @callback
     def _async_mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
+        """Queue or process a received message."""
+        if self._reading_socket or self._pending_messages:
+            # Keep the order of the messages behind the queued ones
+            self._pending_messages.append(msg)
+            return
+        self._async_handle_message(msg)
+
+    @callback
+    def _async_process_pending_messages(self) -> None:
+        """Process queued messages until the time budget is used."""
+        self._pending_messages_handle = None
+        pending_messages = self._pending_messages
+        deadline = time.monotonic() + MAX_MESSAGE_PROCESSING_TIME
+        while pending_messages:
+            self._async_handle_message(pending_messages.popleft())
+            if pending_messages and time.monotonic() > deadline:
+                self._pending_messages_handle = self.loop.call_soon(
+                    self._async_process_pending_messages
+                )
+                return
+        if self._read_deferred:
+            # Resume reading the data left in the socket, it may already
+            # be buffered by paho or SSL and not wake up the reader again.
+            self._read_deferred = False
+            self._async_reader_callback(self._mqttc)
+
+    @callback
+    def _async_handle_message(self, msg: mqtt.MQTTMessage) -> None:
+        """Dispatch a received message to the matching subscriptions."""
         try:
             # msg.topic is a property that decodes the topic to a string
             # every time it is accessed. Save the result to avoid
@@ -1072,6 +1202,9 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        # The payload is decoded once per encoding for all subscriptions,
+        # None if it can not be decoded
+        decoded_payloads: dict[str, str | None] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1083,18 +1216,25 @@ class MQTT:
                 self._retained_topics[subscription].add(topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            if (encoding := subscription.encoding) is not None:
+                if encoding in decoded_payloads:
+                    decoded_payload = decoded_payloads[encoding]
+                else:
+                    try:
+                        decoded_payload = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded_payload = None
+                    decoded_payloads[encoding] = decoded_payload
+                if decoded_payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
                         topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.job,
                     )
                     continue
+                payload = decoded_payload
             subscription_topic = subscription.topic
             if subscription_topic not in msg_cache_by_subscription_topic:
                 # Only make one copy of the message
@@ -1233,13 +1373,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
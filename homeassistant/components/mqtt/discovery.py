@@ -73,7 +73,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    hass.data[DATA_MQTT].discovery_already_discovered.discard(discovery_hash)
+    mqtt_data = hass.data[DATA_MQTT]
+    mqtt_data.discovery_already_discovered.discard(discovery_hash)
+    mqtt_data.discovery_received_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -242,6 +244,25 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # Retained discovery messages are replayed on every reconnect, skip
+        # parsing and dispatching a payload identical to the one the already
+        # discovered component was last set up or updated with
+        received_payloads = mqtt_data.discovery_received_payloads
+        if (
+            discovery_hash in mqtt_data.discovery_already_discovered
+            and received_payloads.get(discovery_hash) == payload
+        ):
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -253,12 +274,10 @@ async def async_start(  # noqa: C901
                 return
             if TOPIC_BASE in discovery_payload:
                 _replace_topic_base(discovery_payload)
+            received_payloads[discovery_hash] = payload
         else:
             discovery_payload = MQTTDiscoveryPayload({})
-
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
+            received_payloads.pop(discovery_hash, None)
 
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
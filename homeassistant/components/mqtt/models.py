@@ -412,6 +412,9 @@ class MqttData:
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
+    discovery_received_payloads: dict[tuple[str, str], ReceivePayloadType] = field(
+        default_factory=dict
+    )
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
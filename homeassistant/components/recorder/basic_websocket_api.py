@@ -16,6 +16,7 @@ from .util import get_instance
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the recorder websocket API."""
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_metrics)
 
 
 @websocket_api.websocket_command(
@@ -54,3 +55,25 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/metrics",
+    }
+)
+@callback
+def ws_metrics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the throughput and commit metrics of the recorder."""
+    instance = get_instance(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "backlog": instance.backlog,
+            "commit_interval": instance.commit_interval,
+            "effective_commit_interval": instance.effective_commit_interval,
+            **instance.metrics.as_dict(),
+        },
+    )
@@ -54,6 +54,15 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# The commit interval is widened one step (the configured interval) at a
+# time when the backlog or the commit latency is high, up to this many
+# times the configured interval, and shrunk back when the backlog drains.
+MAX_COMMIT_INTERVAL_MULTIPLIER = 6
+COMMIT_INTERVAL_WIDEN_BACKLOG = 1000
+COMMIT_INTERVAL_SHRINK_BACKLOG = 100
+# Widen when a commit takes longer than this fraction of the interval
+COMMIT_INTERVAL_WIDEN_LATENCY_RATIO = 0.25
+
 STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
@@ -16,7 +16,15 @@ import time
 from typing import TYPE_CHECKING, Any, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    inspect,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -51,12 +59,16 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    COMMIT_INTERVAL_SHRINK_BACKLOG,
+    COMMIT_INTERVAL_WIDEN_BACKLOG,
+    COMMIT_INTERVAL_WIDEN_LATENCY_RATIO,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
+    MAX_COMMIT_INTERVAL_MULTIPLIER,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
@@ -79,6 +91,7 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .metrics import RecorderMetrics
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -187,6 +200,11 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        # The number of commit_interval ticks between commits, adjusted
+        # by the recorder thread based on the backlog and commit latency.
+        self.commit_interval_multiplier = 1
+        self._commit_ticks = 0
+        self.metrics = RecorderMetrics()
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -213,6 +231,10 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._event_session_pending_rows = 0
+        # Events are not added to the session, they are written
+        # with a single executemany when the session is committed.
+        self._pending_events: list[Events] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -350,14 +372,23 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self.queue_task(KEEP_ALIVE_TASK)
 
+    @property
+    def effective_commit_interval(self) -> int:
+        """Return the commit interval after adapting to the load."""
+        return self.commit_interval * self.commit_interval_multiplier
+
     @callback
     def _async_commit(self, now: datetime) -> None:
         """Queue a commit."""
+        self._commit_ticks += 1
+        if self._commit_ticks < self.commit_interval_multiplier:
+            return
         if (
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
         ):
+            self._commit_ticks = 0
             self.queue_task(COMMIT_TASK)
 
     @callback
@@ -703,8 +734,15 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
+        self._event_session_pending_rows += 1
         session.add(obj)
 
+    def _add_pending_event(self, dbevent: Events) -> None:
+        """Add an event to be bulk inserted on the next commit."""
+        self._event_session_has_pending_writes = True
+        self._event_session_pending_rows += 1
+        self._pending_events.append(dbevent)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -1039,6 +1077,7 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
+        self.metrics.events_processed += 1
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
@@ -1066,7 +1105,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1091,7 +1130,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1213,6 +1252,7 @@ class Recorder(threading.Thread):
                     raise
 
                 tries += 1
+                self._restore_pending_event_relations()
                 time.sleep(self.db_retry_wait)
             else:
                 return
@@ -1221,6 +1261,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.monotonic()
 
         if (
             pending_last_reported
@@ -1237,9 +1278,16 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self._pending_events:
+            self._bulk_insert_pending_events(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self._pending_events.clear()
+        end = time.monotonic()
+        self.metrics.record_commit(end, end - start, self._event_session_pending_rows)
+        self._event_session_pending_rows = 0
+        self._adjust_commit_interval(end - start)
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1257,6 +1305,85 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _adjust_commit_interval(self, commit_duration: float) -> None:
+        """Widen or shrink the commit interval based on the load.
+
+        Committing less often under load means more rows per commit
+        and less time spent in the database per row.
+        """
+        if not self.commit_interval:
+            return
+        backlog = self.backlog
+        multiplier = self.commit_interval_multiplier
+        if (
+            backlog >= COMMIT_INTERVAL_WIDEN_BACKLOG
+            or commit_duration
+            >= self.effective_commit_interval * COMMIT_INTERVAL_WIDEN_LATENCY_RATIO
+        ):
+            multiplier = min(multiplier + 1, MAX_COMMIT_INTERVAL_MULTIPLIER)
+        elif backlog < COMMIT_INTERVAL_SHRINK_BACKLOG:
+            multiplier = max(multiplier - 1, 1)
+        if multiplier != self.commit_interval_multiplier:
+            _LOGGER.debug(
+                "Adjusting the commit interval to %s seconds (backlog: %s, "
+                "last commit: %.3f seconds)",
+                self.commit_interval * multiplier,
+                backlog,
+                commit_duration,
+            )
+            self.commit_interval_multiplier = multiplier
+
+    def _bulk_insert_pending_events(self, session: Session) -> None:
+        """Insert the pending events with a single executemany.
+
+        The events bypass the unit of work and the identity map since
+        they are never read back by the recorder after they are written.
+        """
+        # Flush first so the pending event types and event data
+        # have been assigned their ids.
+        session.flush()
+        mapper = inspect(type(self._pending_events[0]))
+        keys = [
+            column_attr.key
+            for column_attr in mapper.column_attrs
+            if not column_attr.columns[0].primary_key
+        ]
+        rows: list[dict[str, Any]] = []
+        for dbevent in self._pending_events:
+            # Read the loaded values directly to avoid the overhead
+            # of the instrumented attributes.
+            values = dbevent.__dict__
+            if (event_type_rel := values.get("event_type_rel")) is not None:
+                dbevent.event_type_id = event_type_rel.event_type_id
+            if (event_data_rel := values.get("event_data_rel")) is not None:
+                dbevent.data_id = event_data_rel.data_id
+            rows.append({key: values.get(key) for key in keys})
+        session.execute(insert(mapper), rows)
+
+    def _restore_pending_event_relations(self) -> None:
+        """Restore the event types and event data of the pending events.
+
+        A rollback expunges the event types and event data that were
+        flushed for the pending events and the ids they were assigned
+        are no longer valid. They are added back to the session so they
+        are inserted again and the ids of the events are resolved again
+        on the next commit.
+        """
+        session = self.event_session
+        assert session is not None
+        for dbevent in self._pending_events:
+            values = dbevent.__dict__
+            if (event_type_rel := values.get("event_type_rel")) is not None:
+                dbevent.event_type_id = None
+                if event_type_rel not in session:
+                    event_type_rel.event_type_id = None
+                    session.add(event_type_rel)
+            if (event_data_rel := values.get("event_data_rel")) is not None:
+                dbevent.data_id = None
+                if event_data_rel not in session:
+                    event_data_rel.data_id = None
+                    session.add(event_data_rel)
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1271,6 +1398,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_events.clear()
+        self._event_session_pending_rows = 0
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Generator
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -16,6 +18,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_chunks as _modern_get_significant_states_chunks,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +30,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_chunks",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -91,16 +95,19 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return a dict of significant states during a time period."""
+    _target: Callable[..., dict[str, list[State | dict[str, Any]]]]
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
+        # Downsampling is not supported until the states are migrated
         _target = _legacy_get_significant_states
     else:
-        _target = _modern_get_significant_states
+        _target = partial(_modern_get_significant_states, max_points=max_points)
     return _target(
         hass,
         start_time,
@@ -127,16 +134,21 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return a dict of significant states during a time period."""
+    _target: Callable[..., dict[str, list[State | dict[str, Any]]]]
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states_with_session as _legacy_get_significant_states_with_session,
         )
 
+        # Downsampling is not supported until the states are migrated
         _target = _legacy_get_significant_states_with_session
     else:
-        _target = _modern_get_significant_states_with_session
+        _target = partial(
+            _modern_get_significant_states_with_session, max_points=max_points
+        )
     return _target(
         hass,
         session,
@@ -152,6 +164,48 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    chunk_size: int,
+) -> Generator[dict[str, list[State | dict[str, Any]]]]:
+    """Generate the significant states during a time period in chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # Chunking is not supported until the states are migrated
+        yield get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+        return
+    yield from _modern_get_significant_states_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        chunk_size,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import batched, groupby
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -117,6 +118,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -132,6 +134,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -201,34 +204,22 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_query(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> dict[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
-
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], bool] | None:
+    """Return the statement to select the significant states.
 
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    Returns the statement, the metadata_ids of the entity_ids and
+    if the start time state is included, or None if none of the
+    entity_ids have states.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
-    if not entity_ids:
-        raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +228,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,17 +266,138 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    return stmt, entity_id_to_metadata_id, include_start_time_state
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    max_points: int | None = None,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+
+    max_points is an optional limit of the number of numeric states
+    returned for each entity, see _downsample_rows.
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, include_start_time_state = query
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    if not max_points:
+        return _sorted_states_to_dict(
+            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+            start_time_ts if include_start_time_state else None,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes=no_attributes,
+        )
+    # Pass the time window to stream the rows from the database
+    # with yield_per for long windows since most of them will be
+    # dropped by the downsampling.
     return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        execute_stmt_lambda_element(
+            session, stmt, start_time, end_time, orm_rows=False
+        ),
         start_time_ts if include_start_time_state else None,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        max_points=max_points,
+        window=(start_time_ts, end_time_ts or dt_util.utcnow().timestamp()),
     )
 
 
+def get_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    chunk_size: int,
+) -> Generator[dict[str, list[State | dict[str, Any]]]]:
+    """Generate the significant states in chunks of at most chunk_size states.
+
+    The rows are converted chunk by chunk while they are read from
+    the database so memory use does not depend on the time window.
+    The states of an entity may be split over several chunks. With
+    minimal_response, the first state of an entity in each chunk
+    is a full state.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, include_start_time_state = query
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        for rows in batched(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            chunk_size,
+        ):
+            yield _sorted_states_to_dict(
+                rows,
+                start_time_ts if include_start_time_state else None,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes=no_attributes,
+            )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -680,6 +792,8 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    max_points: int | None = None,
+    window: tuple[float, float] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -691,6 +805,9 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    If max_points and the window of the query are passed, the states
+    of each entity are downsampled while they are converted.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -731,6 +848,10 @@ def _sorted_states_to_dict(
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
+        if max_points and window:
+            group = _downsample_rows(
+                group, state_idx, last_updated_ts_idx, window, max_points
+            )
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
@@ -816,3 +937,66 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _downsample_rows(
+    rows: Iterator[Row],
+    state_idx: int,
+    last_updated_ts_idx: int,
+    window: tuple[float, float],
+    max_points: int,
+) -> Iterator[Row]:
+    """Downsample the rows of one entity with min/max bucketing.
+
+    The window is split into max_points // 2 buckets and only the rows
+    with the lowest and the highest numeric state of each bucket are
+    kept, in the order they were recorded. Rows with a non numeric
+    state are always kept since they mark gaps or state transitions.
+
+    Rows are consumed one at a time so only the current bucket is
+    held in memory.
+    """
+    start_ts, end_ts = window
+    if (bucket_size := (end_ts - start_ts) / max(max_points // 2, 1)) <= 0:
+        yield from rows
+        return
+    bucket: float | None = None
+    min_row: Row | None = None
+    max_row: Row | None = None
+    min_value = max_value = 0.0
+    value: float | None
+    for row in rows:
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            value = None
+        row_bucket = (row[last_updated_ts_idx] - start_ts) // bucket_size
+        if value is None or row_bucket != bucket:
+            if min_row is not None and max_row is not None:
+                yield from _bucket_rows(min_row, max_row, last_updated_ts_idx)
+            if value is None:
+                bucket = min_row = max_row = None
+                yield row
+                continue
+            bucket = row_bucket
+            min_row = max_row = row
+            min_value = max_value = value
+        elif value < min_value:
+            min_row = row
+            min_value = value
+        elif value > max_value:
+            max_row = row
+            max_value = value
+    if min_row is not None and max_row is not None:
+        yield from _bucket_rows(min_row, max_row, last_updated_ts_idx)
+
+
+def _bucket_rows(
+    min_row: Row, max_row: Row, last_updated_ts_idx: int
+) -> tuple[Row, ...]:
+    """Return the rows kept for a bucket in the order they were recorded."""
+    if min_row is max_row:
+        return (min_row,)
+    if min_row[last_updated_ts_idx] <= max_row[last_updated_ts_idx]:
+        return (min_row, max_row)
+    return (max_row, min_row)
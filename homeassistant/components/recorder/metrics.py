@@ -0,0 +1,84 @@
+"""Recorder throughput and commit metrics."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds in seconds of the commit duration histogram buckets,
+# the last bucket counts everything slower than the last bound.
+COMMIT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RecorderMetrics:
+    """Track the recorder throughput and commit performance.
+
+    The metrics are only written from the recorder thread and
+    are read from the event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.events_processed = 0
+        self.events_per_second = 0.0
+        self.commits = 0
+        self.rows_committed = 0
+        self.last_commit_rows = 0
+        self.last_commit_duration = 0.0
+        self.commit_duration_histogram = [0] * (len(COMMIT_DURATION_BUCKETS) + 1)
+        self.statistics_compiles = 0
+        self.last_statistics_compile_duration = 0.0
+        self._last_commit_time: float | None = None
+        self._events_processed_at_last_commit = 0
+
+    def record_commit(self, commit_time: float, duration: float, rows: int) -> None:
+        """Record a commit that finished at commit_time (monotonic)."""
+        self.commits += 1
+        self.rows_committed += rows
+        self.last_commit_rows = rows
+        self.last_commit_duration = duration
+        self.commit_duration_histogram[
+            bisect_left(COMMIT_DURATION_BUCKETS, duration)
+        ] += 1
+        events_processed = self.events_processed
+        if (last_commit_time := self._last_commit_time) is not None and (
+            elapsed := commit_time - last_commit_time
+        ) > 0:
+            self.events_per_second = (
+                events_processed - self._events_processed_at_last_commit
+            ) / elapsed
+        self._last_commit_time = commit_time
+        self._events_processed_at_last_commit = events_processed
+
+    def record_statistics_compile(self, duration: float) -> None:
+        """Record the time it took to compile short term statistics."""
+        self.statistics_compiles += 1
+        self.last_statistics_compile_duration = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        commits = self.commits
+        return {
+            "events_processed": self.events_processed,
+            "events_per_second": round(self.events_per_second, 2),
+            "commits": commits,
+            "rows_committed": self.rows_committed,
+            "rows_per_commit": round(self.rows_committed / commits, 2)
+            if commits
+            else 0.0,
+            "last_commit_rows": self.last_commit_rows,
+            "last_commit_duration": self.last_commit_duration,
+            "statistics_compiles": self.statistics_compiles,
+            "last_statistics_compile_duration": self.last_statistics_compile_duration,
+            "commit_duration_histogram": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(
+                        COMMIT_DURATION_BUCKETS,
+                        self.commit_duration_histogram,
+                        strict=False,
+                    )
+                },
+                "+Inf": self.commit_duration_histogram[-1],
+            },
+        }
@@ -11,9 +11,10 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, func, insert, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -165,6 +166,14 @@ def mean(values: list[float]) -> float | None:
 _LOGGER = logging.getLogger(__name__)
 
 
+SHORT_TERM_PERIODS_PER_HOUR = int(Statistics.duration / StatisticsShortTerm.duration)
+
+# mean, min, max, last_reset_ts, state, sum of a short term statistics row
+type ShortTermStatisticsRow = tuple[
+    float | None, float | None, float | None, float | None, float | None, float | None
+]
+
+
 @dataclasses.dataclass(slots=True)
 class ShortTermStatisticsRunCache:
     """Cache for short term statistics runs."""
@@ -191,6 +200,67 @@ class ShortTermStatisticsRunCache:
         """Cache the latest id for the each metadata_id."""
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
+    # This is a mapping of hour start_ts:period start_ts:metadata_id:row of the
+    # short term statistics compiled by this run for the current hour, used to
+    # summarize the hour without reading the short term statistics back
+    _short_term_rows_by_hour: dict[
+        float, dict[float, dict[int, ShortTermStatisticsRow]]
+    ] = dataclasses.field(default_factory=dict)
+
+    def add_short_term_statistics(
+        self, start_ts: float, rows: dict[int, ShortTermStatisticsRow]
+    ) -> None:
+        """Remember the short term statistics compiled for the period at start_ts.
+
+        Adding the same period again replaces the rows, which makes it safe to
+        add a period again when compiling it is retried.
+        """
+        hour_start_ts = start_ts - start_ts % 3600
+        periods = self._short_term_rows_by_hour.setdefault(hour_start_ts, {})
+        periods[start_ts] = rows
+        for old_hour_start_ts in [
+            ts for ts in self._short_term_rows_by_hour if ts < hour_start_ts
+        ]:
+            del self._short_term_rows_by_hour[old_hour_start_ts]
+
+    def get_hourly_summary(
+        self, hour_start_ts: float
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly summary for the hour starting at hour_start_ts.
+
+        Returns None unless all short term statistics of the hour were
+        compiled by this run, in which case the summary has to be
+        computed from the database.
+        """
+        periods = self._short_term_rows_by_hour.get(hour_start_ts)
+        if periods is None or len(periods) != SHORT_TERM_PERIODS_PER_HOUR:
+            return None
+        rows_by_metadata_id: dict[int, list[ShortTermStatisticsRow]] = {}
+        for start_ts in sorted(periods):
+            for metadata_id, row in periods[start_ts].items():
+                rows_by_metadata_id.setdefault(metadata_id, []).append(row)
+        summary: dict[int, StatisticDataTimestamp] = {}
+        for metadata_id in sorted(rows_by_metadata_id):
+            rows = rows_by_metadata_id[metadata_id]
+            means, mins, maxes, last_resets, states, sums = zip(*rows, strict=True)
+            means = [value for value in means if value is not None]
+            mins = [value for value in mins if value is not None]
+            maxes = [value for value in maxes if value is not None]
+            summary[metadata_id] = {
+                "start_ts": hour_start_ts,
+                "mean": mean(means) if means else None,
+                "min": min(mins) if mins else None,
+                "max": max(maxes) if maxes else None,
+                "last_reset_ts": last_resets[-1],
+                "state": states[-1],
+                "sum": sums[-1],
+            }
+        return summary
+
+    def invalidate_short_term_statistics(self) -> None:
+        """Forget the short term statistics after they were changed elsewhere."""
+        self._short_term_rows_by_hour.clear()
+
 
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
@@ -388,17 +458,36 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session, start: datetime, run_cache: ShortTermStatisticsRunCache
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If all 5-minute statistics of the hour were compiled by this run,
+    the summary is computed from the run cache instead of the database.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
-    end_time = start_time + Statistics.duration
-    end_time_ts = end_time.timestamp()
+
+    if (summary := run_cache.get_hourly_summary(start_time_ts)) is None:
+        summary = _compile_hourly_statistics_summary(session, start_time_ts)
+
+    # Insert compiled hourly statistics in the database
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _compile_hourly_statistics_summary(
+    session: Session, start_time_ts: float
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize one hour of 5-minute statistics from the database."""
+    end_time_ts = start_time_ts + Statistics.duration.total_seconds()
 
     # Compute last hour's average, min, max
     summary: dict[int, StatisticDataTimestamp] = {}
@@ -438,11 +527,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -497,6 +582,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # filter_unique_constraint_integrity_error which would make
     # modified_statistic_ids unbound.
     modified_statistic_ids: set[str] | None = None
+    compile_start = time.monotonic()
 
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
@@ -509,6 +595,8 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    instance.metrics.record_statistics_compile(time.monotonic() - compile_start)
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -556,21 +644,22 @@ def _compile_statistics(
             )
         ):
             continue
+        platform_start = time.monotonic()
         compiled: PlatformCompiledStatistics = platform_compile_statistics(
             instance.hass, session, start, end
         )
         _LOGGER.debug(
-            "Statistics for %s during %s-%s: %s",
+            "Statistics for %s during %s-%s compiled in %.3fs: %s",
             domain,
             start,
             end,
+            time.monotonic() - platform_start,
             compiled.platform_stats,
         )
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
-    new_short_term_stats: list[StatisticsBase] = []
-    updated_metadata_ids: set[int] = set()
+    new_short_term_stats: list[dict[str, Any]] = []
     # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
@@ -578,18 +667,40 @@ def _compile_statistics(
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
-        updated_metadata_ids.add(metadata_id)
-        if new_stat := _insert_statistics(
-            session,
-            StatisticsShortTerm,
-            metadata_id,
-            stats["stat"],
-        ):
-            new_short_term_stats.append(new_stat)
+        try:
+            new_short_term_stats.append(
+                _short_term_statistics_row(metadata_id, stats["stat"])
+            )
+        except (AttributeError, TypeError, ValueError):
+            _LOGGER.exception(
+                "Unexpected exception when inserting statistics %s:%s ",
+                metadata_id,
+                stats["stat"],
+            )
+
+    start_ts = start.timestamp()
+    if new_short_term_stats:
+        _bulk_insert_short_term_statistics(session, new_short_term_stats)
+
+    run_cache = get_short_term_statistics_run_cache(instance.hass)
+    run_cache.add_short_term_statistics(
+        start_ts,
+        {
+            new_stat["metadata_id"]: (
+                new_stat["mean"],
+                new_stat["min"],
+                new_stat["max"],
+                new_stat["last_reset_ts"],
+                new_stat["state"],
+                new_stat["sum"],
+            )
+            for new_stat in new_short_term_stats
+        },
+    )
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, run_cache)
 
     session.add(StatisticsRuns(start=start))
 
@@ -598,19 +709,23 @@ def _compile_statistics(
         if start.minute == 55:
             instance.hass.bus.fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
 
-    if updated_metadata_ids:
+    if new_short_term_stats:
         # These are always the newest statistics, so we can update
         # the run cache without having to check the start_ts.
-        session.flush()  # populate the ids of the new StatisticsShortTerm rows
-        run_cache = get_short_term_statistics_run_cache(instance.hass)
+        # The bulk insert does not return the ids of the new rows
+        # since MySQL does not support RETURNING, read them back.
         # metadata_id is typed to allow None, but we know it's not None here
         # so we can safely cast it to int.
         run_cache.set_latest_ids_for_metadata_ids(
             cast(
                 dict[int, int],
                 {
-                    new_stat.metadata_id: new_stat.id
-                    for new_stat in new_short_term_stats
+                    metadata_id: short_term_id
+                    for metadata_id, short_term_id in session.execute(
+                        select(
+                            StatisticsShortTerm.metadata_id, StatisticsShortTerm.id
+                        ).where(StatisticsShortTerm.start_ts == start_ts)
+                    )
                 },
             )
         )
@@ -643,6 +758,37 @@ def _adjust_sum_statistics(
         )
 
 
+def _short_term_statistics_row(
+    metadata_id: int, statistic: StatisticData
+) -> dict[str, Any]:
+    """Return the values of a new short term statistics row."""
+    return {
+        "metadata_id": metadata_id,
+        "created": None,
+        "created_ts": time.time(),
+        "start": None,
+        "start_ts": dt_util.utc_to_timestamp(statistic["start"]),
+        "mean": statistic.get("mean"),
+        "min": statistic.get("min"),
+        "max": statistic.get("max"),
+        "last_reset": None,
+        "last_reset_ts": datetime_to_timestamp_or_none(statistic.get("last_reset")),
+        "state": statistic.get("state"),
+        "sum": statistic.get("sum"),
+    }
+
+
+def _bulk_insert_short_term_statistics(
+    session: Session, rows: list[dict[str, Any]]
+) -> None:
+    """Insert short term statistics rows with a single executemany.
+
+    The rows bypass the unit of work and the identity map since the
+    compiled statistics are kept in the run cache instead.
+    """
+    session.execute(insert(StatisticsShortTerm), rows)
+
+
 def _insert_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -736,6 +882,9 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_short_term_statistics_run_cache(
+        instance.hass
+    ).invalidate_short_term_statistics()
 
 
 def update_statistics_metadata(
@@ -2366,7 +2515,9 @@ def _import_statistics_with_session(
 
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
+    # and can no longer summarize the hour from the run cache
     run_cache = get_short_term_statistics_run_cache(instance.hass)
+    run_cache.invalidate_short_term_statistics()
     cache_latest_short_term_statistic_id_for_metadata_id(
         run_cache, session, metadata_id
     )
@@ -2475,6 +2626,9 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        get_short_term_statistics_run_cache(
+            instance.hass
+        ).invalidate_short_term_statistics()
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2554,6 +2708,9 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        get_short_term_statistics_run_cache(
+            instance.hass
+        ).invalidate_short_term_statistics()
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -103,32 +103,36 @@ def _time_weighted_average(
     Note: there's no interpolation of values between state changes.
     """
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_time_ts: float | None = None
     accumulated = 0.0
+    # Work on timestamps since float math is much cheaper than
+    # datetime math and this runs for every state of every sensor.
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
 
     for fstate, state in fstates:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
+        start_time_ts = max(state.last_updated_timestamp, start_ts)
+        if old_start_time_ts is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = start_time_ts
         else:
-            duration = start_time - old_start_time
+            duration = start_time_ts - old_start_time_ts
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * duration
 
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_time_ts = start_time_ts
 
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        assert old_start_time_ts is not None
+        duration = end_ts - old_start_time_ts
+        accumulated += old_fstate * duration
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
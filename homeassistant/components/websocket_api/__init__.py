@@ -10,7 +10,11 @@ from homeassistant.helpers.typing import ConfigType, VolSchemaType
 from homeassistant.loader import bind_hass
 
 from . import commands, connection, const, decorators, http, messages  # noqa: F401
-from .connection import ActiveConnection, current_connection  # noqa: F401
+from .connection import (  # noqa: F401
+    ActiveConnection,
+    ExecutorChunkSender,
+    current_connection,
+)
 from .const import (  # noqa: F401
     ERR_HOME_ASSISTANT_ERROR,
     ERR_INVALID_FORMAT,
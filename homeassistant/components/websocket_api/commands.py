@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -39,6 +41,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_track_state_change_event,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -48,7 +51,9 @@ from homeassistant.helpers.json import (
     json_bytes,
     json_fragment,
 )
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.startup_profile import async_get_startup_profile
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -84,6 +89,8 @@ def async_register_commands(
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_polling_stats)
+    async_reg(hass, handle_startup_profile)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
@@ -363,28 +370,125 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+class _EntityChangesForwarder:
+    """Forward entity state changed events of a subscription to websocket.
+
+    If merge is set, changes of the same entity within the coalescing
+    window are merged into a single state diff message. Otherwise every
+    change is sent right away.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_send_message",
+        "_user",
+        "_message_id_as_bytes",
+        "_merge",
+        "_pending",
+        "_flush_handle",
+        "_unsub",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+        merge: bool,
+    ) -> None:
+        """Initialize the forwarder."""
+        self._hass = hass
+        self._send_message = send_message
+        self._user = user
+        self._message_id_as_bytes = message_id_as_bytes
+        self._merge = merge
+        # entity_id -> (old state before the window, last event in the window)
+        self._pending: dict[str, tuple[State | None, Event[EventStateChangedData]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(self, entity_ids: set[str]) -> CALLBACK_TYPE:
+        """Subscribe to changes of entity_ids, or all entities if empty."""
+        if entity_ids:
+            # Keyed dispatch, only changes of the entities reach the forwarder
+            self._unsub = async_track_state_change_event(
+                self._hass, entity_ids, self._async_forward
+            )
+        else:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward
+            )
+        return self._async_unsubscribe
+
+    @callback
+    def _async_unsubscribe(self) -> None:
+        """Unsubscribe and drop pending changes."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Queue an entity state changed event."""
+        entity_id = event.data["entity_id"]
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        user = self._user
+        permissions = user.permissions
+        if (
+            not user.is_admin
+            and not permissions.access_all_entities(POLICY_READ)
+            and not permissions.check_entity(entity_id, POLICY_READ)
+        ):
+            return
+        if not self._merge:
+            self._send_message(
+                messages.cached_state_diff_message(self._message_id_as_bytes, event)
+            )
+            return
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (event.data["old_state"], event)
+        else:
+            self._pending[entity_id] = (pending[0], event)
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(
+                const.ENTITY_CHANGES_COALESCE_WINDOW, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the state diff of each entity that changed in the window."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        send_message = self._send_message
+        message_id_as_bytes = self._message_id_as_bytes
+        for entity_id, (old_state, event) in pending.items():
+            new_state = event.data["new_state"]
+            if event.data["old_state"] is not old_state:
+                if old_state is None and new_state is None:
+                    # Added and removed within the window
+                    continue
+                # Merge the changes into a single diff from the state the
+                # client knows about to the latest state
+                event = Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                    event.origin,
+                    event.time_fired_timestamp,
+                    event.context,
+                )
+            send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
 @callback
@@ -404,16 +508,13 @@ def handle_subscribe_entities(
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    connection.subscriptions[msg["id"]] = _EntityChangesForwarder(
+        hass,
+        connection.send_message,
+        connection.user,
+        message_id_as_bytes,
+        const.FEATURE_MERGE_ENTITY_CHANGES in connection.supported_features,
+    ).async_subscribe(entity_ids)
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -547,6 +648,38 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "startup_profile"})
+def handle_startup_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup profile command."""
+    startup_profile = async_get_startup_profile(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "timeline": [
+                {"domain": domain, **profile}
+                for domain, profile in sorted(
+                    startup_profile.current.items(),
+                    key=lambda item: item[1]["start"],
+                )
+            ],
+            "preimported": startup_profile.preimported,
+            "registries_loaded": startup_profile.registries_loaded,
+        },
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "polling_stats"})
+def handle_polling_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle polling stats command."""
+    connection.send_result(msg["id"], async_get_polling_scheduler(hass).async_stats())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from concurrent.futures import CancelledError
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -42,9 +44,11 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_compress",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_wait_for_pending_messages",
     )
 
     def __init__(
@@ -54,6 +58,8 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_for_pending_messages: Callable[[int], Coroutine[Any, Any, None]]
+        | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -64,11 +70,13 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_compress = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_for_pending_messages = wait_for_pending_messages
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -79,6 +87,15 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_compress = const.FEATURE_COMPRESS_MESSAGES in features
+
+    async def async_wait_for_pending_messages(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are pending to be written.
+
+        Returns right away if the messages are not queued.
+        """
+        if self._wait_for_pending_messages is not None:
+            await self._wait_for_pending_messages(max_pending)
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -305,3 +322,61 @@ class ActiveConnection:
         err_message += " " + self.get_description(current_request.get())
 
         log_handler("Error handling message: %s", err_message)
+
+
+class ExecutorChunkSender:
+    """Send the chunks of a response that is read in the executor.
+
+    The chunks are handed to the event loop without waiting for them to
+    be queued, but after every MAX_PENDING_CHUNKS chunks the executor
+    waits until the client caught up, so a slow client bounds how far
+    the executor reads ahead. Sending stops when the connection closes
+    or the subscription of the response is cancelled.
+    """
+
+    __slots__ = ("_connection", "_loop", "_msg_id", "_sent", "cancelled")
+
+    def __init__(
+        self, hass: HomeAssistant, connection: ActiveConnection, msg_id: int
+    ) -> None:
+        """Initialize the sender and subscribe to the cancellation."""
+        self._loop = hass.loop
+        self._connection = connection
+        self._msg_id = msg_id
+        self._sent = 0
+        self.cancelled = False
+        connection.subscriptions[msg_id] = self.async_cancel
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop sending the chunks."""
+        self.cancelled = True
+
+    @callback
+    def async_finish(self) -> None:
+        """Remove the subscription once the response is complete."""
+        self._connection.subscriptions.pop(self._msg_id, None)
+
+    async def _async_send_and_wait(self, message: bytes) -> None:
+        """Send a chunk and wait until the client caught up."""
+        self._connection.send_message(message)
+        await self._connection.async_wait_for_pending_messages(const.MAX_PENDING_CHUNKS)
+
+    def send_message(self, message: bytes) -> bool:
+        """Send a chunk from the executor.
+
+        Returns False once sending stopped.
+        """
+        if self.cancelled:
+            return False
+        self._sent += 1
+        if self._sent % const.MAX_PENDING_CHUNKS:
+            self._loop.call_soon_threadsafe(self._connection.send_message, message)
+            return True
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._async_send_and_wait(message), self._loop
+            ).result()
+        except CancelledError:
+            return False
+        return not self.cancelled
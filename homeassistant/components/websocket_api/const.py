@@ -34,6 +34,16 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Chunks of a response that is read in the executor are handed to the
+# event loop in groups of this many. Before each group the executor
+# waits until at most this many messages are pending to be written.
+MAX_PENDING_CHUNKS: Final = 4
+
+# Seconds changes of the same entity are merged into a single state diff
+# message for a subscribe_entities subscription, if the client supports
+# FEATURE_MERGE_ENTITY_CHANGES.
+ENTITY_CHANGES_COALESCE_WINDOW: Final = 0.05
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +68,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_MERGE_ENTITY_CHANGES = "merge_entity_changes"
+# Messages are sent as binary frames of a single raw deflate stream
+# that is flushed after every frame (zlib Z_SYNC_FLUSH).
+FEATURE_COMPRESS_MESSAGES = "compress_messages"
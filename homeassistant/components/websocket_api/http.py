@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -63,6 +64,20 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+def _deflate_stream() -> Callable[[bytes], bytes]:
+    """Return a function compressing messages into a single raw deflate stream.
+
+    The compression context is kept between messages, so repeated keys
+    and values compress across messages.
+    """
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+    def _compress(message: bytes) -> bytes:
+        return compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    return _compress
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -79,8 +94,12 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_message_count",
+        "_compress",
+        "_compress_switches",
         "_ready_future",
         "_release_ready_queue_size",
+        "_written_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -102,8 +121,15 @@ class WebSocketHandler:
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
         self._message_queue: deque[bytes] = deque()
+        # How many messages have been queued, compression is switched on
+        # or off from the message with the number in _compress_switches
+        self._message_count = 0
+        self._compress = False
+        self._compress_switches: deque[tuple[int, bool]] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Resolved when a message was written or the connection closes
+        self._written_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -124,7 +150,9 @@ class WebSocketHandler:
         return "finished connection"
 
     async def _writer(
-        self, send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]]
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -135,6 +163,9 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = self._connection and self._connection.can_coalesce
+        compress_switches = self._compress_switches
+        compress: Callable[[bytes], bytes] | None = None
+        written_count = 0
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -150,18 +181,40 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = self._connection and self._connection.can_coalesce
 
+                while compress_switches and compress_switches[0][0] == written_count:
+                    # Every switch starts a new deflate stream
+                    compress = (
+                        _deflate_stream() if compress_switches.popleft()[1] else None
+                    )
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
+                    written_count += 1
+                elif compress_switches and (
+                    count := compress_switches[0][0] - written_count
+                ) < len(message_queue):
+                    # Never coalesce messages from both sides of a switch
+                    message = b"".join(
+                        (
+                            b"[",
+                            b",".join([message_queue.popleft() for _ in range(count)]),
+                            b"]",
+                        )
+                    )
+                    written_count += count
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    written_count += len(message_queue)
+                    message_queue.clear()
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                if compress is None:
+                    await send_bytes_text(message)
+                else:
+                    await send_bytes_binary(compress(message))
+                if self._written_future is not None:
+                    self._release_written_future()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -172,6 +225,24 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    @callback
+    def _release_written_future(self) -> None:
+        """Wake up the tasks that wait for messages to be written."""
+        if (written_future := self._written_future) is not None:
+            self._written_future = None
+            if not written_future.done():
+                written_future.set_result(None)
+
+    async def _async_wait_for_pending_messages(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are pending to be written.
+
+        Returns when the connection closes.
+        """
+        while not self._closing and len(self._message_queue) > max_pending:
+            if (written_future := self._written_future) is None:
+                written_future = self._written_future = self._loop.create_future()
+            await written_future
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -198,8 +269,16 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        connection = self._connection
+        if connection is not None and connection.can_compress is not self._compress:
+            # Compression is switched for the messages queued from now on,
+            # whenever they are written
+            self._compress = connection.can_compress
+            self._compress_switches.append((self._message_count, self._compress))
+
         message_queue = self._message_queue
         message_queue.append(message)
+        self._message_count += 1
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -283,6 +362,7 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._release_written_future()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -322,8 +402,15 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_for_pending_messages,
         )
         connection = None
         disconnect_warn = None
@@ -360,7 +447,9 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
-            self._writer_task = create_eager_task(self._writer(send_bytes_text))
+            self._writer_task = create_eager_task(
+                self._writer(send_bytes_text, send_bytes_binary)
+            )
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -464,6 +553,7 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            self._release_written_future()
 
             # If the writer gets canceled we still need to close the websocket
             # so we have another finally block to make sure we close the websocket
@@ -17,7 +17,6 @@ from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
 from . import repairs, websocket_api
@@ -33,13 +32,7 @@ from .const import (
     DATA_ZHA,
     DOMAIN,
 )
-from .helpers import (
-    SIGNAL_ADD_ENTITIES,
-    HAZHAData,
-    ZHAGatewayProxy,
-    create_zha_config,
-    get_zha_data,
-)
+from .helpers import HAZHAData, ZHAGatewayProxy, create_zha_config, get_zha_data
 from .radio_manager import ZhaRadioManager
 from .repairs.network_settings_inconsistent import warn_on_inconsistent_network_settings
 from .repairs.wrong_silabs_firmware import (
@@ -172,7 +165,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     repairs.async_delete_blocking_issues(hass)
 
-    ha_zha_data.gateway_proxy = ZHAGatewayProxy(hass, config_entry, zha_gateway)
+    ha_zha_data.gateway_proxy = ZHAGatewayProxy(
+        hass, config_entry, zha_gateway, PLATFORMS
+    )
 
     manufacturer = zha_gateway.state.node_info.manufacturer
     model = zha_gateway.state.node_info.model
@@ -203,8 +198,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
 
     await ha_zha_data.gateway_proxy.async_initialize_devices_and_entities()
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
-    async_dispatcher_send(hass, SIGNAL_ADD_ENTITIES)
+    await ha_zha_data.gateway_proxy.async_add_entities()
     return True
 
 
@@ -213,7 +207,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     ha_zha_data = get_zha_data(hass)
     ha_zha_data.config_entry = None
 
+    platforms_loaded: set[Platform] = set()
     if ha_zha_data.gateway_proxy is not None:
+        platforms_loaded = ha_zha_data.gateway_proxy.platforms_loaded
         await ha_zha_data.gateway_proxy.shutdown()
         ha_zha_data.gateway_proxy = None
 
@@ -227,7 +223,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
     websocket_api.async_unload_api(hass)
 
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    return await hass.config_entries.async_unload_platforms(
+        config_entry, platforms_loaded
+    )
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -34,7 +34,7 @@ from .helpers import (
     ZHADeviceProxy,
     async_get_zha_device_proxy,
     get_zha_data,
-    get_zha_gateway,
+    get_zha_gateway_proxy,
 )
 
 KEYS_TO_REDACT = {
@@ -70,7 +70,8 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     zha_data = get_zha_data(hass)
-    gateway: Gateway = get_zha_gateway(hass)
+    gateway_proxy = get_zha_gateway_proxy(hass)
+    gateway: Gateway = gateway_proxy.gateway
     app = gateway.application_controller
 
     energy_scan = await app.energy_scan(
@@ -103,6 +104,11 @@ async def async_get_config_entry_diagnostics(
                 }
                 for device in gateway.devices.values()
             ],
+            # Platforms are only set up once they have entities
+            "platforms": {
+                "loaded": sorted(gateway_proxy.platforms_loaded),
+                "not_loaded": sorted(gateway_proxy.platforms_not_loaded),
+            },
         },
         KEYS_TO_REDACT,
     )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
-from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
 import copy
 import dataclasses
 import enum
@@ -94,7 +94,7 @@ from homeassistant.components.homeassistant_hardware.silabs_multiprotocol_addon
     is_multiprotocol_url,
 )
 from homeassistant.components.system_log import LogEntry
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import (
     ATTR_AREA_ID,
     ATTR_DEVICE_ID,
@@ -490,13 +490,20 @@ class ZHAGatewayProxy(EventBase):
     """Proxy class to interact with the ZHA gateway."""
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: ConfigEntry, gateway: Gateway
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        gateway: Gateway,
+        platforms: Iterable[Platform],
     ) -> None:
         """Initialize the gateway proxy."""
         super().__init__()
         self.hass = hass
         self.config_entry = config_entry
         self.gateway = gateway
+        self.platforms = frozenset(platforms)
+        self.platforms_loaded: set[Platform] = set()
+        self._platform_load_lock = asyncio.Lock()
         self.device_proxies: dict[str, ZHADeviceProxy] = {}
         self.group_proxies: dict[int, ZHAGroupProxy] = {}
         self._ha_entity_refs: collections.defaultdict[EUI64, list[EntityReference]] = (
@@ -545,6 +552,73 @@ class ZHAGatewayProxy(EventBase):
 
         await self.gateway.async_initialize_devices_and_entities()
 
+    @callback
+    def _platforms_to_load(self) -> set[Platform]:
+        """Return the platforms with entities to add that are not loaded."""
+        return {
+            platform
+            for platform, entities in get_zha_data(self.hass).platforms.items()
+            if entities and platform in self.platforms
+        } - self.platforms_loaded
+
+    async def async_add_entities(self) -> None:
+        """Set up the platforms of the entities to add and add them.
+
+        A platform is only set up when its first entity is added, so only
+        the platform modules used by the network are imported.
+        """
+        async with self._platform_load_lock:
+            if needed := self._platforms_to_load():
+                await self.hass.config_entries.async_forward_entry_setups(
+                    self.config_entry, needed
+                )
+                self.platforms_loaded |= needed
+                _LOGGER.debug(
+                    "Set up platforms %s, %s of %s platforms are not loaded",
+                    needed,
+                    len(self.platforms_not_loaded),
+                    len(self.platforms),
+                )
+        async_dispatcher_send(self.hass, SIGNAL_ADD_ENTITIES)
+
+    @property
+    def platforms_not_loaded(self) -> set[Platform]:
+        """Return the platforms that were not needed so far."""
+        return set(self.platforms - self.platforms_loaded)
+
+    async def _async_add_entities_when_loaded(self) -> None:
+        """Set up the missing platforms and add the entities of a loaded entry."""
+        config_entry = self.config_entry
+        # Platforms can't be forwarded to an entry that started unloading
+        # before the task ran. The setup lock is held while the entry
+        # unloads or reloads, a reload adds the entities when it sets up
+        # the entry again.
+        if (
+            config_entry.setup_lock.locked()
+            or config_entry.state is not ConfigEntryState.LOADED
+        ):
+            _LOGGER.debug(
+                "Not adding entities, the config entry is %s", config_entry.state
+            )
+            return
+        # Holding the setup lock keeps the entry from unloading while
+        # its platforms are forwarded
+        async with config_entry.setup_lock:
+            await self.async_add_entities()
+
+    @callback
+    def _async_add_entities(self) -> None:
+        """Add the entities, setting up their platforms first if needed."""
+        if (
+            self.config_entry.state is ConfigEntryState.LOADED
+            and self._platforms_to_load()
+        ):
+            self.config_entry.async_create_task(
+                self.hass, self._async_add_entities_when_loaded(), "zha add entities"
+            )
+        else:
+            async_dispatcher_send(self.hass, SIGNAL_ADD_ENTITIES)
+
     @callback
     def handle_connection_lost(self, event: ConnectionLostEvent) -> None:
         """Handle a connection lost event."""
@@ -638,7 +712,7 @@ class ZHAGatewayProxy(EventBase):
         device_info[DEVICE_PAIRING_STATUS] = event.device_info.pairing_status.name
         if event.new_join:
             self._create_entity_metadata(zha_device_proxy)
-            async_dispatcher_send(self.hass, SIGNAL_ADD_ENTITIES)
+            self._async_add_entities()
         async_dispatcher_send(
             self.hass,
             ZHA_GW_MSG,
@@ -843,7 +917,7 @@ class ZHAGatewayProxy(EventBase):
         self._create_entity_metadata(
             self.group_proxies[group_event.group_info.group_id]
         )
-        async_dispatcher_send(self.hass, SIGNAL_ADD_ENTITIES)
+        self._async_add_entities()
 
     def _send_group_gateway_message(
         self, zha_group_proxy: ZHAGroupProxy, gateway_message_type: str
@@ -49,6 +49,7 @@ from .const import (
     CONF_LEGACY_TEMPLATES,
     CONF_LONGITUDE,
     CONF_MEDIA_DIRS,
+    CONF_MEMORY_LEAN,
     CONF_NAME,
     CONF_PACKAGES,
     CONF_PLATFORM,
@@ -361,6 +362,7 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_MEMORY_LEAN): cv.boolean,
         }
     ),
     _filter_bad_internal_external_urls,
@@ -875,6 +877,8 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    hass.states.async_set_memory_lean(config.get(CONF_MEMORY_LEAN, False))
+
     _raise_issue_if_historic_currency(hass, hass.config.currency)
     _raise_issue_if_no_country(hass, hass.config.country)
 
@@ -217,6 +217,7 @@ CONF_MAC: Final = "mac"
 CONF_MATCH: Final = "match"
 CONF_MAXIMUM: Final = "maximum"
 CONF_MEDIA_DIRS: Final = "media_dirs"
+CONF_MEMORY_LEAN: Final = "memory_lean"
 CONF_METHOD: Final = "method"
 CONF_MINIMUM: Final = "minimum"
 CONF_MODE: Final = "mode"
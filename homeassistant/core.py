@@ -29,6 +29,7 @@ import logging
 import os
 import pathlib
 import re
+from sys import intern
 import threading
 import time
 from time import monotonic
@@ -1432,6 +1433,58 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+@dataclass(slots=True)
+class _BatchedListener(Generic[_DataT]):
+    """Collect events and deliver them to the listener as a list."""
+
+    hass: HomeAssistant
+    listener_job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None]
+    window: float | None
+    events: list[Event[_DataT]]
+    handle: asyncio.Handle | None = None
+    remove: CALLBACK_TYPE | None = None
+
+    @callback
+    def __call__(self, event: Event[_DataT]) -> None:
+        """Queue the event and schedule a flush if one is not pending."""
+        self.events.append(event)
+        if self.handle is not None:
+            return
+        loop = self.hass.loop
+        if self.window:
+            self.handle = loop.call_later(self.window, self.flush)
+        else:
+            self.handle = loop.call_soon(self.flush)
+
+    @callback
+    def flush(self) -> None:
+        """Deliver all pending events to the listener."""
+        self.handle = None
+        if not self.events:
+            return
+        events = self.events
+        self.events = []
+        self.hass.async_run_hass_job(self.listener_job, events)
+
+    @callback
+    def async_remove(self) -> None:
+        """Remove the listener from the event bus and drop pending events."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.events.clear()
+        if self.remove:
+            self.remove()
+            self.remove = None
+
+    def __repr__(self) -> str:
+        """Return the representation of the listener and source module."""
+        module = inspect.getmodule(self.listener_job.target)
+        if module:
+            return f"<_BatchedListener {module.__name__}:{self.listener_job.target}>"
+        return f"<_BatchedListener {self.listener_job.target}>"
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1628,6 +1681,54 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batched(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+        window: float | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and receive them in batches.
+
+        Instead of being called once per event, the listener is called with
+        a list of all matching events, in the order they were fired. By
+        default the batch is delivered once per event loop iteration; when
+        a window (in seconds) is given, events are coalesced for up to that
+        long after the first event of a batch.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if an event
+        is added to the batch.
+
+        Events that are still pending when the listener is removed are
+        dropped.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if event_type == EVENT_STATE_REPORTED and not event_filter:
+            raise HomeAssistantError(f"Event filter is required for event {event_type}")
+        batched_listener: _BatchedListener[_DataT] = _BatchedListener(
+            self._hass,
+            HassJob(listener, f"listen batched {event_type}"),
+            window,
+            [],
+        )
+        batched_listener.remove = self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(
+                    batched_listener,
+                    f"batched listen {event_type} {listener}",
+                    job_type=HassJobType.Callback,
+                ),
+                event_filter,
+            ),
+        )
+        return batched_listener.async_remove
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -2037,7 +2138,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_memory_lean",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2048,6 +2156,41 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._memory_lean = False
+
+    @property
+    def memory_lean(self) -> bool:
+        """Return if the memory lean mode is enabled."""
+        return self._memory_lean
+
+    @callback
+    def async_set_memory_lean(self, enabled: bool) -> None:
+        """Enable or disable the memory lean mode.
+
+        When enabled, the attribute keys and string values of new states
+        are interned so equal strings are shared between states instead of
+        each state holding its own copy. This trades a small amount of CPU
+        when attributes change for a lower memory footprint on large
+        installs.
+
+        This method must be run in the event loop.
+        """
+        self._memory_lean = enabled
+
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a copy of the attributes with interned strings."""
+        # Attributes are keyed by str in practice but sys.intern
+        # only accepts exact str instances, so check both sides.
+        return ReadOnlyDict(
+            (
+                intern(key) if type(key) is str else key,
+                intern(value) if type(value) is str else value,
+            )
+            for key, value in attributes.items()
+        )
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2328,6 +2471,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif self._memory_lean:
+            attributes = self._async_intern_attributes(attributes or {})
 
         # This is intentionally called with positional only arguments for performance
         # reasons
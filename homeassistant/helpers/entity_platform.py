@@ -8,6 +8,7 @@ from contextvars import ContextVar
 from datetime import timedelta
 from functools import partial
 from logging import Logger, getLogger
+import time
 from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant import config_entries
@@ -50,9 +51,11 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import async_get_polling_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
+    from .device_registry import DeviceInfo
     from .entity import Entity
 
 
@@ -73,6 +76,11 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+type _DeviceCacheType = dict[
+    tuple[frozenset[tuple[str, str]], frozenset[tuple[str, str]]],
+    tuple[DeviceInfo, str],
+]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -152,6 +160,9 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Number of entities added and the seconds spent adding them
+        self.entities_added = 0
+        self.add_entities_seconds = 0.0
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -538,8 +549,8 @@ class EntityPlatform:
 
     async def _async_add_and_update_entities(
         self,
-        coros: list[Coroutine[Any, Any, None]],
         entities: list[Entity],
+        entity_registry: EntityRegistry,
         timeout: float,
     ) -> None:
         """Add entities for a single platform and update them.
@@ -548,9 +559,26 @@ class EntityPlatform:
         schedule the coroutines as tasks so we can await them in the event
         loop. This is because the update is likely to yield control to the
         event loop and will finish faster if we run them concurrently.
+        Each entity is added as soon as its own update finished.
         """
+        # Entities of the same device usually share the same device info,
+        # the device is only looked up once for each device info in the batch
+        devices: _DeviceCacheType = {}
         results: list[BaseException | None] | None = None
-        tasks = [create_eager_task(coro, loop=self.hass.loop) for coro in coros]
+        # The tasks start eagerly, the entities whose update does not yield
+        # are registered before the block exits and their registry changes
+        # are saved once. The block exits before the batch is awaited.
+        with (
+            entity_registry.async_defer_save(),
+            dev_reg.async_get(self.hass).async_defer_save(),
+        ):
+            tasks = [
+                create_eager_task(
+                    self._async_update_and_add_entity(entity, entity_registry, devices),
+                    loop=self.hass.loop,
+                )
+                for entity in entities
+            ]
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
                 results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -565,23 +593,16 @@ class EntityPlatform:
         if not results:
             return
 
-        for idx, result in enumerate(results):
+        for entity, result in zip(entities, results, strict=True):
             if isinstance(result, Exception):
-                entity = entities[idx]
-                self.logger.exception(
-                    "Error adding entity %s for domain %s with platform %s",
-                    entity.entity_id,
-                    self.domain,
-                    self.platform_name,
-                    exc_info=result,
-                )
+                self._async_log_add_entity_exception(entity, result)
             elif isinstance(result, BaseException):
                 raise result
 
     async def _async_add_entities(
         self,
-        coros: list[Coroutine[Any, Any, None]],
         entities: list[Entity],
+        entity_registry: EntityRegistry,
         timeout: float,
     ) -> None:
         """Add entities for a single platform without updating.
@@ -593,18 +614,13 @@ class EntityPlatform:
         """
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                for idx, coro in enumerate(coros):
+                for entity in self._async_register_entities(
+                    entities, entity_registry, {}
+                ):
                     try:
-                        await coro
-                    except Exception as ex:
-                        entity = entities[idx]
-                        self.logger.exception(
-                            "Error adding entity %s for domain %s with platform %s",
-                            entity.entity_id,
-                            self.domain,
-                            self.platform_name,
-                            exc_info=ex,
-                        )
+                        await entity.add_to_platform_finish()
+                    except Exception as ex:  # noqa: BLE001
+                        self._async_log_add_entity_exception(entity, ex)
         except TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -613,6 +629,19 @@ class EntityPlatform:
                 timeout,
             )
 
+    @callback
+    def _async_log_add_entity_exception(
+        self, entity: Entity, ex: BaseException
+    ) -> None:
+        """Log an exception raised while adding an entity."""
+        self.logger.exception(
+            "Error adding entity %s for domain %s with platform %s",
+            entity.entity_id,
+            self.domain,
+            self.platform_name,
+            exc_info=ex,
+        )
+
     async def async_add_entities(
         self, new_entities: Iterable[Entity], update_before_add: bool = False
     ) -> None:
@@ -626,25 +655,37 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
-        coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
-            coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
-            )
+            try:
+                self._async_start_adding_entity(entity)
+            except Exception as ex:  # noqa: BLE001
+                self._async_log_add_entity_exception(entity, ex)
+                continue
             entities.append(entity)
 
         # No entities for processing
-        if not coros:
+        if not entities:
             return
 
-        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(coros), SLOW_ADD_MIN_TIMEOUT)
+        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(entities), SLOW_ADD_MIN_TIMEOUT)
         if update_before_add:
             add_func = self._async_add_and_update_entities
         else:
             add_func = self._async_add_entities
 
-        await add_func(coros, entities, timeout)
+        start = time.monotonic()
+        await add_func(entities, entity_registry, timeout)
+        elapsed = time.monotonic() - start
+        self.entities_added += len(entities)
+        self.add_entities_seconds += elapsed
+        self.logger.debug(
+            "Added %s entities for domain %s with platform %s in %.3fs",
+            len(entities),
+            self.domain,
+            self.platform_name,
+            elapsed,
+        )
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
@@ -663,7 +704,11 @@ class EntityPlatform:
             return
 
         self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+            async_get_polling_scheduler(hass).async_delay(
+                f"{self.config_entry.entry_id if self.config_entry else ''} "
+                f"{self.domain}.{self.platform_name}",
+                self.scan_interval_seconds,
+            ),
             self._async_handle_interval_callback,
         )
 
@@ -704,13 +749,9 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
-    async def _async_add_entity(  # noqa: C901
-        self,
-        entity: Entity,
-        update_before_add: bool,
-        entity_registry: EntityRegistry,
-    ) -> None:
-        """Add an entity to the platform."""
+    @callback
+    def _async_start_adding_entity(self, entity: Entity) -> None:
+        """Start adding an entity to the platform."""
         if entity is None:
             raise ValueError("Entity cannot be None")
 
@@ -720,16 +761,62 @@ class EntityPlatform:
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
 
+    async def _async_update_and_add_entity(
+        self,
+        entity: Entity,
+        entity_registry: EntityRegistry,
+        devices: _DeviceCacheType,
+    ) -> None:
+        """Update an entity and add it to the platform."""
         # Update properties before we generate the entity_id. This will happen
         # also for disabled entities.
-        if update_before_add:
-            try:
-                await entity.async_device_update(warning=False)
-            except Exception:
-                self.logger.exception("%s: Error on device update!", self.platform_name)
-                entity.add_to_platform_abort()
-                return
+        try:
+            await entity.async_device_update(warning=False)
+        except Exception:
+            self.logger.exception("%s: Error on device update!", self.platform_name)
+            entity.add_to_platform_abort()
+            return
+        except asyncio.CancelledError:
+            # Adding the batch timed out before the update finished
+            entity.add_to_platform_abort()
+            raise
+        if self._async_register_entities([entity], entity_registry, devices):
+            await entity.add_to_platform_finish()
+
+    @callback
+    def _async_register_entities(
+        self,
+        entities: list[Entity],
+        entity_registry: EntityRegistry,
+        devices: _DeviceCacheType,
+    ) -> list[Entity]:
+        """Register entities, returns the entities to finish adding.
+
+        The registry entries are resolved without yielding to the event
+        loop, so the registries are saved once after the entities and no
+        change is held back across an await.
+        """
+        registered: list[Entity] = []
+        with (
+            entity_registry.async_defer_save(),
+            dev_reg.async_get(self.hass).async_defer_save(),
+        ):
+            for entity in entities:
+                try:
+                    if self._async_register_entity(entity, entity_registry, devices):
+                        registered.append(entity)
+                except Exception as ex:  # noqa: BLE001
+                    self._async_log_add_entity_exception(entity, ex)
+        return registered
 
+    @callback
+    def _async_register_entity(  # noqa: C901
+        self,
+        entity: Entity,
+        entity_registry: EntityRegistry,
+        devices: _DeviceCacheType,
+    ) -> bool:
+        """Register an entity with the platform, returns False if it was aborted."""
         suggested_object_id: str | None = None
         generate_new_entity_id = False
 
@@ -763,22 +850,34 @@ class EntityPlatform:
                         )
                     self.logger.error(msg)
                     entity.add_to_platform_abort()
-                    return
+                    return False
 
             if self.config_entry and (device_info := entity.device_info):
-                try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
-                    )
-                except dev_reg.DeviceInfoError as exc:
-                    self.logger.error(
-                        "%s: Not adding entity with invalid device info: %s",
-                        self.platform_name,
-                        str(exc),
-                    )
-                    entity.add_to_platform_abort()
-                    return
+                device_registry = dev_reg.async_get(self.hass)
+                device_key = (
+                    frozenset(device_info.get("identifiers") or ()),
+                    frozenset(device_info.get("connections") or ()),
+                )
+                device = None
+                if (cached := devices.get(device_key)) and cached[0] == device_info:
+                    # The device may have been changed or removed
+                    # while the previous entities were added
+                    device = device_registry.async_get(cached[1])
+                if device is None:
+                    try:
+                        device = device_registry.async_get_or_create(
+                            config_entry_id=self.config_entry.entry_id,
+                            **device_info,
+                        )
+                    except dev_reg.DeviceInfoError as exc:
+                        self.logger.error(
+                            "%s: Not adding entity with invalid device info: %s",
+                            self.platform_name,
+                            str(exc),
+                        )
+                        entity.add_to_platform_abort()
+                        return False
+                    devices[device_key] = (device_info, device.id)
             else:
                 device = None
 
@@ -876,7 +975,7 @@ class EntityPlatform:
                 "Entity id already exists - ignoring: %s", entity.entity_id
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         if entity.registry_entry and entity.registry_entry.disabled:
             self.logger.debug(
@@ -886,7 +985,7 @@ class EntityPlatform:
                 or f'"{self.platform_name} {entity.unique_id}"',
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
@@ -908,8 +1007,7 @@ class EntityPlatform:
             del self.domain_platform_entities[entity_id]
 
         entity.async_on_remove(remove_entity_cb)
-
-        await entity.add_to_platform_finish()
+        return True
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
@@ -957,6 +1055,7 @@ class EntityPlatform:
         """
         await self.async_reset()
         self.hass.data[DATA_ENTITY_PLATFORM][self.platform_name].remove(self)
+        async_get_polling_scheduler(self.hass).async_unregister(self)
 
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove entity id from platform."""
@@ -1025,6 +1124,14 @@ class EntityPlatform:
 
         This method must be run in the event loop.
         """
+        scheduler = async_get_polling_scheduler(self.hass)
+        stats = scheduler.async_register(
+            self,
+            f"{self.domain}.{self.platform_name}",
+            self.platform_name,
+            self.scan_interval_seconds,
+            self.config_entry,
+        )
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
@@ -1034,8 +1141,13 @@ class EntityPlatform:
                 self.domain,
                 self.scan_interval,
             )
+            stats.async_record_overrun()
             return
 
+        # Entity updates of the same integration share a budget
+        # so they do not all hit the devices at once
+        budget = scheduler.async_budget(self.platform_name)
+        start = time.monotonic()
         async with self._process_updates:
             if self._update_in_sequence or len(self.entities) <= 1:
                 # If we know we will update sequentially, we want to avoid scheduling
@@ -1045,17 +1157,24 @@ class EntityPlatform:
                     # entity being updated, we need to skip updating the
                     # entity.
                     if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
-
-            if tasks := [
+                        async with budget:
+                            await entity.async_update_ha_state(True)
+            elif tasks := [
                 create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
+                    self._async_poll_entity(entity, budget), loop=self.hass.loop
                 )
                 for entity in self.entities.values()
                 if entity.should_poll
             ]:
                 await asyncio.gather(*tasks)
+        stats.async_record(time.monotonic() - start)
+
+    async def _async_poll_entity(
+        self, entity: Entity, budget: asyncio.Semaphore
+    ) -> None:
+        """Update the state of a polling entity within the budget."""
+        async with budget:
+            await entity.async_update_ha_state(True)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -703,6 +703,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_VERSION_MAJOR,
             STORAGE_KEY,
             atomic_writes=True,
+            journal=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
         self.hass.bus.async_listen(
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from functools import partial, wraps
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from functools import lru_cache, partial, wraps
 import logging
+from operator import attrgetter
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
@@ -76,6 +78,8 @@ _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
 
+_TIMER_WHEELS: HassKey[dict[bool, _TimerWheel]] = HassKey("timer_wheels")
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -89,6 +93,16 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Timers of the timer wheel that are due in the same tick of this
+# many seconds fire from the same event loop callback, at the earliest
+# of them. It is kept below RANDOM_MICROSECOND_MIN so time change
+# listeners never fire before the second they are scheduled for.
+TIMER_WHEEL_TICK = 0.025
+
+# Time patterns matching at most this many seconds of
+# a day have their schedule precomputed
+MAX_PRECOMPUTED_PATTERN_TIMES = 3600
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -1583,6 +1597,200 @@ def async_call_later(
 call_later = threaded_listener_factory(async_call_later)
 
 
+@dataclass(slots=True)
+class _WheelTimer:
+    """A timer of the timer wheel."""
+
+    when: float
+    name: str
+    action: Callable[[], None]
+    slot: _WheelSlot
+    done: bool = False
+
+
+class _WheelSlot:
+    """The timers of the timer wheel that are due in the same tick."""
+
+    __slots__ = ("handle", "live", "tick", "timers", "wheel")
+
+    def __init__(self, wheel: _TimerWheel, tick: int) -> None:
+        """Initialize the slot."""
+        self.wheel = wheel
+        self.tick = tick
+        self.timers: list[_WheelTimer] = []
+        self.live = 0
+        self.handle: asyncio.TimerHandle | None = None
+
+    def __repr__(self) -> str:
+        """Return the names of the timers in the slot.
+
+        The event loop shows this when it logs the handle, for example
+        when asyncio debug logging reports a slow callback.
+        """
+        names = [timer.name for timer in self.timers if not timer.done]
+        return f"<TimerWheelSlot {names}>"
+
+    @callback
+    def __call__(self, _job: HassJob) -> None:
+        """Fire the timers of the slot."""
+        self.handle = None
+        self.wheel.async_fire_slot(self)
+
+
+class _TimerWheel:
+    """Timer wheel for the periodic time trackers.
+
+    Timers are kept in slots of TIMER_WHEEL_TICK seconds and each slot
+    schedules a single event loop callback for its earliest timer, so
+    trackers due in the same tick fire together instead of each holding
+    its own handle in the timer heap of the event loop.
+    """
+
+    __slots__ = (
+        "_job",
+        "_loop",
+        "_slots",
+        "fired",
+        "last_latency",
+        "loop_callbacks",
+        "max_latency",
+        "timers",
+    )
+
+    def __init__(self, hass: HomeAssistant, cancel_on_shutdown: bool) -> None:
+        """Initialize the timer wheel."""
+        self._loop = hass.loop
+        # The job is passed to the loop handles so Home Assistant can
+        # cancel them on shutdown like the timers of other HassJobs
+        self._job = HassJob(
+            self.async_fire_slot,
+            "timer wheel",
+            job_type=HassJobType.Callback,
+            cancel_on_shutdown=cancel_on_shutdown,
+        )
+        self._slots: dict[int, _WheelSlot] = {}
+        self.timers = 0
+        self.fired = 0
+        self.loop_callbacks = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    @callback
+    def async_add(
+        self, when: float, name: str, action: Callable[[], None]
+    ) -> _WheelTimer:
+        """Add a timer that calls action at or after loop time when."""
+        tick = int(when // TIMER_WHEEL_TICK)
+        if (slot := self._slots.get(tick)) is None:
+            slot = self._slots[tick] = _WheelSlot(self, tick)
+        timer = _WheelTimer(when, name, action, slot)
+        slot.timers.append(timer)
+        slot.live += 1
+        self.timers += 1
+        if (
+            (handle := slot.handle) is None
+            or handle.cancelled()
+            or when < handle.when()
+        ):
+            self._schedule(slot, when)
+        return timer
+
+    @callback
+    def async_cancel(self, timer: _WheelTimer) -> None:
+        """Cancel a timer."""
+        if timer.done:
+            return
+        timer.done = True
+        self.timers -= 1
+        slot = timer.slot
+        slot.live -= 1
+        if not slot.live:
+            self._remove_slot(slot)
+
+    def _schedule(self, slot: _WheelSlot, when: float) -> None:
+        """Schedule the loop callback of a slot."""
+        if slot.handle is not None:
+            slot.handle.cancel()
+        slot.handle = self._loop.call_at(when, slot, self._job)
+
+    def _remove_slot(self, slot: _WheelSlot) -> None:
+        """Remove a slot without live timers."""
+        if slot.handle is not None:
+            slot.handle.cancel()
+            slot.handle = None
+        if self._slots.get(slot.tick) is slot:
+            del self._slots[slot.tick]
+
+    @callback
+    def async_fire_slot(self, slot: _WheelSlot) -> None:
+        """Fire the timers of a slot.
+
+        The slot fires at its earliest timer, the other timers of
+        the slot fire with it, up to a tick early.
+        """
+        self.loop_callbacks += 1
+        # The latency is measured with time_tracker_timestamp so
+        # tests that mock it see the latency at the mocked time
+        now = self._loop.time() + time_tracker_timestamp() - time.time()
+        timers = sorted(slot.timers, key=attrgetter("when"))
+        # Timers added while firing are kept for the next callback
+        slot.timers = []
+        for timer in timers:
+            if timer.done:
+                continue
+            timer.done = True
+            slot.live -= 1
+            self.timers -= 1
+            self.fired += 1
+            self.last_latency = latency = max(now - timer.when, 0.0)
+            if latency > self.max_latency:
+                self.max_latency = latency
+            try:
+                timer.action()
+            except Exception as err:  # noqa: BLE001
+                self._loop.call_exception_handler(
+                    {"message": f"Exception in timer {timer.name}", "exception": err}
+                )
+
+        if not slot.live:
+            self._remove_slot(slot)
+            return
+        # Timers that were added to the slot while firing
+        slot.timers = [timer for timer in slot.timers if not timer.done]
+        next_when = min(timer.when for timer in slot.timers)
+        if (handle := slot.handle) is None or handle.when() != next_when:
+            self._schedule(slot, next_when)
+
+
+@callback
+def _async_get_timer_wheel(
+    hass: HomeAssistant, cancel_on_shutdown: bool
+) -> _TimerWheel:
+    """Return the timer wheel for timers that are or are not cancelled on shutdown."""
+    if (wheels := hass.data.get(_TIMER_WHEELS)) is None:
+        wheels = hass.data[_TIMER_WHEELS] = {}
+    if (wheel := wheels.get(cancel_on_shutdown)) is None:
+        wheel = wheels[cancel_on_shutdown] = _TimerWheel(hass, cancel_on_shutdown)
+    return wheel
+
+
+@callback
+def async_get_timer_wheel_stats(hass: HomeAssistant) -> dict[str, int | float]:
+    """Return the counters of the timer wheel.
+
+    The latencies are in seconds from when a timer was due
+    until it fired.
+    """
+    wheels = hass.data.get(_TIMER_WHEELS, {}).values()
+    return {
+        "timers": sum(wheel.timers for wheel in wheels),
+        "fired": sum(wheel.fired for wheel in wheels),
+        "loop_callbacks": sum(wheel.loop_callbacks for wheel in wheels),
+        "last_latency": max((wheel.last_latency for wheel in wheels), default=0.0),
+        "max_latency": max((wheel.max_latency for wheel in wheels), default=0.0),
+    }
+
+
 @dataclass(slots=True)
 class _TrackTimeInterval:
     """Helper class to help listen to time interval events."""
@@ -1592,37 +1800,32 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
-    _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _wheel: _TimerWheel | None = None
+    _timer: _WheelTimer | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        self._track_job = HassJob(
-            self._interval_listener,
-            self.job_name,
-            job_type=HassJobType.Callback,
-            cancel_on_shutdown=self.cancel_on_shutdown,
-        )
         self._run_job = HassJob(
             self.action,
             f"track time interval {self.seconds}",
             cancel_on_shutdown=self.cancel_on_shutdown,
         )
+        self._wheel = _async_get_timer_wheel(self.hass, bool(self.cancel_on_shutdown))
         self._schedule_timer()
 
     def _schedule_timer(self) -> None:
         """Schedule the timer."""
         if TYPE_CHECKING:
-            assert self._track_job is not None
-        hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+            assert self._wheel is not None
+        self._timer = self._wheel.async_add(
+            self.hass.loop.time() + self.seconds,
+            self.job_name,
+            self._interval_listener,
         )
 
     @callback
-    def _interval_listener(self, _: Any) -> None:
+    def _interval_listener(self) -> None:
         """Handle elapsed intervals."""
         if TYPE_CHECKING:
             assert self._run_job is not None
@@ -1631,10 +1834,11 @@ class _TrackTimeInterval:
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
-            assert self._timer_handle is not None
-        self._timer_handle.cancel()
+            assert self._wheel is not None
+            assert self._timer is not None
+        self._wheel.async_cancel(self._timer)
 
 
 @callback
@@ -1759,6 +1963,32 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+@lru_cache(maxsize=16)
+def _day_has_fixed_utc_offset(day: date, tz: tzinfo) -> bool:
+    """Return if the UTC offset of the time zone does not change during the day."""
+    start = datetime(day.year, day.month, day.day, tzinfo=tz)
+    end = start + timedelta(days=1)
+    return start.utcoffset() == end.utcoffset()
+
+
+def _pattern_day_seconds(
+    time_match_expression: tuple[list[int], list[int], list[int]],
+) -> list[int] | None:
+    """Return the sorted seconds of the day matching the time pattern.
+
+    Returns None if the pattern matches too many seconds to precompute.
+    """
+    seconds, minutes, hours = time_match_expression
+    if len(seconds) * len(minutes) * len(hours) > MAX_PRECOMPUTED_PATTERN_TIMES:
+        return None
+    return sorted(
+        hour * 3600 + minute * 60 + second
+        for hour in hours
+        for minute in minutes
+        for second in seconds
+    )
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
     hass: HomeAssistant
@@ -1767,52 +1997,106 @@ class _TrackUTCTimeChange:
     local: bool
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
-    _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
-    _cancel_callback: CALLBACK_TYPE | None = None
+    _day_seconds: list[int] | None = None
+    _wheel: _TimerWheel | None = None
+    _timer: _WheelTimer | None = None
+    _next_fire: datetime | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        self._pattern_time_change_listener_job = HassJob(
-            self._pattern_time_change_listener,
+        self._day_seconds = _pattern_day_seconds(self.time_match_expression)
+        self._wheel = _async_get_timer_wheel(self.hass, False)
+        self._schedule_timer(self._calculate_next(dt_util.utcnow()))
+
+    def _schedule_timer(self, next_fire: datetime) -> None:
+        """Schedule the timer for the next time the pattern matches."""
+        self._next_fire = next_fire
+        self._schedule_timer_in(next_fire.timestamp() - time.time())
+
+    def _schedule_timer_in(self, delay: float) -> None:
+        """Schedule the timer to fire in delay seconds."""
+        if TYPE_CHECKING:
+            assert self._wheel is not None
+        self._timer = self._wheel.async_add(
+            self.hass.loop.time() + delay,
             self.listener_job_name,
-            job_type=HassJobType.Callback,
-        )
-        self._cancel_callback = async_track_point_in_utc_time(
-            self.hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(dt_util.utcnow()),
+            self._pattern_time_change_listener,
         )
 
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
-        ).replace(microsecond=self.microsecond)
+        if (
+            self._day_seconds is None
+            or (next_time := self._next_from_day_seconds(localized_now)) is None
+        ):
+            next_time = dt_util.find_next_time_expression_time(
+                localized_now, *self.time_match_expression
+            )
+        return next_time.replace(microsecond=self.microsecond)
+
+    def _next_from_day_seconds(self, now: datetime) -> datetime | None:
+        """Find the next matching time in the precomputed schedule.
+
+        Returns None on days the UTC offset changes, the daylight saving
+        time transitions are left to find_next_time_expression_time.
+        """
+        if TYPE_CHECKING:
+            assert self._day_seconds is not None
+        day_seconds = self._day_seconds
+        day = now.date()
+        tz = now.tzinfo
+        if TYPE_CHECKING:
+            assert tz is not None
+        if tz is not UTC and not _day_has_fixed_utc_offset(day, tz):
+            return None
+        index = bisect_left(day_seconds, now.hour * 3600 + now.minute * 60 + now.second)
+        if index == len(day_seconds):
+            day += timedelta(days=1)
+            index = 0
+            if tz is not UTC and not _day_has_fixed_utc_offset(day, tz):
+                return None
+        second_of_day = day_seconds[index]
+        return datetime(
+            day.year,
+            day.month,
+            day.day,
+            second_of_day // 3600,
+            second_of_day // 60 % 60,
+            second_of_day % 60,
+            tzinfo=tz,
+        )
 
     @callback
-    def _pattern_time_change_listener(self, _: datetime) -> None:
+    def _pattern_time_change_listener(self) -> None:
         """Listen for matching time_changed events."""
+        if TYPE_CHECKING:
+            assert self._next_fire is not None
         hass = self.hass
         # Fetch time again because we want the actual time, not the
-        # time when the timer was scheduled
+        # time when the timer was scheduled.
         utc_now = time_tracker_utcnow()
+        # The timer wheel fires up to a tick early, which is still in
+        # the matching second. The loop clock and the wall clock can
+        # also drift apart, so the timer can fire before the pattern
+        # matches as measured by utcnow(). Rearm the timer for the
+        # remaining time like async_track_point_in_utc_time does.
+        if utc_now < self._next_fire.replace(microsecond=0):
+            delta = (self._next_fire - utc_now).total_seconds()
+            _LOGGER.debug("Called %f seconds too early, rearming", delta)
+            self._schedule_timer_in(delta)
+            return
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        if TYPE_CHECKING:
-            assert self._pattern_time_change_listener_job is not None
-        self._cancel_callback = async_track_point_in_utc_time(
-            hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(utc_now + timedelta(seconds=1)),
-        )
+        self._schedule_timer(self._calculate_next(utc_now + timedelta(seconds=1)))
         hass.async_run_hass_job(self.job, localized_now, background=True)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback()
+            assert self._wheel is not None
+            assert self._timer is not None
+        self._wheel.async_cancel(self._timer)
 
 
 @callback
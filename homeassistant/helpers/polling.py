@@ -0,0 +1,169 @@
+"""Schedule the polling of entity platforms and data update coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict
+from weakref import WeakKeyDictionary
+import zlib
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+
+# How many polls of the same integration may run at the same time
+POLL_CONCURRENCY_BUDGET = 10
+
+
+class PollStatsDict(TypedDict):
+    """Poll statistics of a coordinator or an entity platform.
+
+    Durations are in seconds.
+    """
+
+    name: str
+    integration: str | None
+    config_entry_id: str | None
+    interval: float
+    polls: int
+    overruns: int
+    last_duration: float
+    max_duration: float
+    average_duration: float
+
+
+@dataclass(slots=True)
+class PollStats:
+    """Poll statistics of a coordinator or an entity platform."""
+
+    name: str
+    integration: str | None
+    config_entry_id: str | None
+    interval: float
+    polls: int = 0
+    overruns: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    @callback
+    def async_record(self, duration: float) -> None:
+        """Record a poll that took duration seconds."""
+        self.polls += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+        if duration > self.interval:
+            self.overruns += 1
+
+    @callback
+    def async_record_overrun(self) -> None:
+        """Record a poll that was skipped because the previous one still ran."""
+        self.overruns += 1
+
+    def as_dict(self) -> PollStatsDict:
+        """Return the statistics as a dict."""
+        return {
+            "name": self.name,
+            "integration": self.integration,
+            "config_entry_id": self.config_entry_id,
+            "interval": self.interval,
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "last_duration": round(self.last_duration, 3),
+            "max_duration": round(self.max_duration, 3),
+            "average_duration": round(self.total_duration / self.polls, 3)
+            if self.polls
+            else 0.0,
+        }
+
+
+class PollingScheduler:
+    """Spread polls over their interval and limit their concurrency.
+
+    Everything that is set up at the same time, during startup or when
+    config entries are reloaded, schedules its first poll one interval
+    later, so all polls of the same interval would run at the same time.
+    The first poll is scheduled between half and one interval later
+    instead, at an offset that is derived from the name of the poll so
+    it is the same on every startup. It is never later than before.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self._hass = hass
+        self._budgets: dict[str, asyncio.Semaphore] = {}
+        # Statistics are dropped with their coordinator or entity platform
+        self._stats: WeakKeyDictionary[object, PollStats] = WeakKeyDictionary()
+
+    @callback
+    def async_delay(self, key: str, interval: float) -> float:
+        """Return the delay of the first poll of key."""
+        return interval * (1 - zlib.crc32(key.encode()) / 2**33)
+
+    @callback
+    def async_budget(self, integration: str) -> asyncio.Semaphore:
+        """Return the concurrency budget of the polls of an integration."""
+        if (budget := self._budgets.get(integration)) is None:
+            budget = self._budgets[integration] = asyncio.Semaphore(
+                POLL_CONCURRENCY_BUDGET
+            )
+        return budget
+
+    @callback
+    def async_register(
+        self,
+        owner: object,
+        name: str,
+        integration: str | None,
+        interval: float,
+        config_entry: ConfigEntry | None = None,
+    ) -> PollStats:
+        """Return the statistics of the polls of owner.
+
+        The title of the config entry is added to the name since
+        every config entry of an integration polls under the same name.
+        """
+        if (stats := self._stats.get(owner)) is None:
+            if config_entry is None:
+                stats = PollStats(name, integration, None, interval)
+            else:
+                stats = PollStats(
+                    f"{name} ({config_entry.title})",
+                    integration,
+                    config_entry.entry_id,
+                    interval,
+                )
+            self._stats[owner] = stats
+        else:
+            stats.interval = interval
+        return stats
+
+    @callback
+    def async_unregister(self, owner: object) -> None:
+        """Remove the statistics of the polls of owner."""
+        self._stats.pop(owner, None)
+
+    @callback
+    def async_stats(self) -> list[PollStatsDict]:
+        """Return the statistics of all polls, the slowest first."""
+        return sorted(
+            (stats.as_dict() for stats in self._stats.values()),
+            key=lambda stats: stats["max_duration"],
+            reverse=True,
+        )
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler(hass)
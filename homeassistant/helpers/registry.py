@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Generator, Mapping, Sequence, ValuesView
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -68,15 +69,37 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
 
     hass: HomeAssistant
     _store: Store[_StoreDataT]
+    _save_deferrals: int = 0
+    _save_deferred: bool = False
 
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the registry."""
+        if self._save_deferrals:
+            self._save_deferred = True
+            return
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
         self._store.async_delay_save(self._data_to_save, delay)
 
+    @contextmanager
+    def async_defer_save(self) -> Generator[None]:
+        """Defer scheduling the save of the registry until the block exits.
+
+        Blocks may be nested or overlap, the save is scheduled once when
+        the last of them exits. Changes made while a block is open are not
+        saved, so the block must not yield to the event loop.
+        """
+        self._save_deferrals += 1
+        try:
+            yield
+        finally:
+            self._save_deferrals -= 1
+            if not self._save_deferrals and self._save_deferred:
+                self._save_deferred = False
+                self.async_schedule_save()
+
     @callback
     @abstractmethod
     def _data_to_save(self) -> _StoreDataT:
@@ -27,7 +27,11 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+# Version 1 stored a list of the stored states, version 2 stores a dict with
+# the time of the last dump as last_dump and the stored states as states, a
+# list of items that have the entity id as id. Code that reads the stored
+# data directly has to look up the stored states under states.
+STORAGE_VERSION = 2
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -96,6 +100,31 @@ class StoredState:
         )
 
 
+class RestoreStateStore(Store[dict[str, Any]]):
+    """Store restore state data."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: Any,
+    ) -> dict[str, Any]:
+        """Migrate to the new version."""
+        if old_major_version == 1:
+            # Version 2 stores the states as a list of items with the
+            # entity id as id so they can be journaled per entity
+            old_data = {
+                "last_dump": None,
+                "states": [
+                    {"id": item["state"]["entity_id"], **item} for item in old_data
+                ],
+            }
+
+        if old_major_version > 2:
+            raise NotImplementedError
+        return cast(dict[str, Any], old_data)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -134,11 +163,17 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        # The journal only appends the states that changed since the last
+        # dump instead of rewriting the states of all entities every time
+        self.store = RestoreStateStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The items of the previous dump with the state they were made of,
+        # they are reused as long as the state is the same object and the
+        # extra data did not change
+        self._dumped_items: dict[str, tuple[State | StoredState, dict[str, Any]]] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -154,19 +189,24 @@ class RestoreStateData:
     async def async_load(self) -> None:
         """Load the instance of this data helper."""
         try:
-            stored_states = await self.store.async_load()
+            stored_data = await self.store.async_load()
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
-            stored_states = None
+            stored_data = None
 
-        if stored_states is None:
+        if stored_data is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
+            last_dump = stored_data["last_dump"]
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
+                item["id"]: StoredState.from_dict(
+                    # States of entities that existed when the states
+                    # were dumped were last seen at the time of the dump
+                    item if item["last_seen"] else {**item, "last_seen": last_dump}
+                )
+                for item in stored_data["states"]
+                if valid_entity_id(item["id"])
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
@@ -214,16 +254,71 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_dump_items(self, now: datetime) -> list[dict[str, Any]]:
+        """Get the items of the states which should be stored, seen at now.
+
+        The items of the previous dump are reused for the entities whose
+        state and extra data did not change since, so only the changed
+        states are serialized again.
+        """
+        dumped_items = self._dumped_items
+        self._dumped_items = items = {}
+        current_states_by_entity_id = {
+            state.entity_id: state
+            for state in self.hass.states.async_all()
+            if not state.attributes.get(ATTR_RESTORED)
+        }
+
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            # Extra data can change without a state write
+            if (
+                (dumped := dumped_items.get(entity_id)) is not None
+                and dumped[0] is state
+                and dumped[1]["extra_data"] == extra_data_dict
+            ):
+                items[entity_id] = dumped
+                continue
+            # The last seen time of the states of the current entities is
+            # the time of the dump, leaving it out of the states keeps them
+            # unchanged between dumps unless the state or extra data changed
+            items[entity_id] = (
+                state,
+                {
+                    "id": entity_id,
+                    "state": state.json_fragment,
+                    "extra_data": extra_data_dict,
+                    "last_seen": None,
+                },
+            )
+
+        expiration_time = now - STATE_EXPIRATION
+        for entity_id, stored_state in self.last_states.items():
+            # Don't save old states that have entities in the current run
+            # or that have expired
+            if (
+                entity_id in current_states_by_entity_id
+                or stored_state.last_seen < expiration_time
+            ):
+                continue
+            dumped = dumped_items.get(entity_id)
+            if dumped is None or dumped[0] is not stored_state:
+                dumped = (stored_state, {"id": entity_id, **stored_state.as_dict()})
+            items[entity_id] = dumped
+
+        return [item for _, item in items.values()]
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        states = self._async_get_dump_items(now)
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save({"last_dump": now, "states": states})
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -0,0 +1,153 @@
+"""Record the startup of integrations to plan the next startup."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+import logging
+from typing import TypedDict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.loader import IntegrationNotLoaded, async_get_loaded_integration
+from homeassistant.setup import async_get_setup_start_times, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+from .storage import Store
+
+DATA_STARTUP_PROFILE: HassKey[StartupProfile] = HassKey("startup_profile")
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.startup_profile"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Components that took longer than this to import during the
+# previous startup are imported before their setup starts
+SLOW_IMPORT_THRESHOLD = 0.05
+
+
+class IntegrationStartupProfile(TypedDict):
+    """Startup profile of an integration.
+
+    Times are in seconds, start is relative to the
+    start of the first integration setup.
+    """
+
+    start: float
+    import_time: float
+    setup_time: float
+    dependencies: list[str]
+
+
+class StartupProfile:
+    """Startup profile of the previous and the current startup."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the startup profile."""
+        self._hass = hass
+        self._store = Store[dict[str, IntegrationStartupProfile]](
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self.previous: dict[str, IntegrationStartupProfile] = {}
+        self.current: dict[str, IntegrationStartupProfile] = {}
+        self.critical_path_times: dict[str, float] = {}
+        self.preimported: list[str] = []
+        # Monotonic time async_setup_hass started and
+        # seconds after it until the registries were loaded
+        self.setup_started: float | None = None
+        self.registries_loaded: float | None = None
+
+    async def async_load(self) -> None:
+        """Load the profile of the previous startup."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self.previous = data
+        self.critical_path_times = _critical_path_times(data)
+
+    @callback
+    def async_slow_imports(self, domains: Iterable[str]) -> list[str]:
+        """Return the domains that were slow to import, the slowest first."""
+        previous = self.previous
+        return sorted(
+            (
+                domain
+                for domain in domains
+                if (profile := previous.get(domain))
+                and profile["import_time"] >= SLOW_IMPORT_THRESHOLD
+            ),
+            key=lambda domain: previous[domain]["import_time"],
+            reverse=True,
+        )
+
+    @callback
+    def async_record(self) -> None:
+        """Record the profile of the integrations set up during startup."""
+        hass = self._hass
+        start_times = async_get_setup_start_times(hass)
+        if not start_times:
+            return
+        first_start = min(start_times.values())
+        setup_timings = async_get_setup_timings(hass)
+        current: dict[str, IntegrationStartupProfile] = {}
+        for domain, setup_time in setup_timings.items():
+            try:
+                integration = async_get_loaded_integration(hass, domain)
+            except IntegrationNotLoaded:
+                continue
+            if integration.all_dependencies_resolved:
+                dependencies = set(integration.all_dependencies)
+            else:
+                dependencies = set(integration.dependencies)
+            dependencies.update(integration.after_dependencies)
+            current[domain] = {
+                "start": round(start_times.get(domain, first_start) - first_start, 3),
+                "import_time": round(integration.component_import_time or 0, 3),
+                "setup_time": round(setup_time, 3),
+                "dependencies": sorted(dependencies.intersection(setup_timings)),
+            }
+        self.current = current
+        self._store.async_delay_save(lambda: self.current, SAVE_DELAY)
+        _LOGGER.debug("Recorded startup profile for %s integrations", len(current))
+
+
+def _critical_path_times(
+    profiles: dict[str, IntegrationStartupProfile],
+) -> dict[str, float]:
+    """Return the longest chain of import and setup time starting at each domain.
+
+    An integration delays the setup of everything that depends on it,
+    so the integrations with the longest chain should be started first.
+    """
+    dependants: defaultdict[str, list[str]] = defaultdict(list)
+    for domain, profile in profiles.items():
+        for dependency in profile["dependencies"]:
+            dependants[dependency].append(domain)
+
+    critical_path_times: dict[str, float] = {}
+
+    def _critical_path_time(domain: str) -> float:
+        if (known := critical_path_times.get(domain)) is not None:
+            return known
+        # Guard against dependency cycles
+        critical_path_times[domain] = 0.0
+        own_time = 0.0
+        if profile := profiles.get(domain):
+            own_time = profile["import_time"] + profile["setup_time"]
+        critical_path_times[domain] = own_time + max(
+            (_critical_path_time(dependant) for dependant in dependants[domain]),
+            default=0.0,
+        )
+        return critical_path_times[domain]
+
+    for domain in profiles:
+        _critical_path_time(domain)
+    return critical_path_times
+
+
+@callback
+@singleton(DATA_STARTUP_PROFILE)
+def async_get_startup_profile(hass: HomeAssistant) -> StartupProfile:
+    """Return the startup profile."""
+    return StartupProfile(hass)
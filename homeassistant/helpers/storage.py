@@ -8,6 +8,7 @@ from contextlib import suppress
 from copy import deepcopy
 from functools import cached_property
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
@@ -48,6 +49,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into a new snapshot once
+# it grows beyond this fraction of the snapshot size
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -114,13 +120,24 @@ class _StoreManager:
         self._invalidated: set[str] = set()
         self._files: set[str] | None = None
         self._data_preload: dict[str, json_util.JsonValueType] = {}
+        self._preloading: dict[str, asyncio.Future[None]] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
 
-    async def async_initialize(self) -> None:
-        """Initialize the storage manager."""
+    async def async_initialize(self, preload_keys: Iterable[str] = ()) -> None:
+        """Initialize the storage manager.
+
+        The preload keys are read in the same executor job that lists
+        the storage files, stores that load one of the keys meanwhile
+        wait for the job to finish.
+        """
         hass = self._hass
-        await hass.async_add_executor_job(self._initialize_files)
+        keys = set(preload_keys)
+        future = self._async_start_preload(keys)
+        try:
+            await hass.async_add_executor_job(self._initialize_files, keys)
+        finally:
+            self._async_finish_preload(keys, future)
         hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STARTED,
             self._async_schedule_cleanup,
@@ -203,10 +220,47 @@ class _StoreManager:
         self._data_preload.clear()
 
     async def async_preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
+        """Cache the keys.
+
+        All files are read in a single executor job, stores that
+        load one of the keys meanwhile wait for the job to finish.
+        """
         # If async_initialize has not been called yet, we can't preload
-        if self._files is not None and (existing := self._files.intersection(keys)):
+        if self._files is None or not (
+            existing := self._files.intersection(keys).difference(
+                self._preloading, self._data_preload
+            )
+        ):
+            return
+        future = self._async_start_preload(existing)
+        try:
             await self._hass.async_add_executor_job(self._preload, existing)
+        finally:
+            self._async_finish_preload(existing, future)
+
+    @callback
+    def _async_start_preload(self, keys: set[str]) -> asyncio.Future[None]:
+        """Mark the keys as being preloaded."""
+        preloading = self._preloading
+        future = self._hass.loop.create_future()
+        for key in keys:
+            preloading[key] = future
+        return future
+
+    @callback
+    def _async_finish_preload(
+        self, keys: set[str], future: asyncio.Future[None]
+    ) -> None:
+        """Mark the keys as preloaded and wake up the stores waiting for them."""
+        preloading = self._preloading
+        for key in keys:
+            preloading.pop(key, None)
+        future.set_result(None)
+
+    @callback
+    def async_get_preload(self, key: str) -> asyncio.Future[None] | None:
+        """Return a future that is done when the preload of the key finished."""
+        return self._preloading.get(key)
 
     def _preload(self, keys: Iterable[str]) -> None:
         """Cache the keys."""
@@ -220,10 +274,11 @@ class _StoreManager:
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
 
-    def _initialize_files(self) -> None:
-        """Initialize the cache."""
+    def _initialize_files(self, preload_keys: set[str]) -> None:
+        """Initialize the cache and cache the preload keys."""
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
+            self._preload(self._files.intersection(preload_keys))
 
 
 @bind_hass
@@ -241,8 +296,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        In journal mode, saves only append the changes since the previous
+        save to a journal file next to the snapshot, the journal is replayed
+        on load and compacted into the snapshot once it grows too large.
+        Items that are saved again as the same object are assumed to be
+        unchanged and are not serialized again, so changed items must be
+        replaced instead of changed in place.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +322,28 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # What the snapshot and journal on disk contain, only
+        # accessed from the executor while loading or writing
+        self._journal_generation = 0
+        self._journal_version: tuple[int, int] | None = None
+        self._journal_index: _JournalIndex | None = None
+        # The items of the previous write with their id and serialized
+        # form, keyed by the id of the item object
+        self._journal_items: dict[int, tuple[Any, tuple[Any, bytes] | None]] = {}
+        self._journal_size = 0
+        self._snapshot_size = 0
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -310,6 +390,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
     async def _async_load_data(self):
         """Load the data."""
+        # Wait for a bulk preload that is reading the file
+        if (preload := self._manager.async_get_preload(self.key)) is not None:
+            await asyncio.shield(preload)
+
         # Check if we have a pending write
         if self._data is not None:
             data = self._data
@@ -325,6 +409,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -386,6 +474,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -551,6 +643,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            self._write_journal(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +656,172 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal to the loaded snapshot."""
+        generation = data.get("journal_generation", 0)
+        stored = data.get("data")
+        journal_size = 0
+        truncated = False
+        try:
+            with open(self.journal_path, "rb") as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json_util.json_loads_object(line)
+                    except json_util.JSON_DECODE_EXCEPTIONS:
+                        # The write of the last record was cut short, everything
+                        # before it has been written completely
+                        _LOGGER.warning(
+                            "Ignoring incomplete journal record for %s", self.key
+                        )
+                        truncated = True
+                        break
+                    journal_size += len(line)
+                    if not line.endswith(b"\n"):
+                        truncated = True
+                    # Records of an older generation have already been
+                    # compacted into the snapshot
+                    if record["generation"] == generation and isinstance(stored, dict):
+                        _apply_journal_changes(stored, record["changes"])
+        except FileNotFoundError:
+            pass
+
+        self._journal_generation = generation
+        self._journal_version = (data["version"], data.get("minor_version", 1))
+        # Write a new snapshot on the next save if the journal is
+        # damaged so records are never appended after a partial one
+        self._journal_index = (
+            None
+            if truncated
+            else _journal_index(stored, self._journal_dumps, self._journal_item)
+        )
+        self._journal_items = {}
+        self._journal_size = journal_size
+        with suppress(OSError):
+            self._snapshot_size = os.path.getsize(self.path)
+        return data
+
+    def _journal_dumps(self, value: Any) -> bytes:
+        """Serialize a journaled value with the encoder of the store."""
+        encoder = self._encoder
+        try:
+            if encoder and encoder is not json_helper.JSONEncoder:
+                # Same as save_json, custom encoders need the slow path
+                return json.dumps(value, cls=encoder, separators=(",", ":")).encode()
+            return json_helper.json_bytes(value)
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {self.journal_path}"
+            ) from err
+
+    def _journal_item(self, item: Any) -> tuple[Any, bytes] | None:
+        """Return the id and the serialized item of a list item with an id.
+
+        Items are dicts or json fragments, like the storage fragments of
+        the registries, which are parsed to find their id.
+        """
+        if isinstance(item, dict):
+            if not isinstance(item_id := item.get("id"), (str, int)):
+                return None
+            return (item_id, self._journal_dumps(item))
+        if not isinstance(item, json_helper.json_fragment):
+            return None
+        serialized = json_helper.json_bytes(item)
+        try:
+            parsed = json_util.json_loads(serialized)
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            return None
+        if not isinstance(parsed, dict) or not isinstance(
+            item_id := parsed.get("id"), (str, int)
+        ):
+            return None
+        return (item_id, serialized)
+
+    def _write_journal(self, path: str, data: dict) -> None:
+        """Append the changes since the previous write to the journal."""
+        previous_items = self._journal_items
+        items: dict[int, tuple[Any, tuple[Any, bytes] | None]] = {}
+
+        def _cached_journal_item(item: Any) -> tuple[Any, bytes] | None:
+            """Serialize an item unless it was saved before as the same object."""
+            previous = previous_items.get(id(item))
+            if previous is not None and previous[0] is item:
+                journal_item = previous[1]
+            else:
+                journal_item = self._journal_item(item)
+            items[id(item)] = (item, journal_item)
+            return journal_item
+
+        index = _journal_index(data["data"], self._journal_dumps, _cached_journal_item)
+        self._journal_items = items
+        version = (data["version"], data["minor_version"])
+        if (
+            index is None
+            or (old_index := self._journal_index) is None
+            or version != self._journal_version
+        ):
+            self._write_journal_snapshot(path, data, index, version)
+            return
+
+        if not (changes := _journal_changes(old_index, index)):
+            _LOGGER.debug("No changes to write for %s", self.key)
+            return
+
+        record = (
+            json_helper.json_bytes(
+                {"generation": self._journal_generation, "changes": changes}
+            )
+            + b"\n"
+        )
+        journal_size = self._journal_size + len(record)
+        if journal_size > self._snapshot_size * JOURNAL_COMPACT_RATIO:
+            self._write_journal_snapshot(path, data, index, version)
+            return
+
+        _LOGGER.debug("Appending %s changes for %s to %s", len(changes), self.key, path)
+        fd = os.open(
+            self.journal_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o600 if self._private else 0o644,
+        )
+        try:
+            os.write(fd, record)
+            if self._atomic_writes:
+                os.fsync(fd)
+        except OSError as err:
+            raise WriteError(err) from err
+        finally:
+            os.close(fd)
+        self._journal_index = index
+        self._journal_size = journal_size
+
+    def _write_journal_snapshot(
+        self,
+        path: str,
+        data: dict,
+        index: _JournalIndex | None,
+        version: tuple[int, int],
+    ) -> None:
+        """Write a full snapshot and start a new journal generation."""
+        generation = self._journal_generation + 1
+        data["journal_generation"] = generation
+        _LOGGER.debug("Writing snapshot for %s to %s", self.key, path)
+        json_helper.save_json(
+            path,
+            data,
+            self._private,
+            encoder=self._encoder,
+            atomic_writes=self._atomic_writes,
+        )
+        # The old records no longer match the generation
+        # of the snapshot, removing them only saves space
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_generation = generation
+        self._journal_version = version
+        self._journal_index = index
+        self._journal_size = 0
+        self._snapshot_size = os.path.getsize(path)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +834,85 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+        self._journal_index = None
+
+
+type _JournalIndex = dict[str, bytes | dict[Any, bytes]]
+
+
+def _journal_index(
+    data: Any,
+    dumps: Callable[[Any], bytes],
+    journal_item: Callable[[Any], tuple[Any, bytes] | None],
+) -> _JournalIndex | None:
+    """Index the serialized data to find the changes to journal.
+
+    Lists of items with a unique id are indexed per item so only
+    the changed items are journaled, other values are journaled whole.
+    """
+    if not isinstance(data, dict):
+        return None
+    index: _JournalIndex = {}
+    for key, value in data.items():
+        if isinstance(value, list) and value:
+            items: dict[Any, bytes] = {}
+            for item in value:
+                if (id_and_item := journal_item(item)) is None:
+                    break
+                items[id_and_item[0]] = id_and_item[1]
+            else:
+                if len(items) == len(value):
+                    index[key] = items
+                    continue
+        index[key] = dumps(value)
+    return index
+
+
+def _journal_changes(old: _JournalIndex, new: _JournalIndex) -> list[dict[str, Any]]:
+    """Return the changes between two indexes."""
+    changes: list[dict[str, Any]] = []
+    for key, value in new.items():
+        old_value = old.get(key)
+        if isinstance(value, bytes):
+            if value != old_value:
+                changes.append({"key": key, "value": json_helper.json_fragment(value)})
+        elif not isinstance(old_value, dict):
+            changes.append(
+                {
+                    "key": key,
+                    "value": json_helper.json_fragment(
+                        b"[" + b",".join(value.values()) + b"]"
+                    ),
+                }
+            )
+        else:
+            updated = [
+                json_helper.json_fragment(item)
+                for item_id, item in value.items()
+                if old_value.get(item_id) != item
+            ]
+            removed = [item_id for item_id in old_value if item_id not in value]
+            if updated or removed:
+                changes.append({"key": key, "set": updated, "remove": removed})
+    changes.extend({"key": key, "delete": True} for key in old if key not in new)
+    return changes
+
+
+def _apply_journal_changes(data: dict[str, Any], changes: list[dict[str, Any]]) -> None:
+    """Apply journaled changes to the data."""
+    for change in changes:
+        key = change["key"]
+        if "value" in change:
+            data[key] = change["value"]
+        elif change.get("delete"):
+            data.pop(key, None)
+        else:
+            items = {item["id"]: item for item in data.get(key, ())}
+            for item_id in change["remove"]:
+                items.pop(item_id, None)
+            for item in change["set"]:
+                items[item["id"]] = item
+            data[key] = list(items.values())
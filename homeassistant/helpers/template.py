@@ -9,11 +9,13 @@ import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
+from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -21,14 +23,15 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
-from types import CodeType, TracebackType
+from types import CodeType, NoneType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
+from jinja2.defaults import DEFAULT_FILTERS, DEFAULT_NAMESPACE, DEFAULT_TESTS
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -98,6 +101,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_RENDER_CACHE = "template.render_cache"
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -147,6 +151,127 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+RENDER_CACHE_SIZE = 1024
+
+# Globals, filters and tests that only depend on their arguments and the
+# states they collect. Renders using anything else, like the time, the
+# time zone, registries, randomness, configuration or translations, are
+# never reused.
+_RENDER_CACHE_PURE_NAMES = frozenset(
+    {
+        "acos",
+        "add",
+        "as_datetime",
+        "as_timedelta",
+        "asin",
+        "atan",
+        "atan2",
+        "average",
+        "base64_decode",
+        "base64_encode",
+        "bitwise_and",
+        "bitwise_or",
+        "bitwise_xor",
+        "bool",
+        "contains",
+        "cos",
+        "datetime",
+        "e",
+        "expand",
+        "float",
+        "from_json",
+        "has_value",
+        "iif",
+        "int",
+        "is_defined",
+        "is_number",
+        "is_state",
+        "is_state_attr",
+        "list",
+        "log",
+        "loop",
+        "match",
+        "max",
+        "median",
+        "min",
+        "multiply",
+        "ord",
+        "ordinal",
+        "pack",
+        "pi",
+        "regex_findall",
+        "regex_findall_index",
+        "regex_match",
+        "regex_replace",
+        "regex_search",
+        "round",
+        "search",
+        "set",
+        "sin",
+        "slugify",
+        "sqrt",
+        "state_attr",
+        "states",
+        "statistical_mode",
+        "string_like",
+        "strptime",
+        "tan",
+        "tau",
+        "timedelta",
+        "timestamp_utc",
+        "to_json",
+        "tuple",
+        "unpack",
+        "urlencode",
+        "version",
+    }
+    # The builtins of Jinja, except the random ones
+    | (DEFAULT_FILTERS.keys() - {"random"})
+    | DEFAULT_TESTS.keys()
+    | (DEFAULT_NAMESPACE.keys() - {"lipsum"})
+)
+# Attributes of template states that depend on the entity registry
+_RENDER_CACHE_UNSAFE_ATTRIBUTES = frozenset({"format_state", "state_with_unit"})
+
+# Globals and filters the native fast path calls directly, they only
+# depend on their arguments and the state machine.
+_FAST_RENDER_GLOBALS = frozenset(
+    {
+        "bool",
+        "float",
+        "has_value",
+        "int",
+        "is_state",
+        "is_state_attr",
+        "state_attr",
+        "states",
+    }
+)
+_FAST_RENDER_FILTERS = frozenset(
+    {"abs", "bool", "float", "int", "lower", "round", "upper"}
+)
+_FAST_RENDER_BINOPS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+}
+_FAST_RENDER_UNARYOPS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Not: operator.not_,
+    nodes.Neg: operator.neg,
+    nodes.Pos: operator.pos,
+}
+_FAST_RENDER_COMPARE_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -373,6 +498,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "_log_messages",
     )
 
     def __init__(self, template: Template) -> None:
@@ -391,6 +517,8 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        # Messages of undefined variables logged while rendering
+        self._log_messages: list[tuple[int, str]] = []
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -475,6 +603,350 @@ class RenderInfo:
         else:
             self.filter = _false
 
+    def _copy_for(self, template: Template) -> RenderInfo:
+        """Return a copy of the frozen render info for another render."""
+        render_info = RenderInfo(template)
+        result = self._result
+        if not isinstance(result, (str, int, float, bool, NoneType)):
+            # Native types may be changed by whoever uses the result
+            result = deepcopy(result)
+        render_info._result = result  # noqa: SLF001
+        render_info.entities = set(self.entities)
+        render_info.rate_limit = self.rate_limit
+        render_info._log_messages = list(self._log_messages)  # noqa: SLF001
+        render_info._freeze()  # noqa: SLF001
+        return render_info
+
+
+class RenderInfoCache:
+    """LRU cache of template renders.
+
+    A render is reused until one of the entities it collected changes
+    state. Only renders that do not depend on all states, domains, time
+    or anything else than the states of their entities are cached.
+    """
+
+    __slots__ = ("_hass", "_cache", "hits", "misses")
+
+    def __init__(self, hass: HomeAssistant, size: int = RENDER_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._cache: LRU[
+            tuple[Any, ...], tuple[tuple[tuple[str, State | None], ...], RenderInfo]
+        ] = LRU(size)
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_get(self, key: tuple[Any, ...], template: Template) -> RenderInfo | None:
+        """Return a copy of the cached render info if its states did not change."""
+        if (cached := self._cache.get(key)) is None:
+            self.misses += 1
+            return None
+        versions, render_info = cached
+        states = self._hass.states
+        for entity_id, state in versions:
+            # State objects are replaced when the state or the attributes
+            # change, comparing them is exact even if last_updated is not.
+            if states.get(entity_id) is not state:
+                del self._cache[key]
+                self.misses += 1
+                return None
+        self.hits += 1
+        return render_info._copy_for(template)  # noqa: SLF001
+
+    @callback
+    def async_set(self, key: tuple[Any, ...], render_info: RenderInfo) -> None:
+        """Cache the render info if it only depends on the states of its entities."""
+        if (
+            render_info.exception
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+            or render_info.has_time
+        ):
+            return
+        states = self._hass.states
+        self._cache[key] = (
+            tuple(
+                (entity_id, states.get(entity_id)) for entity_id in render_info.entities
+            ),
+            # The render info is returned as well, so it may be changed
+            render_info._copy_for(render_info.template),  # noqa: SLF001
+        )
+
+
+@singleton(_RENDER_CACHE)
+@callback
+def async_get_render_info_cache(hass: HomeAssistant) -> RenderInfoCache:
+    """Return the template render cache."""
+    return RenderInfoCache(hass)
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _render_cache_names(template: str) -> tuple[tuple[str, ...], frozenset[str]] | None:
+    """Return the names a template loads and the names it assigns itself.
+
+    Returns None if renders of the template can not be reused.
+    """
+    try:
+        ast = _NO_HASS_ENV.parse(template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if ast.find((nodes.Import, nodes.FromImport, nodes.Include, nodes.Extends)):
+        return None
+    for node in ast.find_all((nodes.Filter, nodes.Test)):
+        if node.name not in _RENDER_CACHE_PURE_NAMES:
+            return None
+    for node in ast.find_all((nodes.Call, nodes.Filter)):
+        # Rounding the state depends on the entity registry
+        if isinstance(node, nodes.Filter):
+            is_states, args = node.name == "states", len(node.args)
+        else:
+            is_states = isinstance(node.node, nodes.Name) and node.node.name == "states"
+            args = len(node.args) - 1
+        if is_states and (args > 0 or node.kwargs or node.dyn_args or node.dyn_kwargs):
+            return None
+    for node in ast.find_all(nodes.Getattr):
+        if node.attr in _RENDER_CACHE_UNSAFE_ATTRIBUTES:
+            return None
+    for node in ast.find_all(nodes.Const):
+        if node.value in _RENDER_CACHE_UNSAFE_ATTRIBUTES:
+            return None
+    loaded: set[str] = set()
+    assigned: set[str] = set()
+    for node in ast.find_all(nodes.Name):
+        (loaded if node.ctx == "load" else assigned).add(node.name)
+    return tuple(sorted(loaded)), frozenset(assigned)
+
+
+def _render_cache_key(
+    template: Template, variables: TemplateVarsType, strict: bool
+) -> tuple[Any, ...] | None:
+    """Return the key to cache a render of the template, None if not cacheable."""
+    if (names := _render_cache_names(template.template)) is None:
+        return None
+    loaded, assigned = names
+    key: list[Any] = [template.template, strict]
+    for name in loaded:
+        if variables is None or name not in variables:
+            if name not in _RENDER_CACHE_PURE_NAMES and name not in assigned:
+                return None
+            continue
+        value = variables[name]
+        if isinstance(value, TemplateStateFromEntityId):
+            # Its state is collected when it is used
+            key.append((name, TemplateStateFromEntityId, value.entity_id))
+        elif value is None or type(value) in (str, int, float, bool):
+            key.append((name, value))
+        else:
+            return None
+    return tuple(key)
+
+
+class _FastRenderFallback(Exception):
+    """Raised when a template has to be rendered by Jinja."""
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _fast_render_nodes(template: str) -> tuple[nodes.Node, ...] | None:
+    """Return the output nodes of a template made of a single output block."""
+    try:
+        ast = _NO_HASS_ENV.parse(template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if len(ast.body) != 1 or not isinstance(output := ast.body[0], nodes.Output):
+        return None
+    return tuple(output.nodes)
+
+
+type _FastRenderExpr = Callable[[], Any]
+
+
+class _FastRenderCompiler:
+    """Compile a safe subset of template expressions to Python closures.
+
+    The closures do exactly what the code Jinja generates for the same
+    nodes does in the sandbox: globals are called through the context,
+    filters, attribute and item access go through the environment. Nodes
+    outside of the subset raise _FastRenderFallback while compiling and
+    the template is rendered by Jinja instead, errors while rendering are
+    raised as Jinja would raise them.
+    """
+
+    __slots__ = ("_context", "_env", "names")
+
+    def __init__(
+        self, env: TemplateEnvironment, context: jinja2.runtime.Context
+    ) -> None:
+        """Initialize the compiler."""
+        self._env = env
+        # Globals are only called with it, it never holds variables
+        self._context = context
+        self.names: set[str] = set()
+
+    def compile(self, output_nodes: tuple[nodes.Node, ...]) -> Callable[[], str]:
+        """Compile the output nodes of a template to a render function."""
+        parts = [self._compile_output(node) for node in output_nodes]
+        if len(parts) == 1:
+            return parts[0]
+
+        def _render() -> str:
+            return "".join([part() for part in parts])
+
+        return _render
+
+    def _compile_output(self, node: nodes.Node) -> Callable[[], str]:
+        """Compile a node of an output block."""
+        if isinstance(node, nodes.TemplateData):
+            data = node.data
+            return lambda: data
+        expr = self._compile(node)
+        return lambda: str(expr())
+
+    def _compile(self, node: nodes.Node) -> _FastRenderExpr:
+        """Compile an expression node."""
+        if (binop := _FAST_RENDER_BINOPS.get(type(node))) is not None:
+            return self._compile_binop(binop, cast(nodes.BinExpr, node))
+        if (unaryop := _FAST_RENDER_UNARYOPS.get(type(node))) is not None:
+            operand = self._compile(cast(nodes.UnaryExpr, node).node)
+            return lambda: unaryop(operand())
+        if (
+            compile_node := getattr(self, f"_compile_{type(node).__name__}", None)
+        ) is None:
+            raise _FastRenderFallback(f"Unsupported node {type(node).__name__}")
+        return cast(_FastRenderExpr, compile_node(node))
+
+    def _compile_binop(
+        self, binop: Callable[[Any, Any], Any], node: nodes.BinExpr
+    ) -> _FastRenderExpr:
+        left = self._compile(node.left)
+        right = self._compile(node.right)
+        return lambda: binop(left(), right())
+
+    def _compile_args(self, node: nodes.Call | nodes.Filter) -> list[_FastRenderExpr]:
+        if node.kwargs or node.dyn_args or node.dyn_kwargs:
+            raise _FastRenderFallback("Keyword and dynamic arguments")
+        return [self._compile(arg) for arg in node.args]
+
+    def _compile_Const(self, node: nodes.Const) -> _FastRenderExpr:
+        value = node.value
+        return lambda: value
+
+    def _compile_Name(self, node: nodes.Name) -> _FastRenderExpr:
+        name = node.name
+        if (
+            node.ctx != "load"
+            or name not in _FAST_RENDER_GLOBALS
+            or name not in self._env.globals
+        ):
+            raise _FastRenderFallback(f"Unsupported name {name}")
+        self.names.add(name)
+        value = self._env.globals[name]
+        return lambda: value
+
+    def _compile_Call(self, node: nodes.Call) -> _FastRenderExpr:
+        if not isinstance(node.node, nodes.Name):
+            raise _FastRenderFallback("Only globals can be called")
+        self._compile_Name(node.node)
+        func = self._env.globals[node.node.name]
+        if not self._env.is_safe_callable(func):
+            raise _FastRenderFallback(f"Unsafe callable {node.node.name}")
+        call = self._context.call
+        args = self._compile_args(node)
+        if len(args) == 1:
+            arg = args[0]
+            return lambda: call(func, arg())
+        return lambda: call(func, *[arg() for arg in args])
+
+    def _compile_Filter(self, node: nodes.Filter) -> _FastRenderExpr:
+        if (
+            node.node is None
+            or node.name not in _FAST_RENDER_FILTERS
+            or node.name not in self._env.filters
+        ):
+            raise _FastRenderFallback(f"Unsupported filter {node.name}")
+        name = node.name
+        call_filter = self._env.call_filter
+        context = self._context
+        value = self._compile(node.node)
+        args = self._compile_args(node)
+        return lambda: call_filter(
+            name, value(), [arg() for arg in args], context=context
+        )
+
+    def _compile_And(self, node: nodes.And) -> _FastRenderExpr:
+        left = self._compile(node.left)
+        right = self._compile(node.right)
+        return lambda: left() and right()
+
+    def _compile_Or(self, node: nodes.Or) -> _FastRenderExpr:
+        left = self._compile(node.left)
+        right = self._compile(node.right)
+        return lambda: left() or right()
+
+    def _compile_Compare(self, node: nodes.Compare) -> _FastRenderExpr:
+        expr = self._compile(node.expr)
+        ops: list[tuple[Callable[[Any, Any], Any], _FastRenderExpr]] = []
+        for operand in node.ops:
+            if (compare := _FAST_RENDER_COMPARE_OPS.get(operand.op)) is None:
+                raise _FastRenderFallback(f"Unsupported operator {operand.op}")
+            ops.append((compare, self._compile(operand.expr)))
+        if len(ops) == 1:
+            compare, right = ops[0]
+            return lambda: compare(expr(), right())
+
+        def _compare_chain() -> Any:
+            # Same semantics as a chained comparison in Python
+            left = expr()
+            for compare, right in ops:
+                value = right()
+                if not (result := compare(left, value)):
+                    return result
+                left = value
+            return result
+
+        return _compare_chain
+
+    def _compile_CondExpr(self, node: nodes.CondExpr) -> _FastRenderExpr:
+        if node.expr2 is None:
+            raise _FastRenderFallback("Conditional expression without else")
+        test = self._compile(node.test)
+        expr1 = self._compile(node.expr1)
+        expr2 = self._compile(node.expr2)
+        return lambda: expr1() if test() else expr2()
+
+    def _compile_Concat(self, node: nodes.Concat) -> _FastRenderExpr:
+        parts = [self._compile(part) for part in node.nodes]
+        return lambda: "".join([str(part()) for part in parts])
+
+    def _compile_List(self, node: nodes.List) -> _FastRenderExpr:
+        items = [self._compile(item) for item in node.items]
+        return lambda: [item() for item in items]
+
+    def _compile_Tuple(self, node: nodes.Tuple) -> _FastRenderExpr:
+        if node.ctx != "load":
+            raise _FastRenderFallback("Tuple assignment")
+        items = [self._compile(item) for item in node.items]
+        return lambda: tuple([item() for item in items])
+
+    def _compile_Getattr(self, node: nodes.Getattr) -> _FastRenderExpr:
+        if node.ctx != "load":
+            raise _FastRenderFallback("Attribute assignment")
+        obj = self._compile(node.node)
+        attr = node.attr
+        env_getattr = self._env.getattr
+        return lambda: env_getattr(obj(), attr)
+
+    def _compile_Getitem(self, node: nodes.Getitem) -> _FastRenderExpr:
+        if node.ctx != "load" or isinstance(node.arg, nodes.Slice):
+            raise _FastRenderFallback("Unsupported item access")
+        obj = self._compile(node.node)
+        arg = self._compile(node.arg)
+        env_getitem = self._env.getitem
+        return lambda: env_getitem(obj(), arg())
+
 
 class Template:
     """Class to hold a template and manage caching and rendering."""
@@ -492,6 +964,8 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_fast_render",
+        "_fast_render_names",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -510,6 +984,8 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._fast_render: Callable[[], str] | None = None
+        self._fast_render_names: frozenset[str] = frozenset()
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -600,7 +1076,14 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_render := self._fast_render) is not None and (
+                not kwargs or self._fast_render_names.isdisjoint(kwargs)
+            ):
+                with _template_context_manager as cm:
+                    cm.set_template(self.template, "rendering")
+                    render_result = fast_render()
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -710,6 +1193,19 @@ class Template:
             render_info._freeze_static()  # noqa: SLF001
             return render_info
 
+        render_cache: RenderInfoCache | None = None
+        if (
+            not kwargs
+            and (cache_key := _render_cache_key(self, variables, strict)) is not None
+        ):
+            render_cache = async_get_render_info_cache(self.hass)
+            if cached_render_info := render_cache.async_get(cache_key, self):
+                # Log the undefined variables as if it was rendered again
+                log = log_fn or _log_with_logger
+                for level, msg in cached_render_info._log_messages:  # noqa: SLF001
+                    log(level, msg)
+                return cached_render_info
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(  # noqa: SLF001
@@ -721,6 +1217,8 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()  # noqa: SLF001
+        if render_cache is not None:
+            render_cache.async_set(cache_key, render_info)
         return render_info
 
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
@@ -817,6 +1315,16 @@ class Template:
             env, self._compiled_code, env.globals, None
         )
 
+        self._fast_render = None
+        if not limited and (output_nodes := _fast_render_nodes(self.template)):
+            compiler = _FastRenderCompiler(env, self._compiled.new_context())
+            try:
+                self._fast_render = compiler.compile(output_nodes)
+            except _FastRenderFallback:
+                pass
+            else:
+                self._fast_render_names = frozenset(compiler.names)
+
         return self._compiled
 
     def __eq__(self, other):
@@ -2638,6 +3146,19 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _log_with_logger(level: int, msg: str) -> None:
+    """Log a message about an undefined variable."""
+    template, action = template_cv.get() or ("", "rendering or compiling")
+    _LOGGER.log(
+        level,
+        "Template variable %s: %s when %s '%s'",
+        logging.getLevelName(level).lower(),
+        msg,
+        action,
+        template,
+    )
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2646,23 +3167,17 @@ def make_logging_undefined(
     if strict:
         return jinja2.StrictUndefined
 
-    def _log_with_logger(level: int, msg: str) -> None:
-        template, action = template_cv.get() or ("", "rendering or compiling")
-        _LOGGER.log(
-            level,
-            "Template variable %s: %s when %s '%s'",
-            logging.getLevelName(level).lower(),
-            msg,
-            action,
-            template,
-        )
-
     _log_fn = log_fn or _log_with_logger
 
     class LoggingUndefined(jinja2.Undefined):
         """Log on undefined variables."""
 
         def _log_message(self) -> None:
+            if (render_info := _render_info.get()) is not None:
+                # Logged again when the render is reused
+                render_info._log_messages.append(  # noqa: SLF001
+                    (logging.WARNING, self._undefined_message)
+                )
             _log_fn(logging.WARNING, self._undefined_message)
 
         def _fail_with_undefined_error(self, *args, **kwargs):
@@ -5,6 +5,9 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from contextlib import nullcontext
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
@@ -29,6 +32,8 @@ from homeassistant.util.dt import utcnow
 
 from . import entity, event
 from .debounce import Debouncer
+from .polling import async_get_polling_scheduler
+from .typing import UNDEFINED
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
@@ -45,6 +50,26 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class _ListenerSelection:
+    """The data a listener was last notified with."""
+
+    selector: Callable[[Any], Any]
+    data: Any = UNDEFINED
+    last_update_success: bool | None = None
+
+    def changed(self, data: Any, last_update_success: bool) -> bool:
+        """Return if the selected data or the update success changed."""
+        selected = self.selector(data)
+        if selected == self.data and last_update_success == self.last_update_success:
+            return False
+        # Keep a copy since coordinators often change their data in place,
+        # which would otherwise make the selected data compare to itself.
+        self.data = deepcopy(selected)
+        self.last_update_success = last_update_success
+        return True
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -101,7 +126,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         )
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        self._listener_selections: dict[CALLBACK_TYPE, _ListenerSelection] = {}
+        # How often listeners were notified and how often they were
+        # skipped because the data they select did not change
+        self.listener_notifications = 0
+        self.listener_skips = 0
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._first_refresh_scheduled = False
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
@@ -141,19 +172,34 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_add_listener(
-        self, update_callback: CALLBACK_TYPE, context: Any = None
+        self,
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,
+        data_selector: Callable[[_DataT], Any] | None = None,
     ) -> Callable[[], None]:
-        """Listen for data updates."""
+        """Listen for data updates.
+
+        If a data_selector is given, the listener is only called when the
+        value it selects from the data, or the success of the last update,
+        changed since the listener was last called. A copy of the selected
+        value is compared with the next one, so the data may be changed in
+        place.
+        """
         schedule_refresh = not self._listeners
 
         @callback
         def remove_listener() -> None:
             """Remove update listener."""
             self._listeners.pop(remove_listener)
+            self._listener_selections.pop(remove_listener, None)
             if not self._listeners:
                 self._unschedule_refresh()
 
         self._listeners[remove_listener] = (update_callback, context)
+        if data_selector is not None:
+            self._listener_selections[remove_listener] = _ListenerSelection(
+                data_selector
+            )
 
         # This is the first listener, set up interval.
         if schedule_refresh:
@@ -164,7 +210,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
+        if not (selections := self._listener_selections):
+            self.listener_notifications += len(self._listeners)
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+
+        data = self.data
+        last_update_success = self.last_update_success
+        for remove_listener, (update_callback, _) in list(self._listeners.items()):
+            if (
+                selection := selections.get(remove_listener)
+            ) is not None and not selection.changed(data, last_update_success):
+                self.listener_skips += 1
+                continue
+            self.listener_notifications += 1
             update_callback()
 
     async def async_shutdown(self) -> None:
@@ -173,6 +233,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
+        async_get_polling_scheduler(self.hass).async_unregister(self)
 
     @callback
     def _unschedule_refresh(self) -> None:
@@ -228,9 +289,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
+        delay = self._update_interval_seconds
+        if not self._first_refresh_scheduled:
+            # Spread the first refresh so the coordinators that are set
+            # up at the same time do not all refresh at the same time
+            self._first_refresh_scheduled = True
+            delay = async_get_polling_scheduler(hass).async_delay(self._poll_key, delay)
+        next_refresh = int(loop.time()) + self._microsecond + delay
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
@@ -252,10 +317,37 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 eager_start=True,
             )
 
+    @cached_property
+    def _poll_key(self) -> str:
+        """Return the key the polls of the coordinator are spread by."""
+        if self.config_entry:
+            return f"{self.config_entry.entry_id} {self.name}"
+        return self.name
+
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        if self._update_interval_seconds is None:
+            await self._async_refresh(log_failures=True, scheduled=True)
+            return
+
+        scheduler = async_get_polling_scheduler(self.hass)
+        integration = self.config_entry.domain if self.config_entry else None
+        stats = scheduler.async_register(
+            self,
+            self.name,
+            integration,
+            self._update_interval_seconds,
+            self.config_entry,
+        )
+        # Scheduled refreshes of the same integration share
+        # a budget so they do not all hit the device at once
+        async with (
+            scheduler.async_budget(integration) if integration else nullcontext()
+        ):
+            start = monotonic()
+            await self._async_refresh(log_failures=True, scheduled=True)
+        stats.async_record(monotonic() - start)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -521,10 +613,13 @@ class BaseCoordinatorEntity[
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(
-                self._handle_coordinator_update, self.coordinator_context
-            )
+        self.async_on_remove(self._async_add_coordinator_listener())
+
+    @callback
+    def _async_add_coordinator_listener(self) -> CALLBACK_TYPE:
+        """Listen for updates of the coordinator."""
+        return self.coordinator.async_add_listener(
+            self._handle_coordinator_update, self.coordinator_context
         )
 
     @callback
@@ -554,6 +649,21 @@ class CoordinatorEntity(BaseCoordinatorEntity[_DataUpdateCoordinatorT]):
         """
         super().__init__(coordinator, context)
 
+    # Entities can set this to a method that selects the part of the data
+    # of the coordinator they use, to only be updated when that part changed.
+    _coordinator_data_selector: Callable[[Any], Any] | None = None
+
+    @callback
+    def _async_add_coordinator_listener(self) -> CALLBACK_TYPE:
+        """Listen for updates of the coordinator."""
+        if self._coordinator_data_selector is None:
+            return super()._async_add_coordinator_listener()
+        return self.coordinator.async_add_listener(
+            self._handle_coordinator_update,
+            self.coordinator_context,
+            self._coordinator_data_selector,
+        )
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
+from copy import deepcopy
 from dataclasses import dataclass
 import functools as ft
 from functools import cached_property
@@ -16,6 +17,7 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
 import time
 from types import ModuleType
@@ -132,6 +134,12 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_INDEX: HassKey[_ManifestIndex | asyncio.Future[_ManifestIndex]] = HassKey(
+    "manifest_index"
+)
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -312,6 +320,7 @@ async def _async_get_custom_components(
         hass,
         custom_components,
         [comp.name for comp in dirs],
+        await _async_get_manifest_index(hass),
     )
     return {
         integration.domain: integration
@@ -656,33 +665,30 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: _ManifestIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            if manifest_index is None:
+                manifest_and_files = _read_manifest(manifest_path)
+            else:
+                manifest_and_files = manifest_index.read_manifest(manifest_path)
+            if manifest_and_files is None:
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            manifest, top_level_files = manifest_and_files
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
-                file_path,
+                manifest_path.parent,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -776,6 +782,7 @@ class Integration:
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
         self._top_level_files = top_level_files or set()
+        self.component_import_time: float | None = None
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @cached_property
@@ -1062,6 +1069,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1082,6 +1090,7 @@ class Integration:
                 with suppress(ImportError):
                     self.get_platform(platform_name)
 
+        self.component_import_time = time.perf_counter() - start
         return cache[domain]
 
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
@@ -1314,14 +1323,151 @@ def _version_blocked(
     return True
 
 
+def _read_manifest(
+    manifest_path: pathlib.Path,
+) -> tuple[Manifest, set[str] | None] | None:
+    """Read a manifest and list the top level files of its integration."""
+    if not manifest_path.is_file():
+        return None
+
+    try:
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+    except JSON_DECODE_EXCEPTIONS as err:
+        _LOGGER.error("Error parsing manifest.json file at %s: %s", manifest_path, err)
+        return None
+
+    # Avoid the listdir for virtual integrations
+    # as they cannot have any platforms
+    if manifest.get("integration_type") == "virtual":
+        return manifest, None
+    return manifest, set(os.listdir(manifest_path.parent))
+
+
+class _ManifestIndexEntry(TypedDict):
+    """An indexed manifest.
+
+    The fingerprint is the modification time and size of the
+    manifest and the modification time of its directory.
+    """
+
+    fingerprint: list[int]
+    manifest: Manifest
+    top_level_files: list[str] | None
+
+
+class _ManifestIndex:
+    """Index of the custom integration manifests of the previous startup.
+
+    The manifest and the listing of the integration directory are
+    only read again when the manifest or the directory changed.
+    Built-in integrations are not indexed since they only change
+    with an upgrade and are read from the package.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest index."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._hass = hass
+        self._store = Store[dict[str, _ManifestIndexEntry]](
+            hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+        )
+        self._entries: dict[str, _ManifestIndexEntry] = {}
+        self._used: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the manifest index."""
+        if (data := await self._store.async_load()) is not None:
+            self._entries = data
+
+    def read_manifest(
+        self, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Read a manifest from the index or from disk if it changed.
+
+        This method is called from the executor.
+        """
+        key = str(manifest_path)
+        try:
+            manifest_stat = manifest_path.stat()
+            dir_stat = manifest_path.parent.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(manifest_stat.st_mode):
+            return None
+
+        fingerprint = [
+            manifest_stat.st_mtime_ns,
+            manifest_stat.st_size,
+            dir_stat.st_mtime_ns,
+        ]
+        self._used.add(key)
+        if (entry := self._entries.get(key)) and entry["fingerprint"] == fingerprint:
+            top_level_files = entry["top_level_files"]
+            return (
+                # Integration adds is_built_in to the manifest
+                # and the caller may change the nested values
+                deepcopy(entry["manifest"]),
+                None if top_level_files is None else set(top_level_files),
+            )
+
+        if (manifest_and_files := _read_manifest(manifest_path)) is None:
+            return None
+        manifest, top_level_files = manifest_and_files
+        self._entries[key] = {
+            "fingerprint": fingerprint,
+            "manifest": deepcopy(manifest),
+            "top_level_files": None
+            if top_level_files is None
+            else sorted(top_level_files),
+        }
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+        return manifest_and_files
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the manifest index."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, _ManifestIndexEntry]:
+        """Return the entries of the manifests used since startup."""
+        entries = self._entries
+        return {key: entries[key] for key in self._used.copy() if key in entries}
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> _ManifestIndex:
+    """Return the loaded manifest index."""
+    index_or_future = hass.data.get(DATA_MANIFEST_INDEX)
+
+    if index_or_future is None:
+        future = hass.data[DATA_MANIFEST_INDEX] = hass.loop.create_future()
+        manifest_index = _ManifestIndex(hass)
+        await manifest_index.async_load()
+        hass.data[DATA_MANIFEST_INDEX] = manifest_index
+        future.set_result(manifest_index)
+        return manifest_index
+
+    if isinstance(index_or_future, asyncio.Future):
+        return await index_or_future
+
+    return index_or_future
+
+
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    manifest_index: _ManifestIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_index
+            )
         except Exception:
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -9,9 +9,15 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
+import zlib
 
 from homeassistant import core
+from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+from homeassistant.components.websocket_api.messages import cached_state_diff_message
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -19,6 +25,8 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.template import Template
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -312,6 +320,224 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_memory(hass):
+    """Report the bytes per entity for 15k entities in the state machine."""
+    entities_to_set = 15000
+
+    def _bytes_per_entity(memory_lean: bool) -> float:
+        states = core.StateMachine(hass.bus, hass.loop)
+        states.async_set_memory_lean(memory_lean)
+        tracemalloc.start()
+        for idx in range(entities_to_set):
+            # Integrations usually build the attributes from a decoded
+            # payload so every entity holds its own copy of each string.
+            attributes = json.loads(
+                json.dumps(
+                    {
+                        "friendly_name": f"Power {idx}",
+                        "unit_of_measurement": "W",
+                        "device_class": "power",
+                        "state_class": "measurement",
+                        "voltage": 230 + idx % 3,
+                    }
+                )
+            )
+            states.async_set(f"sensor.power_{idx}", str(idx), attributes)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return used / entities_to_set
+
+    start = timer()
+    default = _bytes_per_entity(False)
+    memory_lean = _bytes_per_entity(True)
+    print(f"Bytes per entity: {default:.0f} default, {memory_lean:.0f} memory lean")
+    return timer() - start
+
+
+@benchmark
+async def template_render(hass):
+    """Report renders per second of templates with and without the fast path."""
+    renders = 10**5
+    hass.states.async_set("sensor.power", "42", {"unit_of_measurement": "W"})
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    template_strs = (
+        "{{ states('sensor.power') | float * 2 }}",
+        "{{ is_state('light.one', 'on') and is_state('light.two', 'on') }}",
+        "{{ states.sensor.power.attributes.unit_of_measurement }}",
+    )
+
+    def _renders_per_second(template_str: str, fast_render: bool) -> float:
+        template = Template(template_str, hass)
+        template.async_render()
+        if not fast_render:
+            template._fast_render = None  # noqa: SLF001
+        start = timer()
+        for _ in range(renders):
+            template.async_render()
+        return renders / (timer() - start)
+
+    start = timer()
+    for template_str in template_strs:
+        native = _renders_per_second(template_str, True)
+        jinja = _renders_per_second(template_str, False)
+        print(
+            f"{template_str}: {native:.0f} renders/s native, {jinja:.0f} renders/s jinja"
+        )
+    return timer() - start
+
+
+@benchmark
+async def websocket_state_diffs(hass):
+    """Report bytes on the wire and CPU time per 1,000 websocket state diffs."""
+    diffs = 1000
+    entities = 100
+    old_states: dict[str, core.State] = {}
+    events = []
+    for idx in range(diffs):
+        entity_id = f"sensor.power_{idx % entities}"
+        new_state = core.State(
+            entity_id,
+            str(idx),
+            {
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "friendly_name": f"Power {idx % entities}",
+                "voltage": 230 + idx % 3,
+            },
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+
+    start = timer()
+    messages = [cached_state_diff_message(b"1", event) for event in events]
+    json_time = timer() - start
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    compress_start = timer()
+    compressed = [
+        compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        for message in messages
+    ]
+    compress_time = timer() - compress_start
+    json_bytes = sum(len(message) for message in messages)
+    compressed_bytes = sum(len(message) for message in compressed)
+    print(
+        f"JSON: {json_bytes} bytes in {json_time * 1000:.2f}ms, "
+        f"compress_messages: {compressed_bytes} bytes in "
+        f"{(json_time + compress_time) * 1000:.2f}ms per {diffs} diffs"
+    )
+    return timer() - start
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Report MQTT messages per second matched against wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    devices = 9000
+    messages = 10**4
+    topic_filters = [
+        *(f"zigbee2mqtt/device_{idx}/+" for idx in range(0, devices, 30)),
+        "zigbee2mqtt/+/availability",
+        "zigbee2mqtt/bridge/#",
+        "homeassistant/+/+/config",
+        "homeassistant/+/+/+/config",
+    ]
+    topics = [f"zigbee2mqtt/device_{idx % devices}/state" for idx in range(messages)]
+
+    trie = SubscriptionTrie()
+    matchers = []
+    for topic_filter in topic_filters:
+        trie.add(Subscription(topic_filter, False, None))
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        matchers.append(matcher)
+
+    start = timer()
+    for topic in topics:
+        trie.matches(topic)
+    trie_time = timer() - start
+    matcher_start = timer()
+    for topic in topics:
+        for matcher in matchers:
+            next(matcher.iter_match(topic), False)
+    matcher_time = timer() - matcher_start
+    print(
+        f"{len(topic_filters)} wildcard subscriptions: "
+        f"{messages / trie_time:.0f} messages/s trie, "
+        f"{messages / matcher_time:.0f} messages/s matcher per subscription"
+    )
+    return timer() - start
+
+
+@benchmark
+async def storage_journal_writes(hass):
+    """Report bytes written per entity registry update with and without journal."""
+    entities = 2000
+    updates = 200
+    data = {
+        "entities": [
+            {
+                "id": f"{idx:032x}",
+                "entity_id": f"sensor.benchmark_{idx}",
+                "platform": "benchmark",
+                "unique_id": f"unique_{idx}",
+                "config_entry_id": "01J0000000000000000000000",
+                "device_id": f"{idx // 4:032x}",
+                "name": None,
+                "original_name": f"Benchmark {idx}",
+                "options": {"sensor": {"suggested_display_precision": 1}},
+                "labels": [],
+            }
+            for idx in range(entities)
+        ],
+        "deleted_entities": [],
+    }
+
+    def _file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    start = timer()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for journal in (False, True):
+            store = Store(hass, 1, f"benchmark_{journal}", journal=journal)
+            await store.async_save(data)
+            written = 0
+            save_start = timer()
+            for idx in range(updates):
+                data["entities"][idx]["name"] = f"Renamed {idx} {journal}"
+                snapshot_mtime = os.stat(store.path).st_mtime_ns
+                journal_size = _file_size(store.journal_path)
+                await store.async_save(data)
+                if os.stat(store.path).st_mtime_ns != snapshot_mtime:
+                    written += _file_size(store.path)
+                    journal_size = 0
+                written += _file_size(store.journal_path) - journal_size
+            save_time = timer() - save_start
+            print(
+                f"journal={journal}: {written / updates:.0f} bytes and "
+                f"{save_time / updates * 1000:.2f}ms per update "
+                f"of {entities} entities"
+            )
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
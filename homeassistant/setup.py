@@ -66,6 +66,10 @@ DATA_SETUP_STARTED: HassKey[dict[tuple[str, str | None], float]] = HassKey(
     "setup_started"
 )
 
+# DATA_SETUP_START_TIME is a dict, indicating when the setup
+# of a component started.
+DATA_SETUP_START_TIME: HassKey[dict[str, float]] = HassKey("setup_start_time")
+
 # DATA_SETUP_TIME is a defaultdict, indicating how time was spent
 # setting up a component.
 DATA_SETUP_TIME: HassKey[
@@ -729,6 +733,12 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_START_TIME)
+def _setup_start_times(hass: core.HomeAssistant) -> dict[str, float]:
+    """Return the setup start times dict."""
+    return {}
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -765,6 +775,8 @@ def async_start_setup(
     started = time.monotonic()
     current_setup_group.set(current)
     setup_started[current] = started
+    if group is None:
+        _setup_start_times(hass).setdefault(integration, started)
 
     try:
         yield
@@ -815,6 +827,12 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_setup_start_times(hass: core.HomeAssistant) -> Mapping[str, float]:
+    """Return the monotonic time the setup of each integration started."""
+    return _setup_start_times(hass)
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
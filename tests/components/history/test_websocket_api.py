@@ -5,6 +5,7 @@ from datetime import timedelta
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
@@ -172,6 +173,135 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period downsamples numeric states with max_points."""
+    now = dt_util.utcnow().replace(microsecond=0)
+    freezer.move_to(now)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    client = await hass_ws_client()
+    for minute in range(60):
+        freezer.move_to(now + timedelta(minutes=minute))
+        if minute == 45:
+            state = "unavailable"
+        else:
+            state = str(minute if minute < 30 else 100 - minute)
+        hass.states.async_set("sensor.test", state)
+    await async_wait_recording_done(hass)
+
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": (now - timedelta(seconds=1)).isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_test_history = response["result"]["sensor.test"]
+    # The lowest and highest state of each half hour, split by the
+    # non numeric state which is always kept
+    assert [state["s"] for state in sensor_test_history] == [
+        "0",
+        "29",
+        "70",
+        "56",
+        "unavailable",
+        "54",
+        "41",
+    ]
+    assert [state["lu"] for state in sensor_test_history] == [
+        (now + timedelta(minutes=minute)).timestamp()
+        for minute in (0, 29, 30, 44, 45, 46, 59)
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the states in chunks with chunk_size."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+        hass.states.async_set("sensor.two", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "chunk_size": 4,
+        }
+    )
+    states: dict[str, list[str]] = {}
+    chunks = 0
+    while (response := await client.receive_json())["type"] == "event":
+        assert response["id"] == 1
+        assert response["event"]["partial"] is True
+        chunks += 1
+        for entity_id, entity_states in response["event"]["states"].items():
+            states.setdefault(entity_id, []).extend(
+                state["s"] for state in entity_states
+            )
+    assert response["id"] == 1
+    assert response["success"]
+    assert response["result"] == {}
+
+    assert chunks == 2
+    assert states == {"sensor.one": ["1", "2", "3"], "sensor.two": ["1", "2", "3"]}
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunk_size": 4,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
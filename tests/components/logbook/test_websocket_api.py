@@ -296,6 +296,53 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events sends the events in chunks with chunk_size."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "chunk_size": 2,
+        }
+    )
+    chunks = []
+    while (response := await client.receive_json())["type"] == "event":
+        assert response["id"] == 1
+        assert response["event"]["partial"] is True
+        chunks.append(response["event"]["events"])
+    assert response["id"] == 1
+    assert response["success"]
+    assert response["result"] == []
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [event["state"] for chunk in chunks for event in chunk] == [
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+    ]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
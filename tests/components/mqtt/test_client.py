@@ -9,10 +9,15 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import certifi
 import paho.mqtt.client as paho_mqtt
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
@@ -495,6 +500,61 @@ async def test_subscribe_topic_subtree_wildcard_root_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "test-topic",
+        "test-topic/bier",
+        "test-topic/bier/on",
+        "test-topic/bier/on/off",
+        "test-topic//on",
+        "/test-topic",
+        "$SYS/broker/uptime",
+        "other",
+    ],
+)
+def test_subscription_trie(topic: str) -> None:
+    """Test the subscription trie matches topics like paho's MQTTMatcher."""
+    topic_filters = (
+        "#",
+        "+",
+        "+/#",
+        "+/+/on",
+        "test-topic",
+        "test-topic/#",
+        "test-topic/+",
+        "test-topic/+/on",
+        "test-topic/+/+/#",
+        "test-topic//on",
+        "/+",
+        "$SYS/#",
+        "$SYS/+/uptime",
+    )
+    trie = SubscriptionTrie()
+    subscriptions: dict[Subscription, MQTTMatcher] = {}
+    for topic_filter in topic_filters:
+        subscription = Subscription(topic_filter, False, Mock())
+        trie.add(subscription)
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        subscriptions[subscription] = matcher
+
+    expected = {
+        subscription
+        for subscription, matcher in subscriptions.items()
+        if next(matcher.iter_match(topic), False)
+    }
+    matches = trie.matches(topic)
+    assert len(matches) == len(expected)
+    assert set(matches) == expected
+
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    assert trie.matches(topic) == []
+    with pytest.raises(KeyError):
+        trie.remove(next(iter(subscriptions)))
+
+
 async def test_subscribe_topic_subtree_wildcard_no_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1956,6 +2016,47 @@ async def test_client_sock_failure_after_connect(
     assert len(recorded_calls) == 0
 
 
+async def test_received_messages_processed_in_batches(
+    hass: HomeAssistant,
+    setup_with_birth_msg_client_mock: MqttMockPahoClient,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages read from the socket are processed in batches."""
+    mqtt_client_mock = setup_with_birth_msg_client_mock
+    mqtt_client = hass.data["mqtt"].client
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    def _loop_read(max_packets: int) -> int:
+        if mqtt_client_mock.loop_read.call_count > 1:
+            return paho_mqtt.MQTT_ERR_SUCCESS
+        for idx in range(5):
+            msg = paho_mqtt.MQTTMessage(topic=f"test-topic/{idx}".encode())
+            msg.payload = b"on"
+            mqtt_client_mock.on_message(mqtt_client_mock, None, msg)
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_client_mock.loop_read.side_effect = _loop_read
+    with patch("homeassistant.components.mqtt.client.MAX_MESSAGE_PROCESSING_TIME", 0):
+        mqtt_client._async_reader_callback(mqtt_client_mock)
+        # Only the first message is processed before yielding to the event loop
+        assert len(recorded_calls) == 1
+        # Messages received outside of the reader are queued behind the batch
+        async_fire_mqtt_message(hass, "test-topic/5", "on")
+        assert len(recorded_calls) == 1
+        # The socket is not read while the backlog is processed
+        mqtt_client._async_reader_callback(mqtt_client_mock)
+        assert mqtt_client_mock.loop_read.call_count == 1
+        while mqtt_client._pending_messages:
+            await asyncio.sleep(0)
+
+    assert [msg.topic for msg in recorded_calls] == [
+        f"test-topic/{idx}" for idx in range(6)
+    ]
+    # Reading resumes once the backlog is processed
+    assert mqtt_client_mock.loop_read.call_count == 2
+
+
 async def test_loop_write_failure(
     hass: HomeAssistant,
     setup_with_birth_msg_client_mock: MqttMockPahoClient,
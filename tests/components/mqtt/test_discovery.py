@@ -786,6 +786,55 @@ async def test_rapid_reconfigure(
     assert events[2].data["new_state"].attributes["friendly_name"] == "Wine"
 
 
+async def test_unchanged_discovery_payload_skipped(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a replayed unchanged discovery payload is not processed again."""
+    await mqtt_mock_entry()
+    config = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Beer"
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object"
+    ) as mock_json_loads:
+        async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+        await hass.async_block_till_done()
+    assert not mock_json_loads.called
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+    assert "Component has already been discovered: binary_sensor bla" not in (
+        caplog.text
+    )
+
+    # A changed payload is processed
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+
+    # The original payload is processed again after the component was removed
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    caplog.clear()
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Beer"
+    assert "Ignoring unchanged discovery payload" not in caplog.text
+
+
 async def test_duplicate_removal(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
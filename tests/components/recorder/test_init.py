@@ -9,7 +9,7 @@ import sqlite3
 import sys
 import threading
 from typing import Any, cast
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -36,6 +36,7 @@ from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
+    MAX_COMMIT_INTERVAL_MULTIPLIER,
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
@@ -559,6 +560,146 @@ async def test_saving_event(hass: HomeAssistant, setup_recorder: None) -> None:
     )
 
 
+async def test_saving_many_events_in_one_commit(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test events sharing new event types and data are bulk inserted."""
+    instance = get_instance(hass)
+    fired = [
+        ("EVENT_BULK_ONE", {"shared": True}),
+        ("EVENT_BULK_TWO", {"shared": True}),
+        ("EVENT_BULK_ONE", {"index": 3}),
+        ("EVENT_BULK_TWO", {}),
+        ("EVENT_BULK_ONE", {"shared": True}),
+    ]
+    for event_type, event_data in fired:
+        hass.bus.async_fire(event_type, event_data)
+
+    await async_wait_recording_done(hass)
+    assert instance._pending_events == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        stored = [
+            (event_types.event_type, event_data.to_native() if event_data else {})
+            for _, event_data, event_types in (
+                session.query(Events, EventData, EventTypes)
+                .filter(
+                    Events.event_type_id.in_(
+                        select_event_type_ids(("EVENT_BULK_ONE", "EVENT_BULK_TWO"))
+                    )
+                )
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, Events.data_id == EventData.data_id)
+                .order_by(Events.event_id)
+            )
+        ]
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data == '{"shared":true}')
+            .count()
+            == 1
+        )
+
+    assert stored == fired
+
+
+async def test_saving_events_retried_after_rollback(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test events are written with new ids when the commit is retried."""
+    instance = get_instance(hass)
+    await async_wait_recording_done(hass)
+    session = instance.event_session
+    execute = session.execute
+    failed = False
+
+    def _execute_fail_first_insert(statement: Any, *args: Any, **kwargs: Any) -> Any:
+        """Roll back and fail the first bulk insert of the events."""
+        nonlocal failed
+        if not failed and statement.is_insert:
+            failed = True
+            session.rollback()
+            raise OperationalError("insert the events", "fake params", "forced")
+        return execute(statement, *args, **kwargs)
+
+    with (
+        patch.object(instance, "db_retry_wait", 0.01),
+        patch.object(session, "execute", side_effect=_execute_fail_first_insert),
+    ):
+        hass.bus.async_fire("EVENT_RETRIED", {"retried": True})
+        await async_wait_recording_done(hass)
+
+    assert failed
+    assert instance._pending_events == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        stored = [
+            (event_types.event_type_id, event_types.event_type, event_data.to_native())
+            for _, event_data, event_types in (
+                session.query(Events, EventData, EventTypes)
+                .filter(
+                    Events.event_type_id.in_(select_event_type_ids(("EVENT_RETRIED",)))
+                )
+                .join(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+                .join(EventData, Events.data_id == EventData.data_id)
+            )
+        ]
+
+    assert stored == [(ANY, "EVENT_RETRIED", {"retried": True})]
+    # The cached id is the one of the event type written by the retry
+    assert instance.event_type_manager._id_map["EVENT_RETRIED"] == stored[0][0]
+
+
+async def test_adaptive_commit_interval(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the commit interval widens under load and shrinks when idle."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 1})
+    assert instance.effective_commit_interval == 1
+
+    with patch.object(Recorder, "backlog", PropertyMock(return_value=5000)):
+        for _ in range(10):
+            instance._adjust_commit_interval(0.01)
+    assert instance.commit_interval_multiplier == MAX_COMMIT_INTERVAL_MULTIPLIER
+    assert instance.effective_commit_interval == MAX_COMMIT_INTERVAL_MULTIPLIER
+
+    instance._adjust_commit_interval(0.01)
+    assert instance.commit_interval_multiplier == MAX_COMMIT_INTERVAL_MULTIPLIER - 1
+
+    # Slow commits widen the interval even without a backlog
+    instance._adjust_commit_interval(10)
+    assert instance.commit_interval_multiplier == MAX_COMMIT_INTERVAL_MULTIPLIER
+
+    for _ in range(10):
+        instance._adjust_commit_interval(0.01)
+    assert instance.effective_commit_interval == 1
+
+    # Commits are only queued every multiplier ticks
+    instance.commit_interval_multiplier = 3
+    hass.states.async_set("sensor.adaptive", "1")
+    await async_recorder_block_till_done(hass)
+    with patch.object(instance, "queue_task") as queue_task:
+        instance._async_commit(dt_util.utcnow())
+        instance._async_commit(dt_util.utcnow())
+        assert queue_task.call_count == 0
+        instance._async_commit(dt_util.utcnow())
+        assert queue_task.call_count == 1
+
+
+async def test_adaptive_commit_interval_zero(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the commit interval is not adapted when committing every event."""
+    instance = await async_setup_recorder_instance(hass, {"commit_interval": 0})
+    with patch.object(Recorder, "backlog", PropertyMock(return_value=5000)):
+        instance._adjust_commit_interval(10)
+    assert instance.commit_interval_multiplier == 1
+
+
 async def test_saving_state_with_commit_interval_zero(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -317,28 +317,30 @@ def mock_sensor_statistics():
 
 
 @pytest.fixture
-def mock_from_stats():
-    """Mock out Statistics.from_stats."""
+def mock_short_term_statistics_row():
+    """Mock out building the short term statistics rows."""
     counter = 0
-    real_from_stats = StatisticsShortTerm.from_stats
+    real_short_term_statistics_row = statistics._short_term_statistics_row
 
-    def from_stats(metadata_id, stats):
+    def short_term_statistics_row(metadata_id, stats):
         nonlocal counter
         if counter == 0 and metadata_id == 2:
             counter += 1
-            return None
-        return real_from_stats(metadata_id, stats)
+            raise ValueError
+        return real_short_term_statistics_row(metadata_id, stats)
 
     with patch(
-        "homeassistant.components.recorder.statistics.StatisticsShortTerm.from_stats",
-        side_effect=from_stats,
-        autospec=True,
+        "homeassistant.components.recorder.statistics._short_term_statistics_row",
+        side_effect=short_term_statistics_row,
     ):
         yield
 
 
 async def test_compile_periodic_statistics_exception(
-    hass: HomeAssistant, setup_recorder: None, mock_sensor_statistics, mock_from_stats
+    hass: HomeAssistant,
+    setup_recorder: None,
+    mock_sensor_statistics,
+    mock_short_term_statistics_row,
 ) -> None:
     """Test exception handling when compiling periodic statistics."""
     await async_setup_component(hass, "sensor", {})
@@ -378,6 +380,170 @@ async def test_compile_periodic_statistics_exception(
         "sensor.test3": expected_stats3,
     }
 
+    metrics = recorder.get_instance(hass).metrics
+    assert metrics.statistics_compiles == 2
+    assert metrics.last_statistics_compile_duration > 0
+
+
+async def test_compile_periodic_statistics_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None, mock_sensor_statistics
+) -> None:
+    """Test the short term statistics of a period are inserted in bulk."""
+    await async_setup_component(hass, "sensor", {})
+
+    now = get_start_time(dt_util.utcnow())
+    with patch(
+        "homeassistant.components.recorder.statistics._bulk_insert_short_term_statistics",
+        wraps=statistics._bulk_insert_short_term_statistics,
+    ) as bulk_insert:
+        do_adhoc_statistics(hass, start=now)
+        await async_wait_recording_done(hass)
+
+    bulk_insert.assert_called_once()
+    rows = bulk_insert.call_args[0][1]
+    assert [row["metadata_id"] for row in rows] == [1, 2, 3]
+    assert {row["start_ts"] for row in rows} == {now.timestamp()}
+
+    stats = statistics_during_period(hass, now, period="5minute")
+    assert set(stats) == {"sensor.test1", "sensor.test2", "sensor.test3"}
+
+    # The ids of the inserted rows are read back into the run cache
+    with session_scope(hass=hass, read_only=True) as session:
+        ids = {
+            metadata_id: id_
+            for metadata_id, id_ in session.execute(
+                select(StatisticsShortTerm.metadata_id, StatisticsShortTerm.id)
+            )
+        }
+    assert len(ids) == 3
+    run_cache = get_short_term_statistics_run_cache(hass)
+    assert run_cache.get_latest_ids({1, 2, 3}) == ids
+
+
+async def test_compile_hourly_statistics_from_run_cache(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test hourly statistics are summarized from the run cache when possible."""
+    instance = recorder.get_instance(hass)
+    await async_setup_component(hass, "sensor", {})
+
+    def get_fake_stats(_hass, session, start, _end):
+        minute = start.minute
+        return statistics.PlatformCompiledStatistics(
+            [
+                {
+                    "meta": {
+                        "has_mean": True,
+                        "has_sum": False,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.test1",
+                        "unit_of_measurement": "dogs",
+                    },
+                    "stat": {
+                        "start": start,
+                        "mean": minute + 0.5,
+                        "min": minute,
+                        "max": minute + 1,
+                    },
+                },
+                {
+                    "meta": {
+                        "has_mean": False,
+                        "has_sum": True,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.test2",
+                        "unit_of_measurement": "dogs",
+                    },
+                    "stat": {
+                        "start": start,
+                        "last_reset": start.replace(minute=0),
+                        "state": minute,
+                        "sum": minute * 2,
+                    },
+                },
+            ],
+            get_metadata_with_session(
+                instance, session, statistic_ids={"sensor.test1", "sensor.test2"}
+            ),
+        )
+
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    hour_1 = hour - timedelta(hours=3)
+    hour_2 = hour - timedelta(hours=2)
+    expected = {
+        "sensor.test1": {
+            "mean": pytest.approx(28.0),
+            "min": pytest.approx(0.0),
+            "max": pytest.approx(56.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+        "sensor.test2": {
+            "mean": None,
+            "min": None,
+            "max": None,
+            "state": pytest.approx(55.0),
+            "sum": pytest.approx(110.0),
+        },
+    }
+
+    with (
+        patch(
+            "homeassistant.components.sensor.recorder.compile_statistics",
+            side_effect=get_fake_stats,
+        ),
+        patch(
+            "homeassistant.components.recorder.statistics._compile_hourly_statistics_summary",
+            wraps=statistics._compile_hourly_statistics_summary,
+        ) as summary_mock,
+    ):
+        for minutes in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=hour_1 + timedelta(minutes=minutes))
+        await async_wait_recording_done(hass)
+        # All periods of the hour are in the run cache, the database
+        # should not be queried to summarize the hour
+        assert summary_mock.call_count == 0
+        # The summary from the run cache must match the summary from the database
+        run_cache = get_short_term_statistics_run_cache(hass)
+        with session_scope(hass=hass, read_only=True) as session:
+            assert run_cache.get_hourly_summary(
+                hour_1.timestamp()
+            ) == statistics._compile_hourly_statistics_summary(
+                session, hour_1.timestamp()
+            )
+        summary_mock.reset_mock()
+
+        # Simulate a restart in the middle of the hour
+        for minutes in range(0, 30, 5):
+            do_adhoc_statistics(hass, start=hour_2 + timedelta(minutes=minutes))
+        await async_wait_recording_done(hass)
+        run_cache._short_term_rows_by_hour.clear()
+        for minutes in range(30, 60, 5):
+            do_adhoc_statistics(hass, start=hour_2 + timedelta(minutes=minutes))
+        await async_wait_recording_done(hass)
+        assert summary_mock.call_count == 1
+
+    stats = statistics_during_period(hass, hour_1, period="hour")
+    for start in (hour_1, hour_2):
+        expected["sensor.test2"]["last_reset"] = start.timestamp()
+        for statistic_id, expected_stat in expected.items():
+            assert {
+                "start": start.timestamp(),
+                "end": (start + timedelta(hours=1)).timestamp(),
+                **expected_stat,
+            } in stats[statistic_id]
+
+    # Short term statistics changed outside of the compile invalidate the cache
+    run_cache.add_short_term_statistics(
+        hour.timestamp(), {1: (1.0, 1.0, 1.0, None, None, None)}
+    )
+    instance.async_adjust_statistics("sensor.test2", hour_2, 10, "dogs")
+    await async_wait_recording_done(hass)
+    assert run_cache._short_term_rows_by_hour == {}
+
 
 async def test_rename_entity(
     hass: HomeAssistant, entity_registry: er.EntityRegistry, setup_recorder: None
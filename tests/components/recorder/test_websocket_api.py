@@ -2481,6 +2481,29 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_metrics(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting recorder metrics."""
+    client = await hass_ws_client()
+
+    hass.states.async_set("sensor.metrics", "1")
+    hass.bus.async_fire("metrics_event")
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["backlog"] == 0
+    assert result["commit_interval"] == recorder_mock.commit_interval
+    assert result["effective_commit_interval"] == recorder_mock.commit_interval
+    assert result["events_processed"] >= 2
+    assert result["commits"] >= 1
+    assert result["rows_committed"] >= 3
+    assert sum(result["commit_duration_histogram"].values()) == result["commits"]
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
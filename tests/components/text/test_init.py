@@ -124,10 +124,10 @@ async def test_restore_number_save_state(
     # Trigger saving state
     await async_mock_restore_state_shutdown_restart(hass)
 
-    assert len(hass_storage[RESTORE_STATE_KEY]["data"]) == 1
-    state = hass_storage[RESTORE_STATE_KEY]["data"][0]["state"]
+    assert len(hass_storage[RESTORE_STATE_KEY]["data"]["states"]) == 1
+    state = hass_storage[RESTORE_STATE_KEY]["data"]["states"][0]["state"]
     assert state["entity_id"] == entity0.entity_id
-    extra_data = hass_storage[RESTORE_STATE_KEY]["data"][0]["extra_data"]
+    extra_data = hass_storage[RESTORE_STATE_KEY]["data"]["states"][0]["extra_data"]
     assert extra_data == RESTORE_DATA
     assert isinstance(extra_data["native_value"], str)
 
@@ -879,7 +879,12 @@ async def test_restore_paused(hass: HomeAssistant) -> None:
     )
 
     data = async_get(hass)
-    await data.store.async_save([stored_state.as_dict()])
+    await data.store.async_save(
+        {
+            "last_dump": None,
+            "states": [{"id": "timer.test", **stored_state.as_dict()}],
+        }
+    )
     await data.async_load()
 
     entity = Timer.from_storage(
@@ -921,7 +926,12 @@ async def test_restore_active_resume(hass: HomeAssistant) -> None:
     )
 
     data = async_get(hass)
-    await data.store.async_save([stored_state.as_dict()])
+    await data.store.async_save(
+        {
+            "last_dump": None,
+            "states": [{"id": "timer.test", **stored_state.as_dict()}],
+        }
+    )
     await data.async_load()
 
     entity = Timer.from_storage(
@@ -969,7 +979,12 @@ async def test_restore_active_finished_outside_grace(hass: HomeAssistant) -> Non
     )
 
     data = async_get(hass)
-    await data.store.async_save([stored_state.as_dict()])
+    await data.store.async_save(
+        {
+            "last_dump": None,
+            "states": [{"id": "timer.test", **stored_state.as_dict()}],
+        }
+    )
     await data.async_load()
 
     entity = Timer.from_storage(
@@ -24,6 +24,8 @@ from homeassistant.core import Context, HomeAssistant, State, SupportsResponse,
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.polling import async_get_polling_scheduler
+from homeassistant.helpers.startup_profile import async_get_startup_profile
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -1261,6 +1263,84 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_merges_changes(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test changes of an entity are merged for clients that support it."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "supported_features",
+            "features": {const.FEATURE_MERGE_ENTITY_CHANGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.added"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "off"}
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"color": "red", "effect": "x"})
+    hass.states.async_set("light.permitted", "on", {"color": "blue", "effect": "x"})
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    # Added and removed within the window is not sent
+    hass.states.async_set("light.added", "on")
+    hass.states.async_remove("light.added")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        }
+    }
+
+    # Pending changes are dropped when unsubscribing
+    hass.states.async_set("light.permitted", "off")
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    await asyncio.sleep(const.ENTITY_CHANGES_COALESCE_WINDOW * 2)
+    hass.states.async_set("light.permitted", "on")
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["type"] == "pong"
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2514,6 +2594,88 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_startup_profile(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the startup profile timeline."""
+    startup_profile = async_get_startup_profile(hass)
+    startup_profile.current = {
+        "api": {
+            "start": 0.5,
+            "import_time": 0.01,
+            "setup_time": 0.1,
+            "dependencies": ["http"],
+        },
+        "http": {
+            "start": 0.0,
+            "import_time": 0.2,
+            "setup_time": 0.5,
+            "dependencies": [],
+        },
+    }
+    startup_profile.preimported = ["http"]
+    startup_profile.registries_loaded = 0.25
+
+    await websocket_client.send_json({"id": 7, "type": "startup_profile"})
+    msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "timeline": [
+            {
+                "domain": "http",
+                "start": 0.0,
+                "import_time": 0.2,
+                "setup_time": 0.5,
+                "dependencies": [],
+            },
+            {
+                "domain": "api",
+                "start": 0.5,
+                "import_time": 0.01,
+                "setup_time": 0.1,
+                "dependencies": ["http"],
+            },
+        ],
+        "preimported": ["http"],
+        "registries_loaded": 0.25,
+    }
+
+
+async def test_polling_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the polling stats."""
+    owner = Mock()
+    stats = async_get_polling_scheduler(hass).async_register(
+        owner, "hue.light", "hue", 30.0
+    )
+    stats.async_record(0.5)
+    stats.async_record(31.5)
+
+    await websocket_client.send_json({"id": 7, "type": "polling_stats"})
+    msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "name": "hue.light",
+            "integration": "hue",
+            "config_entry_id": None,
+            "interval": 30.0,
+            "polls": 2,
+            "overruns": 1,
+            "last_duration": 31.5,
+            "max_duration": 31.5,
+            "average_duration": 16.0,
+        }
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
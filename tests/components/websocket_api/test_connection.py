@@ -2,7 +2,7 @@
 
 import logging
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 from aiohttp.test_utils import make_mocked_request
 import pytest
@@ -10,7 +10,7 @@ import voluptuous as vol
 
 from homeassistant import exceptions
 from homeassistant.components import websocket_api
-from homeassistant.components.websocket_api.const import DOMAIN
+from homeassistant.components.websocket_api.const import DOMAIN, MAX_PENDING_CHUNKS
 from homeassistant.core import HomeAssistant
 
 from tests.common import MockUser
@@ -130,3 +130,53 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+async def test_executor_chunk_sender(hass: HomeAssistant) -> None:
+    """Test the chunk sender waits for the client every MAX_PENDING_CHUNKS chunks."""
+    hass.data[DOMAIN] = {}
+    send_messages = []
+    wait_for_pending_messages = AsyncMock()
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__),
+        hass,
+        send_messages.append,
+        MockUser(),
+        Mock(),
+        wait_for_pending_messages,
+    )
+    sender = websocket_api.ExecutorChunkSender(hass, connection, 5)
+    assert 5 in connection.subscriptions
+
+    chunks = [str(number).encode() for number in range(2 * MAX_PENDING_CHUNKS + 1)]
+
+    def _send_chunks() -> list[bool]:
+        return [sender.send_message(chunk) for chunk in chunks]
+
+    assert all(await hass.async_add_executor_job(_send_chunks))
+    await hass.async_block_till_done()
+    assert send_messages == chunks
+    assert wait_for_pending_messages.mock_calls == [
+        call(MAX_PENDING_CHUNKS),
+        call(MAX_PENDING_CHUNKS),
+    ]
+
+    sender.async_finish()
+    assert 5 not in connection.subscriptions
+
+
+async def test_executor_chunk_sender_stops_on_close(hass: HomeAssistant) -> None:
+    """Test the chunk sender stops when the connection closes."""
+    hass.data[DOMAIN] = {}
+    send_messages = []
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__), hass, send_messages.append, MockUser(), Mock()
+    )
+    sender = websocket_api.ExecutorChunkSender(hass, connection, 5)
+
+    assert await hass.async_add_executor_job(sender.send_message, b"1")
+    connection.async_handle_close()
+    assert sender.cancelled
+    assert not await hass.async_add_executor_job(sender.send_message, b"2")
+    await hass.async_block_till_done()
+    assert send_messages == [b"1"]
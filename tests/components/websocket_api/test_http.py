@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -345,6 +347,48 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_wait_for_pending_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting until the pending messages are written."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    # Queue messages without releasing the writer
+    for msg_id in range(5):
+        instance._message_queue.append(f'{{"id": {msg_id}}}'.encode())
+    wait_task = hass.async_create_task(instance._async_wait_for_pending_messages(2))
+    await asyncio.sleep(0)
+    assert not wait_task.done()
+
+    instance._send_message({"id": 5})
+    for msg_id in range(6):
+        assert (await websocket_client.receive_json())["id"] == msg_id
+    await wait_task
+
+    # Closing the connection stops waiting
+    for msg_id in range(5):
+        instance._message_queue.append(f'{{"id": {msg_id}}}'.encode())
+    wait_task = hass.async_create_task(instance._async_wait_for_pending_messages(2))
+    await asyncio.sleep(0)
+    assert not wait_task.done()
+    instance._cancel()
+    await wait_task
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -433,6 +477,104 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compress(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test enabling compressed messages."""
+    websocket_client = await hass_ws_client(hass)
+    decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESS_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    msg = json_loads(decompressor.decompress(msg.data))
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    # The compression context is kept between messages
+    sizes: list[int] = []
+    for id_ in (2, 3):
+        await websocket_client.send_json({"id": id_, "type": "ping"})
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        sizes.append(len(msg.data))
+        assert json_loads(decompressor.decompress(msg.data)) == {
+            "id": id_,
+            "type": "pong",
+        }
+    assert sizes[1] < sizes[0]
+
+
+async def test_compress_switches_at_queued_message(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test compression applies to the messages queued after it is switched."""
+
+    @callback
+    @websocket_command({"type": "switch_compress", "compress": bool})
+    def switch_compress(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        # Queued before the switch, but written after it
+        connection.send_message({"id": msg["id"], "type": "before"})
+        connection.set_supported_features(
+            {const.FEATURE_COMPRESS_MESSAGES: 1} if msg["compress"] else {}
+        )
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, switch_compress)
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {"id": 1, "type": "switch_compress", "compress": True}
+    )
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 1, "type": "before"}
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+    assert json_loads(decompressor.decompress(msg.data))["id"] == 1
+
+    # Sending the features again without compression switches it off
+    await websocket_client.send_json(
+        {"id": 2, "type": "switch_compress", "compress": False}
+    )
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    assert json_loads(decompressor.decompress(msg.data)) == {
+        "id": 2,
+        "type": "before",
+    }
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data)["id"] == 2
+
+    await websocket_client.send_json({"id": 3, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 3, "type": "pong"}
+
+    # Switching it on again starts a new deflate stream
+    await websocket_client.send_json(
+        {"id": 4, "type": "switch_compress", "compress": True}
+    )
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+    assert json_loads(decompressor.decompress(msg.data))["id"] == 4
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
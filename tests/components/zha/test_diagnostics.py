@@ -33,6 +33,7 @@ CONFIG_ENTRY_DIAGNOSTICS_KEYS = [
     "application_state",
     "versions",
     "devices",
+    "platforms",
 ]
 
 
@@ -105,6 +106,10 @@ async def test_diagnostics_for_config_entry(
             "logical_type": "EndDevice",
         },
     ]
+    assert diagnostics_data["platforms"] == {
+        "loaded": ["alarm_control_panel"],
+        "not_loaded": [],
+    }
 
 
 async def test_diagnostics_for_device(
@@ -8,6 +8,8 @@ import pytest
 from zigpy.application import ControllerApplication
 from zigpy.config import CONF_DEVICE, CONF_DEVICE_PATH
 from zigpy.exceptions import TransientConnectionError
+from zigpy.profiles import zha
+from zigpy.zcl.clusters import closures, general
 
 from homeassistant.components.zha.const import (
     CONF_BAUDRATE,
@@ -17,6 +19,7 @@ from homeassistant.components.zha.const import (
     DOMAIN,
 )
 from homeassistant.components.zha.helpers import get_zha_data
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     MAJOR_VERSION,
@@ -27,6 +30,7 @@ from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers.event import async_call_later
 from homeassistant.setup import async_setup_component
 
+from .conftest import SIG_EP_INPUT, SIG_EP_OUTPUT, SIG_EP_PROFILE, SIG_EP_TYPE
 from .test_light import LIGHT_ON_OFF
 
 from tests.common import MockConfigEntry
@@ -267,6 +271,87 @@ async def test_zha_retry_unique_ids(
     assert "does not generate unique IDs" not in caplog.text
 
 
+@patch(
+    "homeassistant.components.zha.PLATFORMS",
+    [Platform.LIGHT, Platform.LOCK, Platform.SIREN],
+)
+async def test_zha_platforms_loaded_on_demand(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    zigpy_device_mock,
+    mock_zigpy_connect: ControllerApplication,
+) -> None:
+    """Test that only the platforms of the ZHA entities are set up."""
+    config_entry.add_to_hass(hass)
+    app = mock_zigpy_connect
+    light = zigpy_device_mock(LIGHT_ON_OFF)
+    app.devices[light.ieee] = light
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    gateway_proxy = get_zha_data(hass).gateway_proxy
+    assert gateway_proxy is not None
+    assert gateway_proxy.platforms_loaded == {Platform.LIGHT}
+    assert "lock" not in hass.config.components
+    assert hass.states.async_entity_ids(Platform.LIGHT)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+@patch(
+    "homeassistant.components.zha.PLATFORMS",
+    [Platform.LIGHT, Platform.LOCK, Platform.SIREN],
+)
+async def test_zha_platforms_not_loaded_while_unloading(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    zigpy_device_mock,
+    mock_zigpy_connect: ControllerApplication,
+) -> None:
+    """Test that no platforms are set up for devices joining while unloading."""
+    config_entry.add_to_hass(hass)
+    app = mock_zigpy_connect
+    light = zigpy_device_mock(LIGHT_ON_OFF)
+    app.devices[light.ieee] = light
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    gateway_proxy = get_zha_data(hass).gateway_proxy
+    assert gateway_proxy is not None
+    gateway = gateway_proxy.gateway
+    lock = zigpy_device_mock(
+        {
+            1: {
+                SIG_EP_INPUT: [closures.DoorLock.cluster_id, general.Basic.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zha.DeviceType.DOOR_LOCK,
+                SIG_EP_PROFILE: zha.PROFILE_ID,
+            }
+        },
+        ieee="01:2d:6f:00:0a:90:69:e8",
+        node_descriptor=b"\x02@\x8c\x02\x10RR\x00\x00\x00R\x00\x00",
+    )
+    with patch.object(gateway_proxy, "_async_add_entities") as add_entities:
+        gateway.get_or_create_device(lock)
+        await gateway.async_device_initialized(lock)
+    add_entities.assert_called_once()
+
+    # The entry is unloaded, like it is by a reload holding the setup
+    # lock, before the lock platform is set up
+    async with config_entry.setup_lock:
+        gateway_proxy._async_add_entities()
+        assert await hass.config_entries.async_unload(
+            config_entry.entry_id, _lock=False
+        )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+    assert gateway_proxy.platforms_loaded == {Platform.LIGHT}
+    assert "lock" not in hass.config.components
+
+
 async def test_shutdown_on_ha_stop(
     hass: HomeAssistant,
     config_entry: MockConfigEntry,
@@ -26,6 +26,7 @@ from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import discovery
 from homeassistant.helpers.entity_component import EntityComponent, async_update_entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -145,7 +146,10 @@ async def test_set_scan_interval_via_config(hass: HomeAssistant) -> None:
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    # The first poll is spread over the scan interval
+    assert mock_track.call_args[0][0] == async_get_polling_scheduler(hass).async_delay(
+        f" {DOMAIN}.platform", 30.0
+    )
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
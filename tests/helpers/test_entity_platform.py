@@ -32,6 +32,7 @@ from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
     EntityComponent,
 )
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.dt as dt_util
 
@@ -159,6 +160,33 @@ async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> N
     assert len(update_err) == 1
 
 
+async def test_polling_stats(hass: HomeAssistant) -> None:
+    """Test the polls of a platform are recorded."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    await component.async_setup({})
+
+    ent = MockEntity(should_poll=True)
+    await component.async_add_entities([ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    [stats] = async_get_polling_scheduler(hass).async_stats()
+    assert stats["name"] == f"{DOMAIN}.{DOMAIN}"
+    assert stats["integration"] == DOMAIN
+    assert stats["interval"] == 20
+    assert stats["polls"] == 1
+    assert stats["overruns"] == 0
+
+    # A poll that starts while the previous one still runs is an overrun
+    async with ent.platform._process_updates:
+        await ent.platform._async_update_entity_states()
+
+    [stats] = async_get_polling_scheduler(hass).async_stats()
+    assert stats["polls"] == 1
+    assert stats["overruns"] == 1
+
+
 async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -236,7 +264,10 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    # The first poll is spread over the scan interval
+    assert mock_track.call_args[0][0] == async_get_polling_scheduler(hass).async_delay(
+        f" {DOMAIN}.platform", 30.0
+    )
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -1190,6 +1221,90 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_bulk_add_entities(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test adding a batch of entities looks up each device once and saves once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(
+                    unique_id=f"{device}-{idx}",
+                    device_info={"identifiers": {("hue", device)}, "name": device},
+                )
+                for device in ("1234", "5678")
+                for idx in range(3)
+            ]
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with (
+        patch.object(
+            device_registry,
+            "async_get_or_create",
+            wraps=device_registry.async_get_or_create,
+        ) as mock_get_or_create,
+        patch.object(entity_registry._store, "async_delay_save") as mock_save,
+    ):
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 6
+    assert len(mock_get_or_create.mock_calls) == 2
+    assert len(mock_save.mock_calls) == 1
+    for device in ("1234", "5678"):
+        device_entry = device_registry.async_get_device(identifiers={("hue", device)})
+        assert device_entry is not None
+        assert len(er.async_entries_for_device(entity_registry, device_entry.id)) == 3
+    assert entity_platform.entities_added == 6
+    assert entity_platform.add_entities_seconds > 0
+
+
+async def test_bulk_add_entities_saves_before_finishing(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the registry save of a batch is not held back while entities finish."""
+    added = asyncio.Event()
+
+    class SlowEntity(MockEntity):
+        """Entity that waits before it is added to hass."""
+
+        async def async_added_to_hass(self) -> None:
+            await added.wait()
+
+    entity_platform = MockEntityPlatform(hass)
+    with patch.object(entity_registry._store, "async_delay_save") as mock_save:
+        task = hass.async_create_task(
+            entity_platform.async_add_entities(
+                [SlowEntity(unique_id=f"slow-{idx}", name="slow") for idx in range(3)]
+            )
+        )
+        await asyncio.sleep(0)
+
+        # All entities are registered and the save is scheduled while
+        # their async_added_to_hass is still running
+        assert len(mock_save.mock_calls) == 1
+        assert len(entity_registry.entities) == 3
+        assert hass.states.async_entity_ids() == []
+
+        added.set()
+        await task
+
+    assert len(hass.states.async_entity_ids()) == 3
+    assert len(mock_save.mock_calls) == 1
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -1826,6 +1941,64 @@ async def test_setup_entry_with_entities_that_block_forever(
     assert "test" in caplog.text
 
 
+class MockBlockingUpdateEntity(MockEntity):
+    """Class to mock an entity whose update blocks."""
+
+    async def async_update(self) -> None:
+        """Block for a long time."""
+        await asyncio.sleep(1000)
+
+
+async def test_entity_with_blocking_update_does_not_block_batch(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test an entity whose update blocks does not keep the batch from being added."""
+    blocking_entity = MockBlockingUpdateEntity(name="blocking", unique_id="blocking")
+
+    class YieldingUpdateEntity(MockEntity):
+        """Entity whose update yields to the event loop."""
+
+        async def async_update(self) -> None:
+            await asyncio.sleep(0)
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(name="test1", unique_id="test1"),
+                blocking_entity,
+                YieldingUpdateEntity(name="test2", unique_id="test2"),
+            ],
+            update_before_add=True,
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with (
+        patch.object(entity_platform, "SLOW_ADD_ENTITY_MAX_WAIT", 0.1),
+        patch.object(entity_platform, "SLOW_ADD_MIN_TIMEOUT", 0.1),
+    ):
+        assert await platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert sorted(hass.states.async_entity_ids()) == [
+        "test_domain.test1",
+        "test_domain.test2",
+    ]
+    assert len(entity_registry.entities) == 2
+    assert "Timed out adding entities" in caplog.text
+    # The entity that timed out is no longer added to the platform
+    assert blocking_entity.hass is None
+    assert blocking_entity.platform is None
+
+
 class MockCancellingEntity(MockEntity):
     """Class to mock an entity get cancelled while adding."""
 
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -19,6 +20,7 @@ from homeassistant.core import (
     Event,
     EventStateChangedData,
     EventStateReportedData,
+    HassJob,
     HomeAssistant,
     callback,
 )
@@ -26,10 +28,14 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TIMER_WHEEL_TICK,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    _pattern_day_seconds,
+    _TrackUTCTimeChange,
     async_call_later,
+    async_get_timer_wheel_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -3611,6 +3617,186 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
 
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test trackers due in the same tick fire from one loop callback."""
+    runs = []
+    stats_before = async_get_timer_wheel_stats(hass)
+    with patch.object(hass.loop, "time", return_value=hass.loop.time()):
+        unsubs = [
+            async_track_time_interval(
+                hass,
+                # pylint: disable-next=unnecessary-lambda
+                callback(lambda x: runs.append(x)),
+                timedelta(seconds=seconds),
+                name="wheel_test",
+            )
+            for seconds in (10, 10, 10, 20)
+        ]
+
+    scheduled = getattr(hass.loop, "_scheduled")
+    assert (
+        len(
+            [
+                handle
+                for handle in scheduled
+                if not handle.cancelled() and "wheel_test" in str(handle)
+            ]
+        )
+        == 2
+    )
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"] == stats_before["timers"] + 4
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"] == stats_before["timers"] + 4
+    assert stats["fired"] == stats_before["fired"] + 3
+    assert stats["loop_callbacks"] == stats_before["loop_callbacks"] + 1
+    assert stats["last_latency"] >= 0
+
+    for unsub in unsubs:
+        unsub()
+    assert not any(
+        handle
+        for handle in scheduled
+        if not handle.cancelled() and "wheel_test" in str(handle)
+    )
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"] == stats_before["timers"]
+
+
+async def test_timer_wheel_fires_slot_together(hass: HomeAssistant) -> None:
+    """Test timers due at different times in the same tick fire together."""
+    runs = []
+    stats_before = async_get_timer_wheel_stats(hass)
+    tick_start = (hass.loop.time() // TIMER_WHEEL_TICK + 1) * TIMER_WHEEL_TICK
+    unsubs = []
+    for offset in (0.001, 0.009, 0.017):
+        with patch.object(hass.loop, "time", return_value=tick_start + offset):
+            unsubs.append(
+                async_track_time_interval(
+                    hass,
+                    # pylint: disable-next=unnecessary-lambda
+                    callback(lambda x: runs.append(x)),
+                    timedelta(seconds=10),
+                    name="wheel_slot_test",
+                )
+            )
+
+    def _slot_handles() -> list[asyncio.TimerHandle]:
+        return [
+            handle
+            for handle in getattr(hass.loop, "_scheduled")
+            if not handle.cancelled() and "wheel_slot_test" in str(handle)
+        ]
+
+    [handle] = _slot_handles()
+    assert handle.when() == pytest.approx(tick_start + 10.001)
+    handle._run()
+    handle.cancel()
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["fired"] == stats_before["fired"] + 3
+    assert stats["loop_callbacks"] == stats_before["loop_callbacks"] + 1
+
+    for unsub in unsubs:
+        unsub()
+    assert not _slot_handles()
+
+
+async def test_time_change_rearms_when_wall_clock_behind(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a time pattern tracker rearms when it fires before the pattern matches.
+
+    The timer wheel follows the loop clock, the pattern is matched against
+    the wall clock, which can be behind the loop clock.
+    """
+    specific_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsub = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: specific_runs.append(x)),
+        second=0,
+    )
+
+    def _listener_handles() -> list[asyncio.TimerHandle]:
+        return [
+            handle
+            for handle in getattr(hass.loop, "_scheduled")
+            if not handle.cancelled() and "time change listener" in str(handle)
+        ]
+
+    # The loop clock is 10 seconds ahead of the wall clock
+    loop_time = hass.loop.time() + 10
+    with patch.object(hass.loop, "time", return_value=loop_time):
+        [handle] = _listener_handles()
+        handle._run()
+        handle.cancel()
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 0
+    [handle] = _listener_handles()
+    assert handle.when() > loop_time
+
+    with patch.object(hass.loop, "time", return_value=loop_time):
+        async_fire_time_changed_exact(
+            hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+        )
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+    assert specific_runs[0].replace(microsecond=0) == datetime(
+        now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC
+    )
+
+    unsub()
+
+
+@pytest.mark.parametrize(
+    ("hour", "minute", "second"),
+    [(None, "/5", 0), (2, 30, 0), ("/3", 0, "/20"), (None, None, 30)],
+)
+async def test_time_change_precomputed_schedule(
+    hass: HomeAssistant, hour: Any, minute: Any, second: Any
+) -> None:
+    """Test the precomputed schedule matches find_next_time_expression_time."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    time_match_expression = (
+        dt_util.parse_time_expression(second, 0, 59),
+        dt_util.parse_time_expression(minute, 0, 59),
+        dt_util.parse_time_expression(hour, 0, 23),
+    )
+    assert _pattern_day_seconds(time_match_expression) is not None
+    for local in (False, True):
+        track = _TrackUTCTimeChange(
+            hass, time_match_expression, 0, local, HassJob(lambda _: None), "test"
+        )
+        track._day_seconds = _pattern_day_seconds(time_match_expression)
+        # Two days around the end of daylight saving time
+        utc_now = datetime(2021, 10, 30, 0, 0, 0, 123, tzinfo=dt_util.UTC)
+        while utc_now < datetime(2021, 11, 1, tzinfo=dt_util.UTC):
+            localized_now = dt_util.as_local(utc_now) if local else utc_now
+            assert track._calculate_next(
+                utc_now
+            ) == dt_util.find_next_time_expression_time(
+                localized_now, *time_match_expression
+            ).replace(microsecond=0)
+            utc_now += timedelta(minutes=7, seconds=13)
+
+
 async def test_track_sunrise(hass: HomeAssistant) -> None:
     """Test track the sunrise."""
     latitude = 32.87336
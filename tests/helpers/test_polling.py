@@ -0,0 +1,95 @@
+"""Tests for the polling scheduler helper."""
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.polling import (
+    POLL_CONCURRENCY_BUDGET,
+    async_get_polling_scheduler,
+)
+
+from tests.common import MockConfigEntry
+
+
+async def test_delay(hass: HomeAssistant) -> None:
+    """Test first polls are spread over their interval."""
+    scheduler = async_get_polling_scheduler(hass)
+    delays = {scheduler.async_delay(f"entry{idx} hue", 30) for idx in range(20)}
+    assert len(delays) == 20
+    assert all(15 < delay <= 30 for delay in delays)
+    # The delays are the same on every startup
+    assert scheduler.async_delay("entry0 hue", 30) in delays
+
+
+async def test_budget(hass: HomeAssistant) -> None:
+    """Test the polls of an integration share a budget."""
+    scheduler = async_get_polling_scheduler(hass)
+    budget = scheduler.async_budget("hue")
+    assert scheduler.async_budget("hue") is budget
+    assert scheduler.async_budget("zha") is not budget
+
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def poll() -> None:
+        nonlocal running, max_running
+        async with budget:
+            running += 1
+            max_running = max(max_running, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [hass.async_create_task(poll()) for _ in range(POLL_CONCURRENCY_BUDGET * 2)]
+    await asyncio.sleep(0)
+    assert running == POLL_CONCURRENCY_BUDGET
+    release.set()
+    await asyncio.gather(*tasks)
+    assert max_running == POLL_CONCURRENCY_BUDGET
+
+
+async def test_stats(hass: HomeAssistant) -> None:
+    """Test poll statistics."""
+    scheduler = async_get_polling_scheduler(hass)
+
+    class Owner:
+        """Owner of poll statistics."""
+
+    fast = Owner()
+    slow = Owner()
+    entry = MockConfigEntry(domain="hue", title="Bridge")
+    fast_stats = scheduler.async_register(fast, "fast", "hue", 10.0, entry)
+    assert scheduler.async_register(fast, "fast", "hue", 10.0, entry) is fast_stats
+    fast_stats.async_record(0.25)
+    slow_stats = scheduler.async_register(slow, "slow", None, 10.0)
+    slow_stats.async_record(12.0)
+    slow_stats.async_record_overrun()
+
+    assert scheduler.async_stats() == [
+        {
+            "name": "slow",
+            "integration": None,
+            "config_entry_id": None,
+            "interval": 10.0,
+            "polls": 1,
+            "overruns": 2,
+            "last_duration": 12.0,
+            "max_duration": 12.0,
+            "average_duration": 12.0,
+        },
+        {
+            "name": "fast (Bridge)",
+            "integration": "hue",
+            "config_entry_id": entry.entry_id,
+            "interval": 10.0,
+            "polls": 1,
+            "overruns": 0,
+            "last_duration": 0.25,
+            "max_duration": 0.25,
+            "average_duration": 0.25,
+        },
+    ]
+
+    scheduler.async_unregister(slow)
+    del fast
+    assert scheduler.async_stats() == []
@@ -18,6 +18,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -53,7 +54,15 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {
+            "last_dump": None,
+            "states": [
+                {"id": state.state.entity_id, **state.as_dict()}
+                for state in stored_states
+            ],
+        }
+    )
 
     # Emulate a fresh load
     hass.data.pop(DATA_RESTORE_STATE)
@@ -112,7 +121,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     """Test that we write periodiclly but not after stop."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save({"last_dump": None, "states": []})
 
     # Emulate a fresh load
     with patch(
@@ -160,7 +169,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     """Test that we cancel the currently running job, save the data, and verify the perdiodic job continues."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save({"last_dump": None, "states": []})
 
     # Emulate a fresh load
     with patch(
@@ -227,7 +236,15 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {
+            "last_dump": None,
+            "states": [
+                {"id": state.state.entity_id, **state.as_dict()}
+                for state in stored_states
+            ],
+        }
+    )
 
     # Emulate a fresh load
     hass.set_state(CoreState.not_running)
@@ -314,7 +331,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -330,8 +347,11 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     state2 = json_round_trip(written_states[2])
     assert state0["state"]["entity_id"] == "input_boolean.b1"
     assert state0["state"]["state"] == "on"
+    # The state of a current entity was last seen at the time of the dump
+    assert state0["last_seen"] is None
     assert state1["state"]["entity_id"] == "input_boolean.b3"
     assert state1["state"]["state"] == "off"
+    assert state1["last_seen"] == now.isoformat()
     assert state2["state"]["entity_id"] == "input_boolean.b5"
     assert state2["state"]["state"] == "off"
 
@@ -348,7 +368,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
     assert len(written_states) == 2
     state0 = json_round_trip(written_states[0])
     state1 = json_round_trip(written_states[1])
@@ -358,6 +378,90 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_and_load_last_seen(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the states of current entities are last seen at the time of the dump."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = async_get(hass)
+    last_seen = dt_util.utcnow() - timedelta(days=1)
+    data.last_states = {
+        "input_boolean.b2": StoredState(
+            State("input_boolean.b2", "off"), None, last_seen
+        ),
+    }
+    await data.async_dump_states()
+    stored_data = hass_storage[STORAGE_KEY]["data"]
+    assert hass_storage[STORAGE_KEY]["version"] == 2
+    assert [item["id"] for item in stored_data["states"]] == [
+        "input_boolean.b1",
+        "input_boolean.b2",
+    ]
+
+    await data.async_load()
+    last_dump = dt_util.parse_datetime(stored_data["last_dump"])
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+    assert data.last_states["input_boolean.b1"].last_seen == last_dump
+    assert data.last_states["input_boolean.b2"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].last_seen == last_seen
+
+
+async def test_dump_reuses_unchanged_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the changed states and extra data are serialized again."""
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data that changes without a write."""
+
+        counter = 0
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return the extra data."""
+            return RestoredExtraData({"counter": self.counter})
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity1 = MockRestoreEntity()
+    entity1.entity_id = "input_boolean.b1"
+    entity2 = MockRestoreEntity()
+    entity2.entity_id = "input_boolean.b2"
+    await platform.async_add_entities([entity1, entity2])
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    item1 = data._dumped_items["input_boolean.b1"]
+    item2 = data._dumped_items["input_boolean.b2"]
+
+    await data.async_dump_states()
+    assert data._dumped_items["input_boolean.b1"] is item1
+    assert data._dumped_items["input_boolean.b2"] is item2
+
+    # Extra data that changed without a state write is serialized again
+    entity1.counter = 1
+    await data.async_dump_states()
+    assert data._dumped_items["input_boolean.b1"] is not item1
+    assert data._dumped_items["input_boolean.b2"] is item2
+    stored_states = hass_storage[STORAGE_KEY]["data"]["states"]
+    assert [item["extra_data"] for item in stored_states] == [
+        {"counter": 1},
+        {"counter": 0},
+    ]
+
+    # A state set without the entity is serialized again as well
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_states()
+    assert data._dumped_items["input_boolean.b2"] is not item2
+    stored_states = hass_storage[STORAGE_KEY]["data"]["states"]
+    assert stored_states[1]["state"]["state"] == "off"
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -531,7 +635,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -546,7 +650,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -0,0 +1,102 @@
+"""Tests for the startup profile helper."""
+
+from datetime import timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers.startup_profile import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    StartupProfile,
+    async_get_startup_profile,
+)
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, async_fire_time_changed, mock_integration
+
+
+async def test_record_and_load(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test recording the startup profile and loading it on the next startup."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp_b",
+            dependencies=["comp_a"],
+            partial_manifest={"after_dependencies": ["comp_c"]},
+        ),
+    )
+    assert await async_setup_component(hass, "comp_b", {})
+
+    startup_profile = async_get_startup_profile(hass)
+    startup_profile.async_record()
+    assert set(startup_profile.current) == {"comp_a", "comp_b"}
+    assert startup_profile.current["comp_a"]["dependencies"] == []
+    assert startup_profile.current["comp_a"]["start"] == 0
+    assert startup_profile.current["comp_b"]["dependencies"] == ["comp_a"]
+    assert startup_profile.current["comp_b"]["import_time"] == 0
+    assert STORAGE_KEY not in hass_storage
+
+    freezer.tick(timedelta(seconds=SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"] == startup_profile.current
+
+    next_startup_profile = StartupProfile(hass)
+    await next_startup_profile.async_load()
+    assert next_startup_profile.previous == startup_profile.current
+
+
+async def test_startup_plan(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test planning the startup from the previous startup profile."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "http": {
+                "start": 0.0,
+                "import_time": 0.2,
+                "setup_time": 0.5,
+                "dependencies": [],
+            },
+            "api": {
+                "start": 0.7,
+                "import_time": 0.01,
+                "setup_time": 0.1,
+                "dependencies": ["http"],
+            },
+            "cloud": {
+                "start": 0.7,
+                "import_time": 1.0,
+                "setup_time": 2.0,
+                "dependencies": ["http"],
+            },
+            "sun": {
+                "start": 0.0,
+                "import_time": 0.1,
+                "setup_time": 0.1,
+                "dependencies": [],
+            },
+        },
+    }
+    startup_profile = StartupProfile(hass)
+    assert startup_profile.critical_path_times == {}
+    await startup_profile.async_load()
+
+    assert startup_profile.critical_path_times == {
+        "http": 3.7,
+        "api": 0.11,
+        "cloud": 3.0,
+        "sun": 0.2,
+    }
+    assert startup_profile.async_slow_imports(
+        ["api", "sun", "cloud", "http", "unknown"]
+    ) == ["cloud", "http", "sun"]
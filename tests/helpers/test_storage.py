@@ -5,7 +5,7 @@ from datetime import timedelta
 import json
 import os
 from typing import Any, NamedTuple
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import py
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -667,6 +667,261 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test saving only the changes to the journal and replaying it on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = [{"id": str(idx), "name": f"Item {idx}"} for idx in range(100)]
+        data = {"items": items, "other": "value"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save(data)
+        assert not os.path.exists(store.journal_path)
+
+        snapshot = await hass.async_add_executor_job(
+            storage.json_util.load_json, store.path
+        )
+        assert snapshot["journal_generation"] == 1
+
+        items[1] = {"id": "1", "name": "Renamed"}
+        del items[2]
+        items.append({"id": "new", "name": "New"})
+        await store.async_save(data)
+        # Saving unchanged data does not write anything
+        await store.async_save(data)
+        data["other"] = "changed"
+        await store.async_save(data)
+
+        def _read_journal() -> list[dict[str, Any]]:
+            with open(store.journal_path, encoding="utf8") as journal_file:
+                return [json.loads(line) for line in journal_file]
+
+        journal = await hass.async_add_executor_job(_read_journal)
+        assert journal == [
+            {
+                "generation": 1,
+                "changes": [
+                    {
+                        "key": "items",
+                        "set": [
+                            {"id": "1", "name": "Renamed"},
+                            {"id": "new", "name": "New"},
+                        ],
+                        "remove": ["2"],
+                    }
+                ],
+            },
+            {"generation": 1, "changes": [{"key": "other", "value": "changed"}]},
+        ]
+        assert (
+            await hass.async_add_executor_job(storage.json_util.load_json, store.path)
+            == snapshot
+        )
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == data
+
+        # Records of an older generation are ignored
+        snapshot["journal_generation"] = 2
+        await hass.async_add_executor_job(
+            storage.json_helper.save_json, store.path, snapshot
+        )
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == {
+            "items": [{"id": str(idx), "name": f"Item {idx}"} for idx in range(100)],
+            "other": "value",
+        }
+
+        await store.async_remove()
+        assert not os.path.exists(store.path)
+        assert not os.path.exists(store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_custom_encoder(tmpdir: py.path.local) -> None:
+    """Test the journal serializes the changes with the encoder of the store."""
+
+    class JSONEncoder(json.JSONEncoder):
+        """Mock JSON encoder."""
+
+        def default(self, o):
+            """Mock JSON encode method."""
+            return "encoded"
+
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = [{"id": str(idx), "value": idx} for idx in range(10)]
+        data = {"items": items}
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, encoder=JSONEncoder, journal=True
+        )
+        await store.async_save(data)
+        items[0] = {"id": "0", "value": object()}
+        await store.async_save(data)
+
+        def _read_journal() -> list[dict[str, Any]]:
+            with open(store.journal_path, encoding="utf8") as journal_file:
+                return [json.loads(line) for line in journal_file]
+
+        assert await hass.async_add_executor_job(_read_journal) == [
+            {
+                "generation": 1,
+                "changes": [
+                    {
+                        "key": "items",
+                        "set": [{"id": "0", "value": "encoded"}],
+                        "remove": [],
+                    }
+                ],
+            }
+        ]
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert (await store2.async_load())["items"][0] == {
+            "id": "0",
+            "value": "encoded",
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_reuses_unchanged_items(tmpdir: py.path.local) -> None:
+    """Test items saved again as the same object are not serialized again."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = [{"id": str(idx), "name": f"Item {idx}"} for idx in range(10)]
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": items})
+
+        with patch.object(
+            store, "_journal_dumps", wraps=store._journal_dumps
+        ) as mock_dumps:
+            await store.async_save({"items": items})
+            mock_dumps.assert_not_called()
+
+            mock_dumps.reset_mock()
+            items[0] = {"id": "0", "name": "Renamed"}
+            await store.async_save({"items": items})
+            assert mock_dumps.call_args_list == [call({"id": "0", "name": "Renamed"})]
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": items}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_fragments(tmpdir: py.path.local) -> None:
+    """Test json fragments with an id are journaled per item."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = [
+            json_fragment(json_bytes({"id": str(idx), "name": f"Item {idx}"}))
+            for idx in range(10)
+        ]
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": items})
+
+        items[1] = json_fragment(json_bytes({"id": "1", "name": "Renamed"}))
+        await store.async_save({"items": items})
+
+        def _read_journal() -> list[dict[str, Any]]:
+            with open(store.journal_path, encoding="utf8") as journal_file:
+                return [json.loads(line) for line in journal_file]
+
+        assert await hass.async_add_executor_job(_read_journal) == [
+            {
+                "generation": 1,
+                "changes": [
+                    {
+                        "key": "items",
+                        "set": [{"id": "1", "name": "Renamed"}],
+                        "remove": [],
+                    }
+                ],
+            }
+        ]
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert (await store2.async_load())["items"][:2] == [
+            {"id": "0", "name": "Item 0"},
+            {"id": "1", "name": "Renamed"},
+        ]
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_incomplete_record(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an incomplete journal record is ignored and a snapshot written."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = [{"id": str(idx), "name": f"Item {idx}"} for idx in range(100)]
+        data = {"items": items}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save(data)
+        items[0] = {"id": "0", "name": "Renamed"}
+        await store.async_save(data)
+
+        def _append_incomplete_record() -> None:
+            with open(store.journal_path, "ab") as journal_file:
+                journal_file.write(b'{"generation": 1, "changes": [{"key": "it')
+
+        await hass.async_add_executor_job(_append_incomplete_record)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == data
+        assert "Ignoring incomplete journal record for storage-test" in caplog.text
+
+        items[1] = {"id": "1", "name": "Renamed"}
+        await store2.async_save(data)
+        assert not os.path.exists(store2.journal_path)
+        snapshot = await hass.async_add_executor_job(
+            storage.json_util.load_json, store2.path
+        )
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"] == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the snapshot once it grows too large."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = [{"id": str(idx), "name": f"Item {idx}"} for idx in range(10)]
+        data = {"items": items}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save(data)
+        snapshot_size = os.path.getsize(store.path)
+
+        for idx in range(20):
+            items[0] = {"id": "0", "name": f"Renamed {idx}"}
+            await store.async_save(data)
+            journal_size = (
+                os.path.getsize(store.journal_path)
+                if os.path.exists(store.journal_path)
+                else 0
+            )
+            assert journal_size <= snapshot_size * storage.JOURNAL_COMPACT_RATIO
+
+        snapshot = await hass.async_add_executor_job(
+            storage.json_util.load_json, store.path
+        )
+        assert snapshot["journal_generation"] > 1
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == data
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1046,6 +1301,80 @@ async def test_store_manager_caching(
         await hass.async_stop(force=True)
 
 
+async def test_store_load_waits_for_preload(tmpdir: py.path.local) -> None:
+    """Test loading a store that is being preloaded does not read it again."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        for key in ("integration1", "integration2"):
+            tmp_storage.join(key).write_binary(
+                json_bytes({"data": {key: key}, "version": 1})
+            )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        integration1 = storage.Store(hass, 1, "integration1")
+        integration2 = storage.Store(hass, 1, "integration2")
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            wraps=storage.json_util.load_json,
+        ) as mock_load_json:
+            preload_task = asyncio.create_task(
+                store_manager.async_preload(["integration1", "integration2"])
+            )
+            await asyncio.sleep(0)
+            assert store_manager.async_get_preload("integration1") is not None
+            assert await integration1.async_load() == {"integration1": "integration1"}
+            assert await integration2.async_load() == {"integration2": "integration2"}
+            await preload_task
+
+        assert mock_load_json.call_count == 2
+        assert store_manager.async_get_preload("integration1") is None
+        await hass.async_stop(force=True)
+
+
+async def test_store_manager_initialize_preloads(tmpdir: py.path.local) -> None:
+    """Test the store manager reads the preload keys when it is initialized."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        tmp_storage.join("integration1").write_binary(
+            json_bytes({"data": {"integration1": "integration1"}, "version": 1})
+        )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        integration1 = storage.Store(hass, 1, "integration1")
+        integration2 = storage.Store(hass, 1, "integration2")
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            wraps=storage.json_util.load_json,
+        ) as mock_load_json:
+            initialize_task = asyncio.create_task(
+                store_manager.async_initialize(["integration1", "integration2"])
+            )
+            await asyncio.sleep(0)
+            assert store_manager.async_get_preload("integration1") is not None
+            assert await integration1.async_load() == {"integration1": "integration1"}
+            assert await integration2.async_load() is None
+            await initialize_task
+
+        assert mock_load_json.call_count == 1
+        assert store_manager.async_get_preload("integration1") is None
+        await hass.async_stop(force=True)
+
+
 async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
     """Test store manager ignores subdirs."""
     loop = asyncio.get_running_loop()
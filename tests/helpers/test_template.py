@@ -5604,6 +5604,207 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_cache(hass: HomeAssistant) -> None:
+    """Test renders are reused until the states they depend on change."""
+    render_cache = template.async_get_render_info_cache(hass)
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    template_str = "{{ states('sensor.one') | int + states('sensor.two') | int }}"
+
+    assert_result_info(
+        render_to_info(hass, template_str), 3, ["sensor.one", "sensor.two"]
+    )
+    assert (render_cache.hits, render_cache.misses) == (0, 1)
+
+    # Another template with the same source reuses the render
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    assert_result_info(info, 3, ["sensor.one", "sensor.two"])
+    assert info.template is tmp
+    assert (render_cache.hits, render_cache.misses) == (1, 1)
+
+    # Same state, but a new state object
+    hass.states.async_set("sensor.two", "2", {"unit": "x"})
+    assert_result_info(
+        render_to_info(hass, template_str), 3, ["sensor.one", "sensor.two"]
+    )
+    assert (render_cache.hits, render_cache.misses) == (1, 2)
+
+    hass.states.async_set("sensor.two", "5", {"unit": "x"})
+    assert_result_info(
+        render_to_info(hass, template_str), 6, ["sensor.one", "sensor.two"]
+    )
+    assert (render_cache.hits, render_cache.misses) == (1, 3)
+
+    # Variables the template uses are part of the key
+    template_str = "{{ states('sensor.one') | int + offset }}"
+    assert render_to_info(hass, template_str, {"offset": 1}).result() == 2
+    assert render_to_info(hass, template_str, {"offset": 2}).result() == 3
+    assert render_to_info(hass, template_str, {"offset": 1}).result() == 2
+    assert (render_cache.hits, render_cache.misses) == (2, 5)
+
+    # Renders depending on time, randomness or domains are not cached
+    for template_str in (
+        "{{ now() }}",
+        "{{ [1, 2] | random }}",
+        "{{ states.sensor | count }}",
+        "{{ area_name('sensor.one') }}",
+        # Depend on the time zone or the entity registry
+        "{{ as_local(as_datetime('2024-01-01 00:00:00+00:00')) }}",
+        "{{ 0 | timestamp_local }}",
+        "{{ states('sensor.one', rounded=True) }}",
+        "{{ states('sensor.one', True) }}",
+        "{{ states.sensor.one.state_with_unit }}",
+    ):
+        render_to_info(hass, template_str)
+        render_to_info(hass, template_str)
+    assert render_cache.hits == 2
+
+
+async def test_render_to_info_cache_copies(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test reused renders are copies and log undefined variables again."""
+    render_cache = template.async_get_render_info_cache(hass)
+    hass.states.async_set("sensor.one", "1")
+    template_str = "{{ [states('sensor.one') | int, 2] }}"
+
+    info = render_to_info(hass, template_str)
+    assert info.result() == [1, 2]
+    info.result().append(3)
+
+    info2 = render_to_info(hass, template_str)
+    assert render_cache.hits == 1
+    assert info2.result() == [1, 2]
+    assert info2.entities == {"sensor.one"}
+    assert info2.entities is not info.entities
+    assert info2.filter("sensor.one") is True
+
+    template_str = "{{ states.sensor.one.attributes.missing }}"
+    render_to_info(hass, template_str)
+    assert "has no attribute 'missing'" in caplog.text
+    caplog.clear()
+
+    render_to_info(hass, template_str)
+    assert render_cache.hits == 2
+    assert "has no attribute 'missing'" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') | float * 2 }}",
+        "{{ is_state('light.one', 'on') and is_state('light.two', 'on') }}",
+        "{{ is_state('light.one', 'on') or is_state('light.two', 'on') }}",
+        "{{ not is_state('light.two', 'on') }}",
+        "{{ states.sensor.power.state | int + 1 }}",
+        "{{ states.sensor.power.attributes.unit }}",
+        "{{ states.sensor.power.attributes['unit'] | upper }}",
+        "{{ state_attr('sensor.power', 'unit') }}",
+        "{{ is_state_attr('sensor.power', 'unit', 'W') }}",
+        "{{ has_value('sensor.missing') }}",
+        "Power: {{ states('sensor.power') }} {{ state_attr('sensor.power', 'unit') }}",
+        "{{ (states('sensor.power') | float / 3) | round(2) }}",
+        "{{ states('sensor.power') | float // 3 - -1 }}",
+        "{{ 1 < states('sensor.power') | int < 100 }}",
+        "{{ 1 < states('sensor.power') | int > 100 }}",
+        "{{ states('light.one') in ['on', 'off'] }}",
+        "{{ states('light.one') not in ('on', 'off') }}",
+        "{{ 'on' if is_state('light.one', 'on') else 'off' }}",
+        "{{ states('sensor.power') ~ ' ' ~ 'W' }}",
+        "{{ float(states('sensor.power')) + int('3') }}",
+        "{{ states('sensor.unknown') | float(0) }}",
+        "{{ bool(states('light.one')) }}",
+        "{{ states('sensor.power') | float | abs }}",
+        "{{ none }}",
+    ],
+)
+async def test_fast_render(hass: HomeAssistant, template_str: str) -> None:
+    """Test the native fast path renders exactly what Jinja renders."""
+    hass.states.async_set("sensor.power", "42", {"unit": "W"})
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    assert tmp._fast_render is not None
+
+    jinja_tmp = template.Template(template_str, hass)
+    jinja_tmp.ensure_valid()
+    jinja_tmp._ensure_compiled()
+    jinja_tmp._fast_render = None
+    jinja_info = jinja_tmp.async_render_to_info()
+
+    assert info.result() == jinja_info.result()
+    assert type(info.result()) is type(jinja_info.result())
+    assert info.entities == jinja_info.entities
+    assert info.domains == jinja_info.domains
+    assert info.all_states == jinja_info.all_states
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{% if is_state('light.one', 'on') %}on{% endif %}",
+        "{{ now() }}",
+        "{{ value }}",
+        "{{ states('sensor.power') | float(0) | multiply(2) }}",
+        "{{ states('sensor.power')[0:1] }}",
+        "{{ states | count }}",
+        "{{ 'on' if is_state('light.one', 'on') }}",
+        "{{ states('sensor.power') | float(default=0) }}",
+    ],
+)
+async def test_fast_render_unsupported(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates outside of the fast path subset are rendered by Jinja."""
+    tmp = template.Template(template_str, hass)
+    tmp.async_render(value=1)
+    assert tmp._fast_render is None
+
+
+async def test_fast_render_fallback(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the fast path raises errors itself and falls back for shadowed globals."""
+    hass.states.async_set("sensor.power", "unknown")
+
+    # Errors are raised without rendering the template again
+    tmp = template.Template("{{ states('sensor.power') | float }}", hass)
+    with (
+        patch(
+            "homeassistant.helpers.template._render_with_context"
+        ) as mock_render_with_context,
+        pytest.raises(
+            TemplateError,
+            match="invalid input 'unknown' when rendering template "
+            "'{{ states\\('sensor.power'\\) \\| float }}'",
+        ),
+    ):
+        tmp.async_render()
+    assert tmp._fast_render is not None
+    mock_render_with_context.assert_not_called()
+
+    # Undefined attributes are logged once, the same way Jinja logs them
+    tmp = template.Template("{{ states.sensor.missing.state }}", hass)
+    with patch(
+        "homeassistant.helpers.template._render_with_context"
+    ) as mock_render_with_context:
+        assert tmp.async_render() == ""
+    assert tmp._fast_render is not None
+    mock_render_with_context.assert_not_called()
+    assert caplog.text.count("'None' has no attribute 'state'") == 1
+
+    # Variables shadowing globals are used instead of the globals
+    tmp = template.Template("{{ states('sensor.power') }}", hass)
+    assert tmp.async_render() == "unknown"
+    assert tmp.async_render({"states": lambda entity_id: entity_id}) == "sensor.power"
+
+    # The limited environment is never rendered natively
+    tmp = template.Template("{{ 1 + 1 }}", hass)
+    assert tmp.async_render(limited=True) == 2
+    assert tmp._fast_render is None
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -19,6 +19,7 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.helpers import update_coordinator
+from homeassistant.helpers.polling import async_get_polling_scheduler
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -370,6 +371,37 @@ async def test_update_interval(
     assert crd.data == 2
 
 
+async def test_update_interval_spread(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the first scheduled refresh is spread over the interval."""
+    update_interval = crd.update_interval.total_seconds()
+    unsub = crd.async_add_listener(Mock())
+    delay = async_get_polling_scheduler(hass).async_delay(crd.name, update_interval)
+    assert delay < update_interval
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=delay + 1))
+    await hass.async_block_till_done()
+    assert crd.data == 1
+
+    # The following refreshes are one interval apart
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=delay + update_interval + 1)
+    )
+    await hass.async_block_till_done()
+    assert crd.data == 2
+
+    [stats] = async_get_polling_scheduler(hass).async_stats()
+    assert stats["name"] == "test"
+    assert stats["integration"] is None
+    assert stats["config_entry_id"] is None
+    assert stats["polls"] == 2
+    assert stats["overruns"] == 0
+
+    unsub()
+
+
 async def test_update_interval_not_present(
     hass: HomeAssistant,
     crd_without_update_interval: update_coordinator.DataUpdateCoordinator[int],
@@ -453,6 +485,110 @@ async def test_coordinator_entity(
     assert len(crd._listeners) == 0
 
 
+async def test_listener_data_selector(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test listeners with a data selector are only called when it changed."""
+    all_updates = []
+    parity_updates = []
+    unsub_all = crd.async_add_listener(lambda: all_updates.append(crd.data))
+    unsub_parity = crd.async_add_listener(
+        lambda: parity_updates.append(crd.data), data_selector=lambda data: data % 2
+    )
+
+    for data in (1, 3, 4, 6, 7):
+        crd.async_set_updated_data(data)
+    assert all_updates == [1, 3, 4, 6, 7]
+    assert parity_updates == [1, 4, 7]
+    assert crd.listener_notifications == 8
+    assert crd.listener_skips == 2
+
+    # A failed update notifies the listener even if the data did not change
+    crd.async_set_update_error(Exception())
+    assert parity_updates == [1, 4, 7, 7]
+    crd.async_set_updated_data(7)
+    assert parity_updates == [1, 4, 7, 7, 7]
+    assert all_updates == [1, 3, 4, 6, 7, 7, 7]
+
+    unsub_parity()
+    assert crd._listener_selections == {}
+    unsub_all()
+
+
+async def test_listener_data_selector_data_changed_in_place(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test a listener with a data selector is called for data changed in place."""
+    data = {"device": {"state": "on"}, "other": {"state": "on"}}
+    updates = []
+    unsub = crd.async_add_listener(
+        lambda: updates.append(crd.data["device"]["state"]),
+        data_selector=lambda data: data["device"],
+    )
+
+    crd.async_set_updated_data(data)
+    data["other"]["state"] = "off"
+    crd.async_set_updated_data(data)
+    data["device"]["state"] = "off"
+    crd.async_set_updated_data(data)
+    assert updates == ["on", "off"]
+    assert crd.listener_skips == 1
+
+    unsub()
+
+
+def _parity(data: int) -> int:
+    """Select the parity of the data."""
+    return data % 2
+
+
+class ParityEntity(update_coordinator.CoordinatorEntity):
+    """Entity that only depends on the parity of the data."""
+
+    def _coordinator_data_selector(self, data: int) -> int:
+        """Select the parity of the data."""
+        return data % 2
+
+
+class ParityLambdaEntity(update_coordinator.CoordinatorEntity):
+    """Entity that selects the parity of the data with a lambda."""
+
+    _coordinator_data_selector = lambda self, data: data % 2  # noqa: E731
+
+
+class ParityFunctionEntity(update_coordinator.CoordinatorEntity):
+    """Entity that selects the parity of the data with a plain function."""
+
+    _coordinator_data_selector = staticmethod(_parity)
+
+
+@pytest.mark.parametrize(
+    "entity_class", [ParityEntity, ParityLambdaEntity, ParityFunctionEntity]
+)
+async def test_coordinator_entity_data_selector(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+    entity_class: type[update_coordinator.CoordinatorEntity],
+) -> None:
+    """Test a coordinator entity with a data selector skips unchanged data."""
+    entity = entity_class(crd)
+    with (
+        patch.object(entity, "async_write_ha_state") as mock_write,
+        patch(
+            "homeassistant.helpers.entity.Entity.async_on_remove"
+        ) as mock_async_on_remove,
+    ):
+        await entity.async_added_to_hass()
+        for data in (1, 3, 5, 6):
+            crd.async_set_updated_data(data)
+
+    assert len(mock_write.mock_calls) == 2
+    assert crd.listener_skips == 2
+
+    # Call remove callback to cleanup debouncer and avoid lingering timer
+    mock_async_on_remove.call_args[0][0]()
+    assert crd._listener_selections == {}
+
+
 async def test_async_set_updated_data(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
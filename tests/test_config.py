@@ -861,6 +861,7 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
             "internal_url": "http://example.local",
             "media_dirs": {"mymedia": "/usr"},
             "debug": True,
+            "memory_lean": True,
             "currency": "EUR",
             "country": "SE",
             "language": "sv",
@@ -882,11 +883,16 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
     assert hass.config.media_dirs == {"mymedia": "/usr"}
     assert hass.config.config_source is ConfigSource.YAML
     assert hass.config.debug is True
+    assert hass.states.memory_lean is True
     assert hass.config.currency == "EUR"
     assert hass.config.country == "SE"
     assert hass.config.language == "sv"
     assert hass.config.radius == 150
 
+    # The memory lean mode is disabled again when the option is removed
+    await config_util.async_process_ha_core_config(hass, {})
+    assert hass.states.memory_lean is False
+
 
 @pytest.mark.parametrize(
     ("minor_version", "users", "user_data", "default_language"),
@@ -69,6 +69,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from .common import (
     async_capture_events,
+    async_fire_time_changed,
     async_mock_service,
     help_test_all,
     import_and_test_deprecated_constant_enum,
@@ -1169,6 +1170,101 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_batched_listener(hass: HomeAssistant) -> None:
+    """Test batched listeners receive all events fired in one iteration."""
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    unsub = hass.bus.async_listen_batched("test", listener)
+
+    for idx in range(5):
+        hass.bus.async_fire("test", {"idx": idx})
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert [event.data["idx"] for event in batches[0]] == [0, 1, 2, 3, 4]
+
+    hass.bus.async_fire("test", {"idx": 5})
+    await hass.async_block_till_done()
+
+    assert len(batches) == 2
+    assert [event.data["idx"] for event in batches[1]] == [5]
+
+    unsub()
+    hass.bus.async_fire("test", {"idx": 6})
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_batched_listener_filter(hass: HomeAssistant) -> None:
+    """Test batched listeners only collect events passing the filter."""
+    batches: list[list[ha.Event]] = []
+
+    async def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub = hass.bus.async_listen_batched("test", listener, event_filter=mock_filter)
+
+    hass.bus.async_fire("test", {"filtered": True})
+    await hass.async_block_till_done()
+    assert batches == []
+
+    hass.bus.async_fire("test", {"filtered": False})
+    hass.bus.async_fire("test", {"filtered": True})
+    hass.bus.async_fire("test", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+    unsub()
+
+    with pytest.raises(HomeAssistantError, match="not a callback"):
+        hass.bus.async_listen_batched("test", listener, event_filter=lambda data: True)
+    with pytest.raises(HomeAssistantError, match="Event filter is required"):
+        hass.bus.async_listen_batched(EVENT_STATE_REPORTED, listener)
+
+
+async def test_eventbus_batched_listener_window(hass: HomeAssistant) -> None:
+    """Test batched listeners coalesce events for the configured window."""
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    unsub = hass.bus.async_listen_batched("test", listener, window=1)
+
+    hass.bus.async_fire("test", {"idx": 0})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test", {"idx": 1})
+    await hass.async_block_till_done()
+    assert batches == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert [event.data["idx"] for event in batches[0]] == [0, 1]
+
+    hass.bus.async_fire("test", {"idx": 2})
+    await hass.async_block_till_done()
+    unsub()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1564,6 +1660,55 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_memory_lean_interns_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test memory lean mode shares equal attribute strings across entities."""
+
+    def make_attrs(name: str) -> dict[str, Any]:
+        # Build equal but distinct strings like a decoded payload would
+        return {
+            "".join(("friendly_", "name")): name,
+            "".join(("unit_of_", "measurement")): "".join(("k", "W")),
+            "".join(("options", "")): ["".join(("a", "b"))],
+            "".join(("value", "")): 1,
+        }
+
+    assert not hass.states.memory_lean
+    hass.states.async_set("sensor.one", "1", make_attrs("One"))
+    hass.states.async_set("sensor.two", "2", make_attrs("Two"))
+    one = hass.states.get("sensor.one").attributes
+    two = hass.states.get("sensor.two").attributes
+    assert one["unit_of_measurement"] is not two["unit_of_measurement"]
+
+    hass.states.async_set_memory_lean(True)
+    assert hass.states.memory_lean
+
+    hass.states.async_set("sensor.three", "3", make_attrs("Three"))
+    hass.states.async_set("sensor.four", "4", make_attrs("Four"))
+    hass.states.async_set("sensor.five", "5")
+    three = hass.states.get("sensor.three").attributes
+    four = hass.states.get("sensor.four").attributes
+    assert isinstance(three, ReadOnlyDict)
+    assert three == {
+        "friendly_name": "Three",
+        "unit_of_measurement": "kW",
+        "options": ["ab"],
+        "value": 1,
+    }
+    assert three["unit_of_measurement"] is four["unit_of_measurement"]
+    assert next(iter(three)) is next(iter(four))
+    # Only top level strings are interned
+    assert three["options"] is not four["options"]
+    assert hass.states.get("sensor.five").attributes == {}
+
+    hass.states.async_set_memory_lean(False)
+    assert not hass.states.memory_lean
+    hass.states.async_set("sensor.six", "6", make_attrs("Six"))
+    six = hass.states.get("sensor.six").attributes
+    assert six["unit_of_measurement"] is not three["unit_of_measurement"]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
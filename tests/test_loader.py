@@ -9,6 +9,7 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
@@ -19,7 +20,12 @@ from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -1987,3 +1993,80 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    tmp_path: pathlib.Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test manifests are indexed and only read again when they change."""
+    integration_dir = tmp_path / "test_index"
+    integration_dir.mkdir()
+    (integration_dir / "__init__.py").write_text("")
+    manifest_path = integration_dir / "manifest.json"
+    manifest_path.write_text(
+        json_dumps({"domain": "test_index", "name": "Test", "requirements": ["a==1"]})
+    )
+
+    manifest_index = loader._ManifestIndex(hass)
+    await manifest_index.async_load()
+    expected = (
+        {"domain": "test_index", "name": "Test", "requirements": ["a==1"]},
+        {"__init__.py", "manifest.json"},
+    )
+    assert (
+        await hass.async_add_executor_job(manifest_index.read_manifest, manifest_path)
+        == expected
+    )
+    freezer.tick(loader.MANIFEST_INDEX_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    index_data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert index_data[str(manifest_path)]["manifest"] == expected[0]
+
+    # Unchanged manifests are read from the index
+    manifest_index = loader._ManifestIndex(hass)
+    await manifest_index.async_load()
+    with patch("homeassistant.loader._read_manifest") as mock_read_manifest:
+        assert (
+            await hass.async_add_executor_job(
+                manifest_index.read_manifest, manifest_path
+            )
+            == expected
+        )
+    assert not mock_read_manifest.called
+
+    # The indexed manifest is not changed through the returned copies
+    manifest, _ = await hass.async_add_executor_job(
+        manifest_index.read_manifest, manifest_path
+    )
+    manifest["requirements"].append("b==2")
+    assert (
+        await hass.async_add_executor_job(manifest_index.read_manifest, manifest_path)
+        == expected
+    )
+
+    # Changed manifests and integration directories are read again
+    manifest_path.write_text(json_dumps({"domain": "test_index", "name": "Changed"}))
+    (integration_dir / "light.py").write_text("")
+    assert await hass.async_add_executor_job(
+        manifest_index.read_manifest, manifest_path
+    ) == (
+        {"domain": "test_index", "name": "Changed"},
+        {"__init__.py", "light.py", "manifest.json"},
+    )
+    assert (
+        await hass.async_add_executor_job(
+            manifest_index.read_manifest, integration_dir / "missing.json"
+        )
+        is None
+    )
+
+
+async def test_manifest_index_skips_built_in(hass: HomeAssistant) -> None:
+    """Test the manifests of built-in integrations are not indexed."""
+    with patch.object(loader._ManifestIndex, "read_manifest") as mock_read_manifest:
+        await loader.async_get_integration(hass, "hue")
+    assert not mock_read_manifest.called